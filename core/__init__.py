@@ -1,5 +1,25 @@
 all_modules = [
     "core.calculator",
     "core.text_manager",
-    "core.timer"
+    "core.timer",
+    "core.corpus_pipeline",
+    "core.ngram_index",
+    "core.keystroke_analytics",
+    "core.text_search",
+    "core.text_layout",
+    "core.grading",
+    "core.leaderboard",
+    "core.result_exporter",
+    "core.text_sources",
+    "core.prefetcher",
+    "core.resource_monitor",
+    "core.results",
+    "core.batch_grader",
+    "core.typist_simulator",
+    "core.shared_corpus",
+    "core.passage_sampler",
+    "core.text_compare",
+    "core.word_stats",
+    "core.session_history",
+    "core.metrics"
 ]
\ No newline at end of file
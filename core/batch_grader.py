@@ -0,0 +1,282 @@
+"""
+Parallel Batch Grading
+======================
+
+Offline scoring of archived typing attempts:
+- Streams a JSONL file of {"target", "typed", "duration"} attempts
+- Scores chunks of attempts across a process pool
+- Writes JSONL results in input order with bounded memory
+- Checkpoints after every chunk so interrupted jobs can resume
+"""
+
+import json
+import math
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Handle imports for both standalone and module execution
+try:
+    from .calculator import Calculator
+    from .grading import GradingScheme
+    from .metrics import KEYSTROKES_SCORED, SCORING_SECONDS
+except ImportError:
+    import sys
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, current_dir)
+    from calculator import Calculator
+    from grading import GradingScheme
+    from metrics import KEYSTROKES_SCORED, SCORING_SECONDS
+
+# Attempts sent to a worker per call
+DEFAULT_CHUNK_SIZE = 5000
+
+# Chunks submitted ahead of the writer, per worker
+DEFAULT_CHUNKS_PER_WORKER = 2
+
+CHECKPOINT_SUFFIX = ".checkpoint"
+
+# (first line number, raw lines, input offset after the chunk)
+Chunk = Tuple[int, List[bytes], int]
+
+
+def score_attempt(attempt: Dict) -> Dict:
+    """
+    Score one attempt
+
+    Args:
+        attempt: Dict with "target", "typed" and "duration" (seconds); an
+                 optional "id" is copied to the result
+
+    Returns:
+        dict: Accuracy details, net WPM and grades
+
+    Raises:
+        KeyError: If a required field is missing
+        TypeError: If the attempt or one of its fields has the wrong type
+        ValueError: If the duration is not a finite number
+    """
+    if not isinstance(attempt, dict):
+        raise TypeError(f"Expected an attempt object, got {type(attempt).__name__}")
+    target_text = attempt["target"]
+    user_input = attempt["typed"]
+    for field, value in (("target", target_text), ("typed", user_input)):
+        if not isinstance(value, str):
+            raise TypeError(f"Field {field!r} must be a string, got {type(value).__name__}")
+    duration = float(attempt["duration"])
+    if not math.isfinite(duration):
+        raise ValueError(f"Invalid duration: {duration}")
+
+    with SCORING_SECONDS.time():
+        accuracy = Calculator.calculate_detailed_accuracy(user_input, target_text)
+        net_wpm = Calculator.calculate_words_per_minute_net(
+            accuracy.correct_chars, accuracy.errors, duration / 60
+        )
+        grade = Calculator.calculate_typing_speed_grade(net_wpm, accuracy.accuracy)
+    KEYSTROKES_SCORED.inc(len(user_input))
+
+    result = {"id": attempt["id"]} if "id" in attempt else {}
+    result.update(accuracy.to_dict())
+    result["net_wpm"] = net_wpm
+    result.update(grade.to_dict())
+    return result
+
+
+def _init_worker(grading: Optional[Dict]) -> None:
+    """Worker initializer: install the job's grading scheme"""
+    if grading is not None:
+        Calculator.set_grading_scheme(GradingScheme(grading))
+
+
+def _score_chunk(first_line: int, lines: List[bytes]) -> bytes:
+    """
+    Worker entry point: score a chunk of raw JSONL lines
+
+    Args:
+        first_line: Line number of the first line in the input
+        lines: Raw input lines
+
+    Returns:
+        bytes: Encoded JSONL results, one line per non-blank input line
+    """
+    output = []
+    for line_number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        try:
+            result = score_attempt(json.loads(line))
+        except Exception as e:
+            # One bad record must not abort the job
+            result = {"line": line_number, "error": f"{type(e).__name__}: {e}"}
+        output.append(json.dumps(result, ensure_ascii=False))
+        output.append("\n")
+    return "".join(output).encode("utf-8")
+
+
+class BatchGrader:
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 grading: Optional[Dict] = None):
+        """
+        Initialize the batch grader
+
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count)
+            chunk_size: Attempts per worker call
+            grading: Grading scales (see DEFAULT_GRADING); defaults to the built-in scheme
+
+        Raises:
+            ValueError: If the chunk size or the grading scales are invalid
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"Invalid chunk size: {chunk_size}")
+        if grading is not None:
+            # Checked here: a failure in the worker initializer only shows as a broken pool
+            try:
+                GradingScheme(grading)
+            except Exception as e:
+                raise ValueError(f"Invalid grading scales: {e}") from e
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.grading = grading
+        self.summary = {}
+
+    def grade_file(self, input_path: str, output_path: str, resume: bool = True) -> int:
+        """
+        Score every attempt of a JSONL file
+
+        Args:
+            input_path: JSONL file of attempts
+            output_path: JSONL file receiving one result per attempt, in input order
+            resume: Continue from the checkpoint of an interrupted run if one exists
+
+        Returns:
+            int: Number of input lines processed by this run
+        """
+        checkpoint_path = output_path + CHECKPOINT_SUFFIX
+        checkpoint = self._load_checkpoint(checkpoint_path, input_path) if resume else None
+        if checkpoint and not os.path.exists(output_path):
+            checkpoint = None
+        input_offset = checkpoint["input_offset"] if checkpoint else 0
+        output_offset = checkpoint["output_offset"] if checkpoint else 0
+        line_number = checkpoint["lines"] if checkpoint else 0
+        start_lines = line_number
+
+        mode = "r+b" if checkpoint else "wb"
+        with open(input_path, "rb") as source, open(output_path, mode) as output:
+            # Drop results written after the last checkpoint
+            output.seek(output_offset)
+            output.truncate()
+            source.seek(input_offset)
+
+            for result, (first_line, lines, end_offset) in self._run(self._iter_chunks(source, line_number)):
+                output.write(result)
+                output.flush()
+                line_number = first_line + len(lines) - 1
+                self._save_checkpoint(checkpoint_path, {
+                    "input": os.path.abspath(input_path),
+                    "input_offset": end_offset,
+                    "output_offset": output.tell(),
+                    "lines": line_number
+                })
+
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        self.summary = {
+            "lines": line_number,
+            "resumed_at": start_lines,
+            "workers": self.max_workers,
+            "chunk_size": self.chunk_size
+        }
+        return line_number - start_lines
+
+    def _iter_chunks(self, source, line_number: int) -> Iterator[Chunk]:
+        """Read the input in chunks of raw lines, tracking byte offsets"""
+        offset = source.tell()
+        lines = []
+        first_line = line_number + 1
+        for line in source:
+            lines.append(line)
+            offset += len(line)
+            if len(lines) >= self.chunk_size:
+                yield first_line, lines, offset
+                first_line += len(lines)
+                lines = []
+        if lines:
+            yield first_line, lines, offset
+
+    def _run(self, chunks: Iterator[Chunk]) -> Iterator[Tuple[bytes, Chunk]]:
+        """Score chunks in the pool, keeping a bounded number in flight and yielding in order"""
+        max_pending = self.max_workers * DEFAULT_CHUNKS_PER_WORKER
+        pending = deque()
+
+        with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                 initargs=(self.grading,)) as executor:
+            for chunk in chunks:
+                first_line, lines, _ = chunk
+                pending.append((executor.submit(_score_chunk, first_line, lines), chunk))
+                if len(pending) >= max_pending:
+                    future, done_chunk = pending.popleft()
+                    yield future.result(), done_chunk
+
+            while pending:
+                future, done_chunk = pending.popleft()
+                yield future.result(), done_chunk
+
+    @staticmethod
+    def _load_checkpoint(checkpoint_path: str, input_path: str) -> Optional[Dict]:
+        """Load a checkpoint if it belongs to the same input file"""
+        if not os.path.exists(checkpoint_path):
+            return None
+        try:
+            with open(checkpoint_path, "r", encoding="utf-8") as file:
+                checkpoint = json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable checkpoint {checkpoint_path}: {e}")
+            return None
+
+        if checkpoint.get("input") != os.path.abspath(input_path):
+            print(f"Ignoring checkpoint for a different input: {checkpoint.get('input')}")
+            return None
+        return checkpoint
+
+    @staticmethod
+    def _save_checkpoint(checkpoint_path: str, checkpoint: Dict) -> None:
+        """Write the checkpoint atomically"""
+        temp_path = checkpoint_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(checkpoint, file)
+        os.replace(temp_path, checkpoint_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Score archived typing attempts in parallel")
+    parser.add_argument("input", help="JSONL file of {\"target\", \"typed\", \"duration\"} attempts")
+    parser.add_argument("output", help="JSONL file for the results")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="attempts per worker call")
+    parser.add_argument("--grading", help="JSON file with grading scales")
+    parser.add_argument("--restart", action="store_true", help="ignore an existing checkpoint")
+    args = parser.parse_args(argv)
+
+    try:
+        grading = None
+        if args.grading:
+            with open(args.grading, "r", encoding="utf-8") as file:
+                grading = json.load(file)
+        grader = BatchGrader(max_workers=args.workers, chunk_size=args.chunk_size, grading=grading)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 2
+
+    processed = grader.grade_file(args.input, args.output, resume=not args.restart)
+    print(f"Processed {processed} lines")
+    print(f"Summary: {grader.summary}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -9,19 +9,40 @@ This module provides a Calculator class that supports basic arithmetic operation
 - Performance statistics
 """
 
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Iterable
 
 # Handle imports for both standalone and module execution
 try:
     from .contracts.i_calculator import iCalculator
+    from .grading import GradingScheme
+    from .results import AccuracyResult, GradeResult, ProgressMetrics, ResultTable
+    from .text_compare import count_matches, normalize_target, normalize_text
 except ImportError:
     import sys
     import os
     current_dir = os.path.dirname(os.path.abspath(__file__))
     sys.path.insert(0, current_dir)
     from contracts.i_calculator import iCalculator
+    from grading import GradingScheme
+    from results import AccuracyResult, GradeResult, ProgressMetrics, ResultTable
+    from text_compare import count_matches, normalize_target, normalize_text
 
 class Calculator(iCalculator):
+    # Grading tables used by calculate_typing_speed_grade (see set_grading_scheme)
+    grading_scheme = GradingScheme.default()
+    # Grade records are immutable, so one instance per label combination is shared
+    _grade_records: Dict[Tuple[str, str, str], GradeResult] = {}
+
+    @staticmethod
+    def set_grading_scheme(scheme: GradingScheme) -> None:
+        """
+        Set the grading scheme used for typing speed grades
+        
+        Args:
+            scheme: Compiled grading scheme (e.g. from the app config)
+        """
+        Calculator.grading_scheme = scheme
+        Calculator._grade_records = {}
     
     @staticmethod
     def calculate_wpm(correct_chars: int, total_chars: int, time_minutes: float) -> Tuple[float, float, float]:
@@ -70,30 +91,32 @@ class Calculator(iCalculator):
         return round(wpm, 1)
 
     @staticmethod
-    def calculate_detailed_accuracy(user_input: str, target_text: str) -> Dict[str, float]:
+    def calculate_detailed_accuracy(user_input: str, target_text: str,
+                                    input_normalized: bool = False) -> AccuracyResult:
         """
         Calculate detailed accuracy metrics
         
+        Both texts are compared in normalized form (NFC, typographic quotes and
+        dashes folded), so equivalent spellings of a character count as correct.
+        
         Args:
             user_input: What the user typed
             target_text: What they should have typed
+            input_normalized: user_input is already normalized (e.g. by an IncrementalNormalizer)
             
         Returns:
-            dict: Detailed accuracy metrics
+            AccuracyResult: Detailed accuracy metrics (supports to_dict() and dict-style access)
         """
         if not target_text:
-            return {"accuracy": 0.0, "errors": 0, "correct_chars": 0}
+            return AccuracyResult(0.0, 0, 0, 0, 0.0, 0.0)
+        
+        target_text = normalize_target(target_text)
+        if not input_normalized:
+            user_input = normalize_text(user_input)
             
         min_length = min(len(user_input), len(target_text))
-        correct_chars = 0
-        errors = 0
-        
-        # Character-by-character comparison
-        for i in range(min_length):
-            if user_input[i] == target_text[i]:
-                correct_chars += 1
-            else:
-                errors += 1
+        correct_chars = count_matches(user_input, target_text)
+        errors = min_length - correct_chars
                 
         # Account for missing characters (if user input is shorter)
         if len(user_input) < len(target_text):
@@ -107,14 +130,30 @@ class Calculator(iCalculator):
         accuracy = (correct_chars / total_chars) * 100 if total_chars > 0 else 0.0
         error_rate = (errors / total_chars) * 100 if total_chars > 0 else 0.0
         
-        return {
-            "accuracy": round(accuracy, 2),
-            "correct_chars": correct_chars,
-            "total_chars": total_chars,
-            "errors": errors,
-            "error_rate": round(error_rate, 2),
-            "completion": round((min_length / total_chars) * 100, 2) if total_chars > 0 else 0.0
-        }
+        return AccuracyResult(
+            accuracy=round(accuracy, 2),
+            correct_chars=correct_chars,
+            total_chars=total_chars,
+            errors=errors,
+            error_rate=round(error_rate, 2),
+            completion=round((min_length / total_chars) * 100, 2) if total_chars > 0 else 0.0
+        )
+
+    @staticmethod
+    def calculate_detailed_accuracy_batch(attempts: Iterable[Tuple[str, str]]) -> ResultTable:
+        """
+        Calculate detailed accuracy metrics for many attempts
+        
+        Args:
+            attempts: (user_input, target_text) pairs
+            
+        Returns:
+            ResultTable: Array-backed table of AccuracyResult rows
+        """
+        table = ResultTable(AccuracyResult)
+        for user_input, target_text in attempts:
+            table.append(Calculator.calculate_detailed_accuracy(user_input, target_text))
+        return table
 
     @staticmethod
     def calculate_words_per_minute_net(correct_chars: int, errors: int, time_minutes: float) -> float:
@@ -144,7 +183,7 @@ class Calculator(iCalculator):
         return round(net_wpm, 2)
 
     @staticmethod
-    def calculate_typing_speed_grade(wpm: float, accuracy: float) -> Dict[str, str]:
+    def calculate_typing_speed_grade(wpm: float, accuracy: float) -> GradeResult:
         """
         Calculate typing speed grade and performance level
         
@@ -153,61 +192,42 @@ class Calculator(iCalculator):
             accuracy: Accuracy percentage
             
         Returns:
-            dict: Grade and performance information
+            GradeResult: Grade and performance information
         """
-        # Determine speed grade
-        if wpm >= 80:
-            speed_grade = "Expert"
-        elif wpm >= 60:
-            speed_grade = "Advanced"
-        elif wpm >= 40:
-            speed_grade = "Intermediate"
-        elif wpm >= 25:
-            speed_grade = "Beginner"
-        else:
-            speed_grade = "Novice"
+        grades = Calculator.grading_scheme.grade(wpm, accuracy)
+        record = Calculator._grade_records.get(grades)
+        if record is None:
+            record = Calculator._grade_records[grades] = GradeResult(*grades)
             
-        # Determine accuracy grade
-        if accuracy >= 98:
-            accuracy_grade = "Excellent"
-        elif accuracy >= 95:
-            accuracy_grade = "Very Good"
-        elif accuracy >= 90:
-            accuracy_grade = "Good"
-        elif accuracy >= 80:
-            accuracy_grade = "Fair"
-        else:
-            accuracy_grade = "Poor"
-            
-        # Overall performance
-        if wpm >= 60 and accuracy >= 95:
-            overall = "Professional"
-        elif wpm >= 40 and accuracy >= 90:
-            overall = "Proficient"
-        elif wpm >= 25 and accuracy >= 80:
-            overall = "Developing"
-        else:
-            overall = "Learning"
+        return record
+
+    @staticmethod
+    def calculate_typing_speed_grades(wpms: Iterable[float], accuracies: Iterable[float]) -> List[Tuple[str, str, str]]:
+        """
+        Calculate typing speed grades for many sessions at once
+        
+        Args:
+            wpms: Words per minute of each session
+            accuracies: Accuracy percentage of each session
             
-        return {
-            "speed_grade": speed_grade,
-            "accuracy_grade": accuracy_grade,
-            "overall_performance": overall
-        }
+        Returns:
+            list: (speed_grade, accuracy_grade, overall_performance) per session
+        """
+        return Calculator.grading_scheme.grade_batch(wpms, accuracies)
 
     @staticmethod
-    def calculate_progress_metrics(session_data: List[Dict]) -> Dict[str, float]:
+    def calculate_progress_metrics(session_data: List[Dict]) -> ProgressMetrics:
         """
         Calculate progress metrics from multiple typing sessions
         
         Args:
-            session_data: List of session dictionaries with wpm, accuracy, etc.
+            session_data: List of session dictionaries (or records) with wpm, accuracy, etc.
             
         Returns:
-            dict: Progress metrics and trends
+            ProgressMetrics: Progress metrics and trends (all zero if there are no sessions)
         """
         if not session_data:
-            return {}
+            return ProgressMetrics(*(0,) * len(ProgressMetrics._fields))
             
         wpm_values = [session.get('wpm', 0) for session in session_data]
         accuracy_values = [session.get('accuracy', 0) for session in session_data]
@@ -236,17 +256,17 @@ class Calculator(iCalculator):
         best_accuracy = max(accuracy_values)
         worst_accuracy = min(accuracy_values)
         
-        return {
-            "total_sessions": len(session_data),
-            "average_wpm": round(avg_wpm, 2),
-            "average_accuracy": round(avg_accuracy, 2),
-            "best_wpm": round(best_wpm, 2),
-            "worst_wpm": round(worst_wpm, 2),
-            "best_accuracy": round(best_accuracy, 2),
-            "worst_accuracy": round(worst_accuracy, 2),
-            "wpm_improvement_percent": round(wpm_improvement, 2),
-            "accuracy_improvement_percent": round(accuracy_improvement, 2)
-        }
+        return ProgressMetrics(
+            total_sessions=len(session_data),
+            average_wpm=round(avg_wpm, 2),
+            average_accuracy=round(avg_accuracy, 2),
+            best_wpm=round(best_wpm, 2),
+            worst_wpm=round(worst_wpm, 2),
+            best_accuracy=round(best_accuracy, 2),
+            worst_accuracy=round(worst_accuracy, 2),
+            wpm_improvement_percent=round(wpm_improvement, 2),
+            accuracy_improvement_percent=round(accuracy_improvement, 2)
+        )
 
     @staticmethod
     def estimate_completion_time(current_position: int, total_chars: int, current_wpm: float) -> float:
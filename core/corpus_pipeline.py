@@ -0,0 +1,266 @@
+"""
+Parallel Corpus Preprocessing
+=============================
+
+Preprocessing pipeline for importing large corpora:
+- Shards input files into byte ranges that end on sentence boundaries
+- Segments, normalizes and analyzes every shard in a process pool
+- Merges worker results in input order with global deduplication
+- Keeps a bounded number of shards in flight and only 16-byte digests of
+  seen segments; the digest set still grows with the number of unique
+  segments (about 100 bytes each), not with their text
+
+Sentences are never split across shards, but segment packing restarts at
+each shard, so segments around shard edges can differ from a serial run
+(every sentence still appears once, in order).
+"""
+
+import hashlib
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Handle imports for both standalone and module execution
+try:
+    from .text_manager import (MAX_ABBREVIATION_LENGTH, TextManager, ends_with_abbreviation, iter_text_segments,
+                               text_statistics)
+except ImportError:
+    import sys
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, current_dir)
+    from text_manager import (MAX_ABBREVIATION_LENGTH, TextManager, ends_with_abbreviation, iter_text_segments,
+                              text_statistics)
+
+# Default shard size in bytes (a shard is the unit of work for one worker call)
+DEFAULT_SHARD_SIZE = 16 * 1024 * 1024
+
+# Shards submitted ahead of the merge, per worker
+DEFAULT_SHARDS_PER_WORKER = 2
+
+# Bytes of segment digest kept for global deduplication
+DIGEST_SIZE = 16
+
+# Sentence boundary in raw bytes: punctuation followed by whitespace.
+# ASCII bytes never occur inside multi-byte UTF-8 sequences, so a
+# boundary found here is always a valid place to cut the file.
+_SENTENCE_BOUNDARY = re.compile(rb'[.!?]\s+')
+
+Shard = Tuple[str, int, int]
+ProcessedSegment = Tuple[str, Dict]
+
+
+def _is_abbreviation(block: bytes, end: int) -> bool:
+    """Check whether the punctuation at block[end - 1] ends an abbreviation (as TextManager does)"""
+    # Enough text for the longest abbreviation and the whitespace before it
+    window = block[max(0, end - MAX_ABBREVIATION_LENGTH - 2):end].decode('utf-8', errors='replace')
+    return ends_with_abbreviation(window, 0, len(window))
+
+
+def find_sentence_boundary(file_path: str, offset: int, file_size: int,
+                           probe_size: int = 64 * 1024) -> int:
+    """
+    Find the first sentence start at or after a byte offset
+
+    Abbreviations such as "Mr." or "e.g." do not end a sentence, so a shard
+    never splits a sentence that the segmenter keeps whole.
+
+    Args:
+        file_path: Path to the corpus file
+        offset: Byte offset to start probing from
+        file_size: Total size of the file in bytes
+        probe_size: Number of bytes read per probe
+
+    Returns:
+        int: Byte offset of the next sentence start, or file_size if none
+    """
+    if offset <= 0:
+        return 0
+
+    with open(file_path, 'rb') as file:
+        position = offset
+        while position < file_size:
+            # Read a little before the probe so the word ending at a boundary is complete
+            read_start = max(0, position - MAX_ABBREVIATION_LENGTH - 2)
+            file.seek(read_start)
+            block = file.read(position - read_start + probe_size)
+            if not block:
+                break
+
+            for match in _SENTENCE_BOUNDARY.finditer(block, position - read_start):
+                # A match touching the end of the block may continue into the
+                # next one, so only accept boundaries strictly inside the block
+                if match.end() >= len(block):
+                    break
+                if not _is_abbreviation(block, match.start() + 1):
+                    return read_start + match.end()
+
+            if len(block) < position - read_start + probe_size:
+                break
+            # Step back one byte so punctuation at the block edge is re-checked
+            position = read_start + len(block) - 1
+
+    return file_size
+
+
+def _segment_digest(segment: str) -> bytes:
+    """Digest identifying a segment for deduplication"""
+    return hashlib.blake2b(segment.encode('utf-8'), digest_size=DIGEST_SIZE).digest()
+
+
+def _process_shard(shard: Shard) -> List[ProcessedSegment]:
+    """
+    Worker entry point: segment, normalize and analyze one shard
+
+    Args:
+        shard: (file_path, start_offset, end_offset)
+
+    Returns:
+        List[ProcessedSegment]: Unique segments of the shard with statistics
+    """
+    file_path, start, end = shard
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        content = file.read(end - start).decode('utf-8', errors='replace')
+
+    results = []
+    seen = set()
+    for segment in iter_text_segments(content):
+        if segment in seen:
+            continue
+        seen.add(segment)
+        results.append((segment, text_statistics(segment)))
+
+    return results
+
+
+class CorpusPipeline:
+    def __init__(self, max_workers: Optional[int] = None, shard_size: int = DEFAULT_SHARD_SIZE):
+        """
+        Initialize the corpus preprocessing pipeline
+
+        Args:
+            max_workers: Number of worker processes (defaults to CPU count)
+            shard_size: Target shard size in bytes
+        """
+        if shard_size <= 0:
+            raise ValueError(f"Invalid shard size: {shard_size}")
+
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.shard_size = shard_size
+        self.summary = {}
+
+    def plan_shards(self, file_paths: Iterable[str]) -> List[Shard]:
+        """
+        Split input files into byte ranges aligned on sentence boundaries
+
+        Args:
+            file_paths: Paths of the corpus files
+
+        Returns:
+            List[Shard]: (file_path, start_offset, end_offset) tuples
+        """
+        shards = []
+        for file_path in file_paths:
+            file_size = os.path.getsize(file_path)
+            start = 0
+            while start < file_size:
+                end = find_sentence_boundary(file_path, start + self.shard_size, file_size)
+                shards.append((file_path, start, end))
+                start = end
+
+        return shards
+
+    def iter_segments(self, file_paths: Iterable[str]) -> Iterator[ProcessedSegment]:
+        """
+        Process the corpus in parallel and yield unique segments in input order
+
+        Segment packing restarts at every shard (see the module docstring).
+
+        Args:
+            file_paths: Paths of the corpus files
+
+        Yields:
+            ProcessedSegment: (segment, statistics) for each unique segment
+        """
+        shards = self.plan_shards(file_paths)
+        seen = set()
+        total = 0
+        difficulty_counts = {}
+
+        for shard_results in self._run(shards):
+            for segment, stats in shard_results:
+                total += 1
+                digest = _segment_digest(segment)
+                if digest in seen:
+                    continue
+                seen.add(digest)
+
+                difficulty = stats.get("estimated_difficulty", "unknown")
+                difficulty_counts[difficulty] = difficulty_counts.get(difficulty, 0) + 1
+                yield segment, stats
+
+        self.summary = {
+            "shards": len(shards),
+            "segments": total,
+            "unique_segments": len(seen),
+            "duplicates": total - len(seen),
+            "difficulty_counts": difficulty_counts
+        }
+
+    def _run(self, shards: List[Shard]) -> Iterator[List[ProcessedSegment]]:
+        """Process shards in the pool, keeping a bounded number in flight and yielding in order"""
+        max_pending = self.max_workers * DEFAULT_SHARDS_PER_WORKER
+        pending = deque()
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            for shard in shards:
+                pending.append(executor.submit(_process_shard, shard))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+
+    def process(self, file_paths: Iterable[str]) -> List[ProcessedSegment]:
+        """
+        Process the corpus in parallel and collect the merged results
+
+        Args:
+            file_paths: Paths of the corpus files
+
+        Returns:
+            List[ProcessedSegment]: Unique segments with their statistics
+        """
+        return list(self.iter_segments(file_paths))
+
+    def ingest(self, file_paths: Iterable[str], text_manager: TextManager) -> int:
+        """
+        Process the corpus and add the resulting segments to a TextManager
+
+        The statistics computed by the workers are reused for the TextManager's
+        difficulty index instead of being recomputed.
+
+        Args:
+            file_paths: Paths of the corpus files
+            text_manager: TextManager receiving the segments as custom texts
+
+        Returns:
+            int: Number of texts added
+        """
+        return text_manager.add_analyzed_texts(self.iter_segments(file_paths))
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Usage: python corpus_pipeline.py FILE [FILE ...]")
+        sys.exit(1)
+
+    pipeline = CorpusPipeline()
+    manager = TextManager()
+    added = pipeline.ingest(sys.argv[1:], manager)
+    print(f"Added {added} texts")
+    print(f"Summary: {pipeline.summary}")
@@ -0,0 +1,131 @@
+"""
+Compiled Grading Schemes
+========================
+
+Configurable typing grade tables:
+- Speed, accuracy and overall scales defined as data (e.g. in config.json)
+- Compiled once into sorted threshold arrays with interned labels
+- bisect lookup for single results and a batch variant for archives
+"""
+
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Scales are listed from the highest to the lowest grade; the lowest entry is
+# the fallback for any value below the other thresholds.
+DEFAULT_GRADING = {
+    "speed": [
+        [80, "Expert"],
+        [60, "Advanced"],
+        [40, "Intermediate"],
+        [25, "Beginner"],
+        [0, "Novice"]
+    ],
+    "accuracy": [
+        [98, "Excellent"],
+        [95, "Very Good"],
+        [90, "Good"],
+        [80, "Fair"],
+        [0, "Poor"]
+    ],
+    # [min_wpm, min_accuracy, label]: the first rule met by both values wins
+    "overall": [
+        [60, 95, "Professional"],
+        [40, 90, "Proficient"],
+        [25, 80, "Developing"],
+        [0, 0, "Learning"]
+    ]
+}
+
+GradeTuple = Tuple[str, str, str]
+
+
+class _Scale:
+    """One compiled scale: thresholds above the fallback and labels in ascending order"""
+
+    __slots__ = ("thresholds", "labels")
+
+    def __init__(self, entries: Sequence[Tuple[float, str]]):
+        if not entries:
+            raise ValueError("Grading scale must not be empty")
+
+        ordered = sorted(((float(threshold), label) for threshold, label in entries), key=lambda entry: entry[0])
+        self.thresholds = array('d', (threshold for threshold, _ in ordered[1:]))
+        self.labels = tuple(sys.intern(str(label)) for _, label in ordered)
+
+    def lookup(self, value: float) -> str:
+        return self.labels[bisect_right(self.thresholds, value)]
+
+
+class GradingScheme:
+    def __init__(self, grading: Dict = None):
+        """
+        Compile a grading scheme
+
+        Args:
+            grading: Dict with "speed", "accuracy" and "overall" scales
+                     (see DEFAULT_GRADING); missing scales use the defaults
+
+        Raises:
+            ValueError: If a scale is empty or the overall rules are not ordered
+        """
+        grading = {**DEFAULT_GRADING, **(grading or {})}
+        self.speed = _Scale(grading["speed"])
+        self.accuracy = _Scale(grading["accuracy"])
+
+        # Overall rules must grow in both wpm and accuracy, which lets the
+        # 2D rule list be looked up as two independent bisects.
+        rules = sorted(((float(wpm), float(accuracy), label) for wpm, accuracy, label in grading["overall"]),
+                       key=lambda rule: (rule[0], rule[1]))
+        if not rules:
+            raise ValueError("Grading scale must not be empty")
+        for lower, higher in zip(rules, rules[1:]):
+            if higher[1] < lower[1]:
+                raise ValueError(f"Overall grading rules must increase in both wpm and accuracy: {grading['overall']}")
+
+        self.overall_wpm = array('d', (wpm for wpm, _, _ in rules[1:]))
+        self.overall_accuracy = array('d', (accuracy for _, accuracy, _ in rules[1:]))
+        self.overall_labels = tuple(sys.intern(str(label)) for _, _, label in rules)
+
+    @classmethod
+    def default(cls) -> "GradingScheme":
+        """Get the built-in grading scheme"""
+        return cls(DEFAULT_GRADING)
+
+    def grade(self, wpm: float, accuracy: float) -> GradeTuple:
+        """
+        Grade one result
+
+        Args:
+            wpm: Words per minute
+            accuracy: Accuracy percentage
+
+        Returns:
+            tuple: (speed_grade, accuracy_grade, overall_performance)
+        """
+        level = min(bisect_right(self.overall_wpm, wpm), bisect_right(self.overall_accuracy, accuracy))
+        return self.speed.lookup(wpm), self.accuracy.lookup(accuracy), self.overall_labels[level]
+
+    def grade_batch(self, wpms: Iterable[float], accuracies: Iterable[float]) -> List[GradeTuple]:
+        """
+        Grade many results at once
+
+        Args:
+            wpms: Words per minute of each result
+            accuracies: Accuracy percentage of each result
+
+        Returns:
+            List[tuple]: (speed_grade, accuracy_grade, overall_performance) per result
+        """
+        speed_thresholds, speed_labels = self.speed.thresholds, self.speed.labels
+        accuracy_thresholds, accuracy_labels = self.accuracy.thresholds, self.accuracy.labels
+        overall_wpm, overall_accuracy, overall_labels = self.overall_wpm, self.overall_accuracy, self.overall_labels
+
+        return [
+            (speed_labels[bisect_right(speed_thresholds, wpm)],
+             accuracy_labels[bisect_right(accuracy_thresholds, accuracy)],
+             overall_labels[min(bisect_right(overall_wpm, wpm), bisect_right(overall_accuracy, accuracy))])
+            for wpm, accuracy in zip(wpms, accuracies)
+        ]
@@ -0,0 +1,301 @@
+"""
+Streaming Keystroke Analytics
+=============================
+
+Incremental per-key and per-bigram statistics over the keystroke stream:
+- Mean and variance of inter-key intervals (Welford's algorithm)
+- Error counts per key and per bigram
+- Compact array-backed tables indexed by code-point pairs
+- Fixed-width serialization, so saved tables load on any platform
+- O(1) update per keystroke and cheap merging across sessions
+"""
+
+import heapq
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+# Printable ASCII (space to tilde) gets its own slot, everything else shares one
+FIRST_CODE_POINT = 32
+LAST_CODE_POINT = 126
+OTHER_SLOT = LAST_CODE_POINT - FIRST_CODE_POINT + 1
+ALPHABET_SIZE = OTHER_SLOT + 1
+
+# Intervals longer than this (in seconds) are pauses, not transitions
+DEFAULT_MAX_INTERVAL = 2.0
+
+# Counters are unsigned 64-bit ('L' is 4 bytes on Windows and 8 on Linux)
+COUNT_TYPECODE = 'Q'
+
+
+def char_slot(char: str) -> int:
+    """
+    Get the table slot of a character
+
+    Args:
+        char: Single character
+
+    Returns:
+        int: Slot index in range(ALPHABET_SIZE)
+    """
+    code_point = ord(char)
+    if FIRST_CODE_POINT <= code_point <= LAST_CODE_POINT:
+        return code_point - FIRST_CODE_POINT
+    return OTHER_SLOT
+
+
+def slot_char(slot: int) -> str:
+    """
+    Get the character of a table slot
+
+    Args:
+        slot: Slot index
+
+    Returns:
+        str: Character, or U+FFFD for the shared non-ASCII slot
+    """
+    if slot == OTHER_SLOT:
+        return "\ufffd"
+    return chr(slot + FIRST_CODE_POINT)
+
+
+class _StatsTable:
+    """Array-backed running statistics for a fixed number of cells"""
+
+    __slots__ = ("count", "mean", "m2", "errors")
+
+    def __init__(self, size: int):
+        self.count = array(COUNT_TYPECODE, bytes(array(COUNT_TYPECODE).itemsize * size))
+        self.mean = array('d', bytes(array('d').itemsize * size))
+        self.m2 = array('d', bytes(array('d').itemsize * size))
+        self.errors = array(COUNT_TYPECODE, bytes(array(COUNT_TYPECODE).itemsize * size))
+
+    def add_interval(self, cell: int, interval: float) -> None:
+        """Add one interval sample to a cell (Welford update)"""
+        count = self.count[cell] + 1
+        delta = interval - self.mean[cell]
+        mean = self.mean[cell] + delta / count
+        self.count[cell] = count
+        self.mean[cell] = mean
+        self.m2[cell] += delta * (interval - mean)
+
+    def variance(self, cell: int) -> float:
+        """Get the sample variance of a cell"""
+        count = self.count[cell]
+        return self.m2[cell] / (count - 1) if count > 1 else 0.0
+
+    def merge(self, other: "_StatsTable") -> None:
+        """Merge another table into this one (Chan et al. parallel update)"""
+        for cell in range(len(self.count)):
+            other_count = other.count[cell]
+            self.errors[cell] += other.errors[cell]
+            if not other_count:
+                continue
+
+            count = self.count[cell]
+            total = count + other_count
+            delta = other.mean[cell] - self.mean[cell]
+            self.mean[cell] += delta * other_count / total
+            self.m2[cell] += other.m2[cell] + delta * delta * count * other_count / total
+            self.count[cell] = total
+
+    def to_bytes(self) -> bytes:
+        return b"".join(table.tobytes() for table in (self.count, self.mean, self.m2, self.errors))
+
+    def load_bytes(self, data: bytes, offset: int) -> int:
+        for table in (self.count, self.mean, self.m2, self.errors):
+            size = len(table) * table.itemsize
+            if len(data) < offset + size:
+                raise ValueError("Invalid keystroke analytics data")
+            table[:] = array(table.typecode, data[offset:offset + size])
+            offset += size
+        return offset
+
+
+class KeystrokeAnalytics:
+    def __init__(self, max_interval: float = DEFAULT_MAX_INTERVAL):
+        """
+        Initialize empty keystroke statistics
+
+        Args:
+            max_interval: Longest inter-key interval (seconds) counted as a transition
+        """
+        self.max_interval = max_interval
+        self.keys = _StatsTable(ALPHABET_SIZE)
+        self.bigrams = _StatsTable(ALPHABET_SIZE * ALPHABET_SIZE)
+        self.total_keystrokes = 0
+        self.total_errors = 0
+        self._previous_slot: Optional[int] = None
+        self._previous_time: Optional[float] = None
+
+    def record_keystroke(self, expected_char: str, typed_char: str, timestamp: float) -> None:
+        """
+        Record one keystroke of the live stream
+
+        Args:
+            expected_char: Character the user should have typed
+            typed_char: Character the user actually typed
+            timestamp: Time of the keystroke in seconds
+        """
+        slot = char_slot(expected_char)
+        is_error = typed_char != expected_char
+
+        self.total_keystrokes += 1
+        if is_error:
+            self.total_errors += 1
+            self.keys.errors[slot] += 1
+
+        previous_slot = self._previous_slot
+        if previous_slot is not None:
+            cell = previous_slot * ALPHABET_SIZE + slot
+            if is_error:
+                self.bigrams.errors[cell] += 1
+
+            interval = timestamp - self._previous_time
+            if 0 <= interval <= self.max_interval:
+                self.keys.add_interval(slot, interval)
+                self.bigrams.add_interval(cell, interval)
+
+        self._previous_slot = slot
+        self._previous_time = timestamp
+
+    def end_stream(self) -> None:
+        """End the current keystroke stream so the next keystroke starts a new chain"""
+        self._previous_slot = None
+        self._previous_time = None
+
+    def merge(self, other: "KeystrokeAnalytics") -> None:
+        """
+        Merge statistics of another session into this one
+
+        Args:
+            other: Statistics to merge
+        """
+        self.keys.merge(other.keys)
+        self.bigrams.merge(other.bigrams)
+        self.total_keystrokes += other.total_keystrokes
+        self.total_errors += other.total_errors
+
+    def get_key_stats(self, char: str) -> Dict[str, float]:
+        """
+        Get statistics for a single key
+
+        Args:
+            char: Key character
+
+        Returns:
+            dict: Sample count, mean/variance of interval in seconds, and errors
+        """
+        slot = char_slot(char)
+        return self._cell_stats(self.keys, slot)
+
+    def get_bigram_stats(self, bigram: str) -> Dict[str, float]:
+        """
+        Get statistics for a transition between two keys
+
+        Args:
+            bigram: Two-character string (previous key, next key)
+
+        Returns:
+            dict: Sample count, mean/variance of interval in seconds, and errors
+        """
+        if len(bigram) != 2:
+            raise ValueError(f"Invalid bigram: {bigram!r}")
+
+        cell = char_slot(bigram[0]) * ALPHABET_SIZE + char_slot(bigram[1])
+        return self._cell_stats(self.bigrams, cell)
+
+    def get_slowest_bigrams(self, limit: int = 10, min_samples: int = 3) -> List[Tuple[str, float, int]]:
+        """
+        Get the slowest transitions
+
+        Args:
+            limit: Maximum number of bigrams to return
+            min_samples: Minimum number of samples for a bigram to qualify
+
+        Returns:
+            List[Tuple[str, float, int]]: (bigram, mean interval, samples), slowest first
+        """
+        count, mean = self.bigrams.count, self.bigrams.mean
+        cells = (cell for cell in range(len(count)) if count[cell] >= min_samples)
+        slowest = heapq.nlargest(limit, cells, key=mean.__getitem__)
+        return [(self._cell_bigram(cell), round(mean[cell], 4), count[cell]) for cell in slowest]
+
+    def get_error_prone_keys(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        Get the keys with the most errors
+
+        Args:
+            limit: Maximum number of keys to return
+
+        Returns:
+            List[Tuple[str, int]]: (key, error count), most errors first
+        """
+        errors = self.keys.errors
+        worst = heapq.nlargest(limit, (slot for slot in range(ALPHABET_SIZE) if errors[slot]),
+                               key=errors.__getitem__)
+        return [(slot_char(slot), errors[slot]) for slot in worst]
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the statistics for storage between sessions
+
+        Returns:
+            bytes: Raw table contents
+        """
+        header = array(COUNT_TYPECODE, [self.total_keystrokes, self.total_errors]).tobytes()
+        return header + self.keys.to_bytes() + self.bigrams.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes, max_interval: float = DEFAULT_MAX_INTERVAL) -> "KeystrokeAnalytics":
+        """
+        Restore statistics serialized with to_bytes
+
+        Args:
+            data: Raw table contents
+            max_interval: Longest inter-key interval counted as a transition
+
+        Returns:
+            KeystrokeAnalytics: Restored statistics
+        """
+        analytics = cls(max_interval)
+        header_size = 2 * array(COUNT_TYPECODE).itemsize
+        if len(data) < header_size:
+            raise ValueError("Invalid keystroke analytics data")
+        analytics.total_keystrokes, analytics.total_errors = array(COUNT_TYPECODE, data[:header_size])
+        offset = analytics.keys.load_bytes(data, header_size)
+        offset = analytics.bigrams.load_bytes(data, offset)
+        if offset != len(data):
+            raise ValueError("Invalid keystroke analytics data")
+        return analytics
+
+    @staticmethod
+    def _cell_stats(table: _StatsTable, cell: int) -> Dict[str, float]:
+        return {
+            "samples": table.count[cell],
+            "mean_interval": round(table.mean[cell], 4),
+            "variance": round(table.variance(cell), 6),
+            "errors": table.errors[cell]
+        }
+
+    @staticmethod
+    def _cell_bigram(cell: int) -> str:
+        first, second = divmod(cell, ALPHABET_SIZE)
+        return slot_char(first) + slot_char(second)
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    analytics = KeystrokeAnalytics()
+    target = "the quick brown fox"
+    typed = "the quikc brown fox"
+    timestamp = 0.0
+    for index, (expected, actual) in enumerate(zip(target, typed)):
+        timestamp += 0.12 + (0.2 if expected in "qk" else 0.0)
+        analytics.record_keystroke(expected, actual, timestamp)
+
+    print(f"Slowest bigrams: {analytics.get_slowest_bigrams(5, min_samples=1)}")
+    print(f"Error-prone keys: {analytics.get_error_prone_keys(3)}")
+
+    restored = KeystrokeAnalytics.from_bytes(analytics.to_bytes())
+    restored.merge(analytics)
+    print(f"Merged 'th': {restored.get_bigram_stats('th')}")
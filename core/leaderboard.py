@@ -0,0 +1,331 @@
+"""
+Local Leaderboard Service
+=========================
+
+Small leaderboard for lab competitions:
+- Per-difficulty rankings kept in sorted arrays (bisect insert, rank lookup, top-K);
+  only the configured difficulty levels get a board
+- asyncio server speaking newline-delimited JSON on localhost
+- Client that submits results and fetches standings off the UI thread
+"""
+
+import asyncio
+import json
+import math
+import socket
+from bisect import bisect_left, insort
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_TOP_LIMIT = 10
+MAX_TOP_LIMIT = 1000
+DEFAULT_DIFFICULTIES = ("easy", "medium", "hard")
+# Longest accepted request line (bytes)
+MAX_REQUEST_BYTES = 64 * 1024
+
+
+def _finite_number(value, field: str) -> float:
+    """
+    Convert a request field to a finite float
+
+    Args:
+        value: Field value from the request
+        field: Field name for the error message
+
+    Returns:
+        float: The value
+
+    Raises:
+        ValueError: If the value is not a finite number (NaN and infinities would corrupt the ordering)
+    """
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f"{field} must be a finite number")
+    return number
+
+
+def _accuracy(value) -> float:
+    """Convert a request field to an accuracy percentage (0-100)"""
+    accuracy = _finite_number(value, "accuracy")
+    if not 0.0 <= accuracy <= 100.0:
+        raise ValueError("accuracy must be between 0 and 100")
+    return accuracy
+
+
+class RankedBoard:
+    def __init__(self):
+        """Initialize an empty ranking (higher score ranks first, ties by accuracy then arrival)"""
+        self._keys: List[Tuple[float, float, int]] = []
+        self._entries: Dict[int, Dict] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, name: str, score: float, accuracy: float) -> int:
+        """
+        Add a result
+
+        Args:
+            name: Player name
+            score: Ranking score (net WPM)
+            accuracy: Accuracy percentage
+
+        Returns:
+            int: 1-based rank of the new result
+        """
+        self._sequence += 1
+        key = (-score, -accuracy, self._sequence)
+        self._entries[self._sequence] = {"name": name, "score": score, "accuracy": accuracy}
+        insort(self._keys, key)
+        return bisect_left(self._keys, key) + 1
+
+    def rank_of(self, score: float, accuracy: float = 100.0) -> int:
+        """
+        Get the rank a result would have
+
+        Args:
+            score: Ranking score
+            accuracy: Accuracy percentage
+
+        Returns:
+            int: 1-based rank
+        """
+        return bisect_left(self._keys, (-score, -accuracy, 0)) + 1
+
+    def top(self, limit: int = DEFAULT_TOP_LIMIT) -> List[Dict]:
+        """
+        Get the best results
+
+        Args:
+            limit: Maximum number of results
+
+        Returns:
+            List[Dict]: Results with rank, name, score and accuracy
+        """
+        return [{"rank": rank, **self._entries[key[2]]}
+                for rank, key in enumerate(self._keys[:limit], start=1)]
+
+
+class LeaderboardServer:
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 difficulties: Iterable[str] = DEFAULT_DIFFICULTIES):
+        """
+        Initialize the leaderboard server
+
+        Args:
+            host: Interface to listen on (localhost by default)
+            port: TCP port
+            difficulties: Difficulty levels that have a board
+        """
+        self.host = host
+        self.port = port
+        self.boards: Dict[str, RankedBoard] = {difficulty: RankedBoard() for difficulty in difficulties}
+        self._server = None
+
+    def get_board(self, difficulty: str) -> RankedBoard:
+        """
+        Get the board of a difficulty level
+
+        Args:
+            difficulty: Difficulty level
+
+        Returns:
+            RankedBoard: The board
+
+        Raises:
+            ValueError: If the difficulty level is not configured
+        """
+        board = self.boards.get(difficulty)
+        if board is None:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        return board
+
+    def handle_request(self, request: Dict) -> Dict:
+        """
+        Handle one decoded request
+
+        Args:
+            request: {"op": "submit" | "top" | "rank", ...}
+
+        Returns:
+            dict: Response
+
+        Raises:
+            ValueError: If a number is malformed, not finite or out of range, or
+                        the difficulty level is not configured
+        """
+        op = request.get("op")
+        board = self.get_board(str(request.get("difficulty", "medium")))
+
+        if op == "submit":
+            # Prefer net WPM (calculate_words_per_minute_net) over gross WPM
+            score = _finite_number(request.get("net_wpm", request.get("wpm", 0.0)), "net_wpm")
+            accuracy = _accuracy(request.get("accuracy", 0.0))
+            rank = board.add(str(request.get("name", "anonymous"))[:40], score, accuracy)
+            return {"ok": True, "rank": rank, "total": len(board)}
+
+        if op == "top":
+            limit = max(1, min(int(request.get("limit", DEFAULT_TOP_LIMIT)), MAX_TOP_LIMIT))
+            return {"ok": True, "entries": board.top(limit), "total": len(board)}
+
+        if op == "rank":
+            rank = board.rank_of(_finite_number(request.get("score", 0.0), "score"),
+                                 _accuracy(request.get("accuracy", 100.0)))
+            return {"ok": True, "rank": rank, "total": len(board)}
+
+        return {"ok": False, "error": f"Unknown operation: {op}"}
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than MAX_REQUEST_BYTES: the rest of the line cannot be framed, drop the client
+                    writer.write(json.dumps({"ok": False, "error": "Request too long"}).encode("utf-8") + b"\n")
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                try:
+                    response = self.handle_request(json.loads(line))
+                except (ValueError, TypeError, AttributeError) as e:
+                    response = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start(self) -> None:
+        """Start listening"""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port,
+                                                  limit=MAX_REQUEST_BYTES)
+
+    async def serve_forever(self) -> None:
+        """Start listening and serve until cancelled"""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+
+class LeaderboardClient:
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, timeout: float = 2.0):
+        """
+        Initialize a leaderboard client
+
+        Requests run on a background worker; callbacks are called from that
+        worker, so GUI callers must hand results back to the Tk thread.
+
+        Args:
+            host: Server host
+            port: Server port
+            timeout: Socket timeout in seconds
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="leaderboard")
+
+    def request(self, payload: Dict) -> Dict:
+        """
+        Send a request and wait for the response (blocking)
+
+        Args:
+            payload: Request dict
+
+        Returns:
+            dict: Response, or {"ok": False, "error": ...} if the server is unreachable
+        """
+        try:
+            with socket.create_connection((self.host, self.port), timeout=self.timeout) as connection:
+                connection.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+                with connection.makefile("rb") as stream:
+                    line = stream.readline()
+            return json.loads(line) if line else {"ok": False, "error": "No response"}
+        except (OSError, ValueError) as e:
+            return {"ok": False, "error": str(e)}
+
+    def request_async(self, payload: Dict, callback: Optional[Callable[[Dict], None]] = None) -> Future:
+        """
+        Send a request without blocking
+
+        Args:
+            payload: Request dict
+            callback: Called with the response
+
+        Returns:
+            Future: Future of the response
+        """
+        future = self._executor.submit(self.request, payload)
+        if callback:
+            future.add_done_callback(lambda done: callback(done.result()))
+        return future
+
+    def submit_result(self, name: str, difficulty: str, wpm: float, net_wpm: float, accuracy: float,
+                      callback: Optional[Callable[[Dict], None]] = None) -> Future:
+        """
+        Submit a result without blocking
+
+        Args:
+            name: Player name
+            difficulty: Difficulty level of the passage
+            wpm: Gross WPM (Calculator.calculate_wpm)
+            net_wpm: Net WPM (Calculator.calculate_words_per_minute_net)
+            accuracy: Accuracy percentage
+            callback: Called with {"ok", "rank", "total"}
+
+        Returns:
+            Future: Future of the response
+        """
+        payload = {"op": "submit", "name": name, "difficulty": difficulty,
+                   "wpm": wpm, "net_wpm": net_wpm, "accuracy": accuracy}
+        return self.request_async(payload, callback)
+
+    def fetch_standings(self, difficulty: str, limit: int = DEFAULT_TOP_LIMIT,
+                        callback: Optional[Callable[[Dict], None]] = None) -> Future:
+        """
+        Fetch the top results of a difficulty without blocking
+
+        Args:
+            difficulty: Difficulty level
+            limit: Maximum number of results
+            callback: Called with {"ok", "entries", "total"}
+
+        Returns:
+            Future: Future of the response
+        """
+        return self.request_async({"op": "top", "difficulty": difficulty, "limit": limit}, callback)
+
+    def close(self) -> None:
+        """Stop the background worker"""
+        self._executor.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a local typing leaderboard server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--difficulties", nargs="+", default=list(DEFAULT_DIFFICULTIES))
+    args = parser.parse_args()
+
+    server = LeaderboardServer(args.host, args.port, args.difficulties)
+    print(f"Leaderboard listening on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
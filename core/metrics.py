@@ -0,0 +1,421 @@
+"""
+Runtime Metrics
+===============
+
+Operational metrics in the Prometheus text exposition format:
+- Counters, gauges and fixed-bucket histograms in one registry
+- Updates hold one uncontended per-metric lock
+- Periodic atomic writes of a textfile for the node exporter textfile collector
+- Optional HTTP endpoint on localhost for direct scraping
+"""
+
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_TEXTFILE = "typing_test.prom"
+DEFAULT_INTERVAL = 15.0
+DEFAULT_HOST = "127.0.0.1"
+
+# Bucket upper bounds in seconds (+Inf is always added)
+SCORING_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+TIMER_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# (name suffix, label text, value)
+Sample = Tuple[str, str, float]
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value as Prometheus expects"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str):
+        """
+        Initialize a metric
+
+        Args:
+            name: Metric name (e.g. typing_test_sessions_started_total)
+            documentation: Help text
+        """
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def samples(self) -> List[Sample]:
+        """
+        Get the current samples
+
+        Returns:
+            List[Sample]: (name suffix, label text, value) tuples
+        """
+        pass
+
+    def render(self) -> str:
+        """
+        Render the metric in the text exposition format
+
+        Returns:
+            str: HELP and TYPE lines followed by the samples
+        """
+        documentation = self.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        lines = [f"# HELP {self.name} {documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class Counter(Metric):
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the counter
+
+        Args:
+            amount: Non-negative increment
+
+        Raises:
+            ValueError: If amount is negative
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def samples(self) -> List[Sample]:
+        return [("", "", self._value)]
+
+
+class Gauge(Metric):
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._value = 0.0
+
+    def set(self, value: float) -> None:
+        """
+        Set the gauge
+
+        Args:
+            value: New value
+        """
+        value = float(value)
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Increase the gauge
+
+        Args:
+            amount: Increment (may be negative)
+        """
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """
+        Decrease the gauge
+
+        Args:
+            amount: Decrement
+        """
+        self.inc(-amount)
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def samples(self) -> List[Sample]:
+        return [("", "", self._value)]
+
+
+class Histogram(Metric):
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Iterable[float]):
+        """
+        Initialize a histogram with fixed buckets
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            buckets: Bucket upper bounds (+Inf is added)
+
+        Raises:
+            ValueError: If no finite bucket is given
+        """
+        super().__init__(name, documentation)
+        bounds = sorted(float(bound) for bound in buckets if not math.isinf(bound))
+        if not bounds:
+            raise ValueError("A histogram needs at least one finite bucket")
+        self.buckets = tuple(bounds) + (math.inf,)
+        # Per-bucket counts (made cumulative when rendered)
+        self._counts = [0] * len(self.buckets)
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Record one observation
+
+        Args:
+            value: Observed value (e.g. seconds)
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of a with-block in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, counts):
+            cumulative += count
+            samples.append(("_bucket", f'{{le="{_format_value(bound)}"}}', cumulative))
+        samples.append(("_sum", "", total))
+        samples.append(("_count", "", cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    def __init__(self):
+        """Initialize an empty registry"""
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str) -> Counter:
+        """
+        Get or create a counter
+
+        Args:
+            name: Metric name
+            documentation: Help text
+
+        Returns:
+            Counter: Registered counter
+        """
+        return self._register(Counter, name, documentation)
+
+    def gauge(self, name: str, documentation: str) -> Gauge:
+        """
+        Get or create a gauge
+
+        Args:
+            name: Metric name
+            documentation: Help text
+
+        Returns:
+            Gauge: Registered gauge
+        """
+        return self._register(Gauge, name, documentation)
+
+    def histogram(self, name: str, documentation: str, buckets: Iterable[float]) -> Histogram:
+        """
+        Get or create a histogram
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            buckets: Bucket upper bounds
+
+        Returns:
+            Histogram: Registered histogram
+        """
+        return self._register(Histogram, name, documentation, buckets)
+
+    def get(self, name: str) -> Optional[Metric]:
+        """
+        Get a registered metric
+
+        Args:
+            name: Metric name
+
+        Returns:
+            Metric: The metric, or None if not registered
+        """
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """
+        Render every metric in the text exposition format
+
+        Returns:
+            str: Exposition text
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "".join(metric.render() for metric in metrics)
+
+    def write_textfile(self, path: str) -> bool:
+        """
+        Write the metrics to a file atomically
+
+        The node exporter textfile collector must never read a partial file,
+        so the text is written next to it and renamed into place.
+
+        Args:
+            path: Output file (conventionally *.prom)
+
+        Returns:
+            bool: True if the file was written
+        """
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(temporary_path, path)
+            return True
+        except OSError as e:
+            print(f"Error writing metrics: {e}")
+            return False
+
+    def _register(self, metric_class, name: str, documentation: str, *args) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, documentation, *args)
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f"Metric {name} is already registered as a {metric.metric_type}")
+            return metric
+
+
+class MetricsExporter:
+    def __init__(self, registry: Optional[MetricsRegistry] = None, textfile: Optional[str] = DEFAULT_TEXTFILE,
+                 interval: float = DEFAULT_INTERVAL, http_port: Optional[int] = None, host: str = DEFAULT_HOST):
+        """
+        Initialize the exporter
+
+        Args:
+            registry: Metrics to export (the default registry by default)
+            textfile: File rewritten every interval (None disables it)
+            interval: Seconds between textfile writes
+            http_port: Port of the scrape endpoint (None disables it, 0 picks a free port)
+            host: Address the endpoint listens on (localhost only by default)
+        """
+        self.registry = registry or REGISTRY
+        self.textfile = textfile
+        self.interval = max(0.1, interval)
+        self.http_port = http_port
+        self.host = host
+        self.server = None
+        self._writer_thread = None
+        self._server_thread = None
+        self._stop_event = threading.Event()
+
+    @property
+    def address(self) -> Optional[Tuple[str, int]]:
+        """(host, port) of the running endpoint, or None"""
+        return self.server.server_address[:2] if self.server else None
+
+    def start(self) -> None:
+        """Start the textfile writer and the HTTP endpoint"""
+        self.stop()
+        self._stop_event.clear()
+
+        if self.textfile:
+            self.registry.write_textfile(self.textfile)
+            self._writer_thread = threading.Thread(target=self._write_loop, name="metrics-writer", daemon=True)
+            self._writer_thread.start()
+
+        if self.http_port is not None:
+            registry = self.registry
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self):
+                    if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                        self.send_error(404)
+                        return
+                    body = registry.render().encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", CONTENT_TYPE)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                def log_message(self, format, *args):
+                    # Scrapes every few seconds would flood stderr
+                    pass
+
+            self.server = ThreadingHTTPServer((self.host, self.http_port), Handler)
+            self.server.daemon_threads = True
+            self._server_thread = threading.Thread(target=self.server.serve_forever, name="metrics-http",
+                                                   daemon=True)
+            self._server_thread.start()
+
+    def stop(self) -> None:
+        """Stop exporting, writing the textfile one last time"""
+        self._stop_event.set()
+        if self._writer_thread is not None:
+            self._writer_thread.join()
+            self._writer_thread = None
+            self.registry.write_textfile(self.textfile)
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self._server_thread.join()
+            self.server = None
+            self._server_thread = None
+
+    def _write_loop(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.registry.write_textfile(self.textfile)
+
+
+# Registry shared by the app's modules
+REGISTRY = MetricsRegistry()
+
+SESSIONS_STARTED = REGISTRY.counter("typing_test_sessions_started_total", "Typing tests started")
+SESSIONS_COMPLETED = REGISTRY.counter("typing_test_sessions_completed_total", "Typing tests completed")
+KEYSTROKES_SCORED = REGISTRY.counter("typing_test_keystrokes_scored_total", "Keystrokes scored")
+SCORING_SECONDS = REGISTRY.histogram("typing_test_scoring_seconds", "Time spent scoring an attempt",
+                                     SCORING_BUCKETS)
+TIMER_LAG_SECONDS = REGISTRY.histogram("typing_test_timer_lag_seconds",
+                                       "Delay of timer updates past their schedule", TIMER_LAG_BUCKETS)
+CONFIG_SAVES = REGISTRY.counter("typing_test_config_saves_total", "Configuration saves")
+CORPUS_TEXTS = REGISTRY.gauge("typing_test_corpus_texts", "Passages in the corpus")
+
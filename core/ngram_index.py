@@ -0,0 +1,161 @@
+"""
+Character N-gram Inverted Index
+===============================
+
+Inverted index from character bigrams/trigrams to passage IDs:
+- Incremental indexing as passages are added
+- Compact array-backed posting lists
+- Scored lookup of passages covering a set of weak n-grams
+- Passages can be referenced by position in an external sequence instead of copied
+"""
+
+import heapq
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+DEFAULT_NGRAM_SIZES = (2, 3)
+
+WeakNgrams = Union[Iterable[str], Mapping[str, float]]
+
+
+class NgramIndex:
+    def __init__(self, ngram_sizes: Tuple[int, ...] = DEFAULT_NGRAM_SIZES,
+                 passages: Optional[Sequence[str]] = None):
+        """
+        Initialize an empty n-gram index
+
+        Args:
+            ngram_sizes: Character n-gram lengths to index
+            passages: Passages referenced by position (the passage ID); only
+                      postings are stored and add_passage must follow their
+                      order. By default the index keeps its own copy of each text.
+        """
+        if not ngram_sizes or min(ngram_sizes) < 1:
+            raise ValueError(f"Invalid n-gram sizes: {ngram_sizes}")
+
+        self.ngram_sizes = tuple(sorted(set(ngram_sizes)))
+        self._owns_passages = passages is None
+        self._passages = [] if passages is None else passages
+        self._passage_count = 0
+        # Posting lists hold passage IDs in increasing order
+        self._postings: Dict[str, array] = {}
+
+    def __len__(self) -> int:
+        return self._passage_count
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Normalize text before extracting n-grams"""
+        return text.lower()
+
+    def extract_ngrams(self, text: str) -> set:
+        """
+        Extract the unique character n-grams of a text
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            set: Unique n-grams of every indexed size
+        """
+        text = self._normalize(text)
+        ngrams = set()
+        for size in self.ngram_sizes:
+            ngrams.update(text[i:i + size] for i in range(len(text) - size + 1))
+        return ngrams
+
+    def add_passage(self, text: str) -> int:
+        """
+        Index a passage
+
+        Args:
+            text: Passage text
+
+        Returns:
+            int: ID assigned to the passage
+        """
+        passage_id = self._passage_count
+        if self._owns_passages:
+            self._passages.append(text)
+        self._passage_count += 1
+
+        postings = self._postings
+        for ngram in self.extract_ngrams(text):
+            posting = postings.get(ngram)
+            if posting is None:
+                posting = postings[ngram] = array('I')
+            posting.append(passage_id)
+
+        return passage_id
+
+    def get_passage(self, passage_id: int) -> str:
+        """
+        Get passage text by ID
+
+        Args:
+            passage_id: ID returned by add_passage
+
+        Returns:
+            str: Passage text
+        """
+        return self._passages[passage_id]
+
+    def get_document_frequency(self, ngram: str) -> int:
+        """
+        Get the number of passages containing an n-gram
+
+        Args:
+            ngram: Character n-gram
+
+        Returns:
+            int: Number of passages containing the n-gram
+        """
+        posting = self._postings.get(self._normalize(ngram))
+        return len(posting) if posting is not None else 0
+
+    def find_best_passages(self, weak_ngrams: WeakNgrams, limit: int = 5) -> List[Tuple[int, float]]:
+        """
+        Find the passages that best cover a set of weak n-grams
+
+        Only the posting lists of the requested n-grams are visited, so the cost
+        depends on how common the weak n-grams are, not on the corpus size.
+
+        Args:
+            weak_ngrams: N-grams to practice, optionally mapped to weights
+            limit: Maximum number of passages to return
+
+        Returns:
+            List[Tuple[int, float]]: (passage_id, score) sorted by score descending
+        """
+        if isinstance(weak_ngrams, Mapping):
+            weighted = weak_ngrams.items()
+        else:
+            weighted = ((ngram, 1.0) for ngram in weak_ngrams)
+
+        weights = {}
+        for ngram, weight in weighted:
+            ngram = self._normalize(ngram)
+            if len(ngram) in self.ngram_sizes and weight > 0:
+                weights[ngram] = weights.get(ngram, 0.0) + weight
+
+        scores: Dict[int, float] = {}
+        for ngram, weight in weights.items():
+            posting = self._postings.get(ngram)
+            if posting is None:
+                continue
+            for passage_id in posting:
+                scores[passage_id] = scores.get(passage_id, 0.0) + weight
+
+        # Ties go to the earlier passage so results are deterministic
+        best = heapq.nsmallest(limit, scores.items(), key=lambda item: (-item[1], item[0]))
+        return [(passage_id, score) for passage_id, score in best]
+
+
+if __name__ == "__main__":
+    index = NgramIndex()
+    for passage in ["The quick brown fox jumps.", "Pack my box with five dozen liquor jugs.",
+                    "Sphinx of black quartz, judge my vow."]:
+        index.add_passage(passage)
+
+    for passage_id, score in index.find_best_passages({"qu": 2.0, "ju": 1.0, "ox": 1.0}):
+        print(f"{score:.1f}: {index.get_passage(passage_id)}")
@@ -0,0 +1,221 @@
+"""
+Weighted Passage Sampling
+=========================
+
+Constant-time weighted passage selection:
+- Walker/Vose alias tables for O(1) weighted draws
+- Texts added later go to a small pending pool merged into the table in
+  amortized O(1), so adding never rebuilds the table per text
+- O(1) no-repeat window over the most recent draws
+- Seedable random generator for reproducible exam papers
+"""
+
+import random
+import threading
+from array import array
+from collections import deque
+from typing import Iterable, Optional
+
+# Number of most recent passages excluded from the next draw
+DEFAULT_REPEAT_WINDOW = 3
+
+# Redraws before falling back to a scan of the passages outside the window
+MAX_REDRAWS = 32
+
+# Pending passages kept outside the alias table before it is rebuilt
+MIN_PENDING = 256
+# ... or this fraction of the table size, whichever is larger
+PENDING_FRACTION = 0.25
+
+
+class AliasTable:
+    __slots__ = ("probability", "alias")
+
+    def __init__(self, weights: Iterable[float]):
+        """
+        Build an alias table (Vose's method) in O(n)
+
+        Args:
+            weights: Non-negative weights with a positive sum
+
+        Raises:
+            ValueError: If a weight is negative or all weights are zero
+        """
+        weights = array('d', weights)
+        size = len(weights)
+        total = sum(weights)
+        if total <= 0 or min(weights, default=0.0) < 0:
+            raise ValueError("Weights must be non-negative with a positive sum")
+
+        scaled = array('d', (weight * size / total for weight in weights))
+        self.probability = array('d', bytes(8 * size))
+        self.alias = array('q', bytes(8 * size))
+
+        small = [index for index in range(size) if scaled[index] < 1.0]
+        large = [index for index in range(size) if scaled[index] >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.probability[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+        # Leftovers are 1.0 up to rounding error
+        for index in large + small:
+            self.probability[index] = 1.0
+            self.alias[index] = index
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+    def draw(self, rng: random.Random) -> int:
+        """
+        Draw one index in O(1)
+
+        Args:
+            rng: Random generator
+
+        Returns:
+            int: Index drawn with probability proportional to its weight
+        """
+        index = int(rng.random() * len(self.probability))
+        return index if rng.random() < self.probability[index] else self.alias[index]
+
+
+class PassageSampler:
+    def __init__(self, weights: Iterable[float] = (), window: int = DEFAULT_REPEAT_WINDOW,
+                 seed: Optional[int] = None):
+        """
+        Initialize a sampler over passage indices
+
+        Args:
+            weights: Initial passage weights (index order)
+            window: Number of most recent draws excluded from the next draw
+            seed: Random seed for reproducible sequences
+        """
+        self.rng = random.Random(seed)
+        self.window = max(0, window)
+        self.weights = array('d')
+        self._uniform = True
+        self._positive = 0
+        self._table = None
+        self._table_total = 0.0
+        self._pending_total = 0.0
+        self._pending_max = 0.0
+        self._recent = deque()
+        self._recent_set = set()
+        self._lock = threading.Lock()
+
+        for weight in weights:
+            self._append(weight)
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def add(self, weight: float = 1.0) -> int:
+        """
+        Add a passage (amortized O(1))
+
+        Args:
+            weight: Non-negative weight of the passage
+
+        Returns:
+            int: Index of the new passage
+        """
+        with self._lock:
+            was_uniform = self._uniform
+            self._append(weight)
+            pending = len(self.weights) - len(self._table or ())
+            if was_uniform or pending > max(MIN_PENDING, int(len(self.weights) * PENDING_FRACTION)):
+                self._rebuild()
+            return len(self.weights) - 1
+
+    def draw(self) -> int:
+        """
+        Draw a passage index outside the no-repeat window
+
+        Returns:
+            int: Passage index
+
+        Raises:
+            IndexError: If no passage has a positive weight
+        """
+        with self._lock:
+            if not self._positive:
+                raise IndexError("Cannot draw from an empty sampler")
+
+            # Small corpora cannot exclude more passages than they have
+            window = min(self.window, self._positive - 1)
+            index = self._draw_any()
+            if window:
+                attempts = 1
+                while index in self._recent_set and attempts < MAX_REDRAWS:
+                    index = self._draw_any()
+                    attempts += 1
+                if index in self._recent_set:
+                    index = self._draw_outside_window()
+            self._remember(index, window)
+            return index
+
+    def reset_history(self) -> None:
+        """Forget recent draws"""
+        with self._lock:
+            self._recent.clear()
+            self._recent_set.clear()
+
+    def _append(self, weight: float) -> None:
+        weight = float(weight)
+        if weight < 0:
+            raise ValueError(f"Invalid weight: {weight}")
+        self.weights.append(weight)
+        if weight > 0:
+            self._positive += 1
+        if weight != 1.0:
+            self._uniform = False
+        self._pending_total += weight
+        self._pending_max = max(self._pending_max, weight)
+
+    def _rebuild(self) -> None:
+        """Fold pending passages into a new alias table"""
+        self._pending_total = 0.0
+        self._pending_max = 0.0
+        if self._uniform or not self._positive:
+            self._table = None
+            self._table_total = float(len(self.weights)) if self._uniform else 0.0
+            return
+        self._table = AliasTable(self.weights)
+        self._table_total = sum(self.weights)
+
+    def _draw_any(self) -> int:
+        """Draw one index in O(1), ignoring the window"""
+        rng = self.rng
+        if self._uniform:
+            return int(rng.random() * len(self.weights))
+
+        table_size = len(self._table) if self._table is not None else 0
+        if self._pending_total and rng.random() * (self._table_total + self._pending_total) >= self._table_total:
+            # Rejection sampling over the few pending passages
+            pending = len(self.weights) - table_size
+            while True:
+                index = table_size + int(rng.random() * pending)
+                if rng.random() * self._pending_max < self.weights[index]:
+                    return index
+        return self._table.draw(rng)
+
+    def _draw_outside_window(self) -> int:
+        """Weighted draw among passages outside the window (O(n) fallback for tiny or skewed corpora)"""
+        candidates = [index for index, weight in enumerate(self.weights)
+                      if weight > 0 and index not in self._recent_set]
+        if not candidates:
+            return self._draw_any()
+        return self.rng.choices(candidates, [self.weights[index] for index in candidates])[0]
+
+    def _remember(self, index: int, window: int) -> None:
+        if not window:
+            return
+        self._recent.append(index)
+        self._recent_set.add(index)
+        while len(self._recent) > window:
+            self._recent_set.discard(self._recent.popleft())
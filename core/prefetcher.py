@@ -0,0 +1,205 @@
+"""
+Background Passage Prefetching
+==============================
+
+Prepares upcoming passages on a worker thread while the current test runs:
+- Selects and normalizes the next few passages per difficulty
+- Precomputes text statistics, word boundaries and wrapped line breaks
+- Starting the next test becomes a queue pop instead of a computation
+"""
+
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+# Handle imports for both standalone and module execution
+try:
+    from .text_layout import WordIndex, wrap_lines
+except ImportError:
+    import sys
+    import os
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, current_dir)
+    from text_layout import WordIndex, wrap_lines
+
+# Prepared passages kept ready per difficulty
+DEFAULT_PREFETCH_DEPTH = 3
+DEFAULT_LINE_WIDTH = 80
+
+
+class PreparedPassage:
+    __slots__ = ("text", "difficulty", "statistics", "word_index", "line_width", "line_starts")
+
+    def __init__(self, text: str, difficulty: Optional[str], statistics: dict, line_width: int):
+        """
+        Passage with its precomputed analysis and layout
+
+        Args:
+            text: Normalized passage text
+            difficulty: Difficulty the passage was selected for
+            statistics: Result of TextManager.get_text_statistics
+            line_width: Column width used for the line breaks
+        """
+        self.text = text
+        self.difficulty = difficulty
+        self.statistics = statistics
+        self.word_index = WordIndex(text)
+        self.line_width = line_width
+        self.line_starts = wrap_lines(text, line_width)
+
+    def get_line_starts(self, line_width: int):
+        """
+        Get line breaks for a column width, re-wrapping only if the width changed
+
+        Args:
+            line_width: Column width
+
+        Returns:
+            array: Start offset of every line
+        """
+        if line_width != self.line_width:
+            self.line_width = line_width
+            self.line_starts = wrap_lines(self.text, line_width)
+        return self.line_starts
+
+
+class PassagePrefetcher:
+    def __init__(self, text_manager, depth: int = DEFAULT_PREFETCH_DEPTH,
+                 line_width: int = DEFAULT_LINE_WIDTH):
+        """
+        Initialize the prefetcher (the worker starts on first request)
+
+        Prepared passages are dropped whenever the TextManager's corpus changes.
+
+        Args:
+            text_manager: TextManager to select passages from
+            depth: Number of prepared passages kept per difficulty
+            line_width: Column width used to pre-wrap passages
+        """
+        self.text_manager = text_manager
+        self.depth = depth
+        self.line_width = line_width
+        self._queues: Dict[Optional[str], deque] = {}
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._worker = None
+        # Bumped by invalidate so passages prepared from the old corpus are discarded
+        self._generation = 0
+        text_manager.add_corpus_listener(self.invalidate)
+
+    def prepare(self, difficulty: Optional[str] = None) -> PreparedPassage:
+        """
+        Select and prepare one passage on the calling thread
+
+        Args:
+            difficulty: Difficulty level, or None for the TextManager's default choice
+
+        Returns:
+            PreparedPassage: Prepared passage
+        """
+        text = self.text_manager.choose_formatted_text(difficulty)
+        statistics = self.text_manager.get_text_statistics(text)
+        return PreparedPassage(text, difficulty, statistics, self.line_width)
+
+    def request(self, difficulty: Optional[str] = None) -> None:
+        """
+        Ask the worker to keep passages of a difficulty ready
+
+        Args:
+            difficulty: Difficulty level, or None for the TextManager's default choice
+        """
+        with self._condition:
+            self._queues.setdefault(difficulty, deque())
+            self._ensure_worker()
+            self._condition.notify()
+
+    def take(self, difficulty: Optional[str] = None) -> PreparedPassage:
+        """
+        Get the next prepared passage, preparing one now if none is ready
+
+        Args:
+            difficulty: Difficulty level, or None for the TextManager's default choice
+
+        Returns:
+            PreparedPassage: Passage ready to display
+        """
+        with self._condition:
+            queue = self._queues.setdefault(difficulty, deque())
+            passage = queue.popleft() if queue else None
+            self._ensure_worker()
+            self._condition.notify()
+
+        if passage is None:
+            passage = self.prepare(difficulty)
+        passage.get_line_starts(self.line_width)
+        return passage
+
+    def set_line_width(self, line_width: int) -> None:
+        """
+        Change the column width used for new passages
+
+        Already prepared passages are re-wrapped when taken.
+
+        Args:
+            line_width: Column width
+        """
+        self.line_width = line_width
+
+    def invalidate(self) -> None:
+        """Drop prepared passages (e.g. after the corpus changed)"""
+        with self._condition:
+            for queue in self._queues.values():
+                queue.clear()
+            self._generation += 1
+            self._condition.notify()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """
+        Stop the worker thread
+
+        Args:
+            timeout: Seconds to wait for the worker to exit
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+
+    def _ensure_worker(self) -> None:
+        """Start the worker thread if needed (caller holds the condition)"""
+        if self._worker is None and not self._stopped:
+            self._worker = threading.Thread(target=self._run, name="passage-prefetch", daemon=True)
+            self._worker.start()
+
+    def _next_difficulty(self):
+        """Find a difficulty whose queue needs filling (caller holds the condition)"""
+        for difficulty, queue in self._queues.items():
+            if len(queue) < self.depth:
+                return difficulty, True
+        return None, False
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                difficulty, needed = self._next_difficulty()
+                while not needed and not self._stopped:
+                    self._condition.wait()
+                    difficulty, needed = self._next_difficulty()
+                if self._stopped:
+                    return
+                generation = self._generation
+
+            try:
+                passage = self.prepare(difficulty)
+            except Exception as e:
+                print(f"Passage prefetch error: {e}")
+                with self._condition:
+                    self._queues.pop(difficulty, None)
+                continue
+
+            with self._condition:
+                queue = self._queues.get(difficulty)
+                if generation == self._generation and queue is not None and len(queue) < self.depth:
+                    queue.append(passage)
@@ -0,0 +1,246 @@
+"""
+Resource Leak Monitoring
+========================
+
+Periodic resource snapshots for long-running sessions:
+- tracemalloc totals on every sample; top allocating source lines only on
+  request or when growth is flagged (a full tracemalloc snapshot holds the
+  GIL while it copies every traced block, so it would stall the Tk thread
+  even when taken on a worker)
+- Live thread count and pending Tk "after" callbacks
+- Live Timer/TextManager objects (tracked through weak references)
+- Rotating JSON-lines log, with warnings on monotonic growth across tests
+- Snapshots scheduled from Tk are taken on a worker thread so typing never stalls
+"""
+
+import json
+import logging
+import threading
+import time
+import tracemalloc
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from logging.handlers import RotatingFileHandler
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_LOG_FILE = "resource_monitor.log"
+DEFAULT_MAX_LOG_BYTES = 1024 * 1024
+DEFAULT_BACKUP_COUNT = 3
+DEFAULT_TOP_ALLOCATORS = 10
+# Number of consecutive tests a metric must grow over to be flagged
+DEFAULT_GROWTH_WINDOW = 5
+
+# Metrics checked for monotonic growth across tests
+GROWTH_METRICS = ("traced_bytes", "threads", "tk_after_callbacks", "live_objects")
+
+_live_instances: Dict[str, "weakref.WeakSet"] = {}
+
+
+def track_instance(instance) -> None:
+    """
+    Count an object as live until it is garbage collected
+
+    Args:
+        instance: Object to track (its class name is the counter key)
+    """
+    name = type(instance).__name__
+    instances = _live_instances.get(name)
+    if instances is None:
+        instances = _live_instances[name] = weakref.WeakSet()
+    instances.add(instance)
+
+
+def live_instance_counts() -> Dict[str, int]:
+    """
+    Get the number of live tracked objects per class
+
+    Returns:
+        dict: Class name to live instance count
+    """
+    return {name: len(instances) for name, instances in _live_instances.items()}
+
+
+class ResourceMonitor:
+    def __init__(self, log_file: str = DEFAULT_LOG_FILE, max_bytes: int = DEFAULT_MAX_LOG_BYTES,
+                 backup_count: int = DEFAULT_BACKUP_COUNT, top_allocators: int = DEFAULT_TOP_ALLOCATORS,
+                 growth_window: int = DEFAULT_GROWTH_WINDOW, trace_frames: int = 1):
+        """
+        Initialize the monitor
+
+        Args:
+            log_file: Path of the rotating log
+            max_bytes: Size at which the log rotates
+            backup_count: Number of rotated logs kept
+            top_allocators: Number of top allocating lines recorded per full snapshot
+            growth_window: Consecutive tests a metric must grow over to be flagged
+            trace_frames: Stack frames stored per allocation by tracemalloc
+        """
+        self.top_allocators = top_allocators
+        self.growth_window = max(2, growth_window)
+        self.trace_frames = trace_frames
+        self.test_history = deque(maxlen=self.growth_window)
+        self.tk_widget = None
+        self._job = None
+        self._test_count = 0
+        # One worker keeps snapshots (and the test history) in submission order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resource-monitor")
+
+        self.logger = logging.getLogger(f"{__name__}.{id(self)}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self._handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                            encoding="utf-8")
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+        self.logger.addHandler(self._handler)
+
+    def snapshot(self, label: str = "snapshot", allocators: bool = True) -> Dict:
+        """
+        Record the current resource usage
+
+        Args:
+            label: Snapshot label written to the log
+            allocators: Also record the top allocating lines; this takes a full
+                        tracemalloc snapshot, which holds the GIL for a time
+                        proportional to the number of traced blocks
+
+        Returns:
+            dict: Snapshot data
+        """
+        return self._record(label, self._pending_after_count(), allocators)
+
+    def _record(self, label: str, tk_after_callbacks: Optional[int], allocators: bool = False) -> Dict:
+        """Take a snapshot (safe off the Tk thread, the Tk count is read by the caller)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+
+        traced_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        instance_counts = live_instance_counts()
+
+        data = {
+            "time": round(time.time(), 3),
+            "label": label,
+            "traced_bytes": traced_bytes,
+            "peak_bytes": peak_bytes,
+            "threads": threading.active_count(),
+            "tk_after_callbacks": tk_after_callbacks,
+            "live_objects": sum(instance_counts.values()),
+            "instances": instance_counts
+        }
+        if allocators:
+            data["top_allocators"] = self._top_allocators()
+        self.logger.info(json.dumps(data))
+        return data
+
+    def _top_allocators(self) -> List[Dict]:
+        """Get the top allocating source lines from a full tracemalloc snapshot"""
+        statistics = tracemalloc.take_snapshot().statistics("lineno")[:self.top_allocators]
+        return [{"location": str(stat.traceback[0]), "size": stat.size, "count": stat.count}
+                for stat in statistics]
+
+    def mark_test_boundary(self) -> List[str]:
+        """
+        Record a snapshot between tests and check for steady growth
+
+        Only totals are sampled; the top allocating lines are added to the
+        warning when a metric is flagged.
+
+        Returns:
+            List[str]: Metrics that grew over every one of the last growth_window tests
+        """
+        return self._test_boundary(self._pending_after_count())
+
+    def mark_test_boundary_in_background(self, on_done: Optional[Callable[[List[str]], None]] = None) -> Future:
+        """
+        Record a test boundary snapshot on the worker thread
+
+        Only the Tk callback count is read here; call this from the Tk thread.
+        A flagged leak still takes a full tracemalloc snapshot, which holds the
+        GIL while it runs.
+
+        Args:
+            on_done: Called on the worker thread with the growing metrics
+
+        Returns:
+            Future: Future of the growing metrics
+        """
+        future = self._executor.submit(self._test_boundary, self._pending_after_count())
+
+        def finished(done: Future):
+            self._report_error(done)
+            if on_done and done.exception() is None:
+                on_done(done.result())
+
+        future.add_done_callback(finished)
+        return future
+
+    def _test_boundary(self, tk_after_callbacks: Optional[int]) -> List[str]:
+        self._test_count += 1
+        data = self._record(f"test {self._test_count}", tk_after_callbacks)
+        self.test_history.append(data)
+
+        growing = []
+        if len(self.test_history) == self.growth_window:
+            for metric in GROWTH_METRICS:
+                values = [entry[metric] for entry in self.test_history if entry[metric] is not None]
+                if len(values) == self.growth_window and all(b > a for a, b in zip(values, values[1:])):
+                    growing.append(metric)
+
+        if growing:
+            self.logger.warning(json.dumps({
+                "time": data["time"],
+                "label": "possible leak",
+                "metrics": growing,
+                "tests": self.growth_window,
+                "top_allocators": self._top_allocators()
+            }))
+        return growing
+
+    def start(self, tk_widget, interval_ms: int = 60000) -> None:
+        """
+        Sample resource totals periodically, scheduled on the Tk event loop and taken on the worker thread
+
+        Args:
+            tk_widget: Tk widget used for scheduling and for counting "after" callbacks
+            interval_ms: Snapshot interval in milliseconds
+        """
+        self.stop()
+        self.tk_widget = tk_widget
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+
+        def tick():
+            self._job = tk_widget.after(interval_ms, tick)
+            future = self._executor.submit(self._record, "periodic", self._pending_after_count())
+            future.add_done_callback(self._report_error)
+
+        self._job = tk_widget.after(interval_ms, tick)
+
+    def stop(self) -> None:
+        """Stop periodic snapshots"""
+        if self.tk_widget is not None and self._job is not None:
+            self.tk_widget.after_cancel(self._job)
+        self._job = None
+
+    def close(self) -> None:
+        """Stop monitoring and close the log (waits for a running snapshot)"""
+        self.stop()
+        self._executor.shutdown(wait=True)
+        self.logger.removeHandler(self._handler)
+        self._handler.close()
+
+    @staticmethod
+    def _report_error(future: Future) -> None:
+        error = future.exception()
+        if error is not None:
+            print(f"Resource monitor error: {error}")
+
+    def _pending_after_count(self) -> Optional[int]:
+        """Count pending Tk after callbacks, excluding the monitor's own"""
+        if self.tk_widget is None:
+            return None
+        try:
+            pending = self.tk_widget.tk.splitlist(self.tk_widget.tk.call("after", "info"))
+        except Exception:
+            return None
+        return len(pending) - (1 if self._job in pending else 0)
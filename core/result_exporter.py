@@ -0,0 +1,218 @@
+"""
+Streaming Result Export
+=======================
+
+Exports session results to CSV or JSONL:
+- Consumes sessions from any iterable/generator, never building a full list
+- Writes in fixed-size buffered chunks, optionally gzip-compressed
+- Progress reporting and cancellation
+- Background export on a worker thread for GUI callers
+"""
+
+import csv
+import gzip
+import io
+import itertools
+import json
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Encoded bytes collected before each write to disk
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+
+# Progress is reported every this many rows
+DEFAULT_PROGRESS_INTERVAL = 10000
+
+SUPPORTED_FORMATS = ("csv", "jsonl")
+
+
+class ExportCancelled(Exception):
+    """Raised when an export is cancelled before it completes"""
+
+
+def detect_format(file_path: str) -> tuple:
+    """
+    Detect export format and compression from a file name
+
+    Args:
+        file_path: Output path, e.g. results.csv or results.jsonl.gz
+
+    Returns:
+        tuple: (format, compress)
+    """
+    name = file_path.lower()
+    compress = name.endswith(".gz")
+    if compress:
+        name = name[:-3]
+    export_format = "jsonl" if name.endswith((".jsonl", ".json")) else "csv"
+    return export_format, compress
+
+
+def _as_dict(session) -> Dict:
+    """Convert result records (objects with to_dict) to plain dicts"""
+    return session if isinstance(session, dict) else session.to_dict()
+
+
+class ResultExporter:
+    def __init__(self, chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                 progress_callback: Optional[Callable[[int], None]] = None,
+                 progress_interval: int = DEFAULT_PROGRESS_INTERVAL):
+        """
+        Initialize the exporter
+
+        Args:
+            chunk_bytes: Size of the write buffer in bytes
+            progress_callback: Called with the number of rows written so far
+            progress_interval: Rows between progress reports
+        """
+        self.chunk_bytes = chunk_bytes
+        self.progress_callback = progress_callback
+        self.progress_interval = max(1, progress_interval)
+        self._cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Cancel the running export (the partial file is removed)"""
+        self._cancel_event.set()
+
+    def export(self, sessions: Iterable[Dict], file_path: str, export_format: Optional[str] = None,
+               compress: Optional[bool] = None, fieldnames: Optional[List[str]] = None) -> int:
+        """
+        Stream sessions to a file
+
+        Args:
+            sessions: Session dicts (may be a generator)
+            file_path: Output path
+            export_format: "csv" or "jsonl" (detected from file_path by default)
+            compress: gzip the output (detected from a .gz suffix by default)
+            fieldnames: CSV columns (keys of the first session by default)
+
+        Returns:
+            int: Number of rows written
+
+        Raises:
+            ValueError: If the format is not supported
+            ExportCancelled: If cancel() was called during the export
+        """
+        detected_format, detected_compress = detect_format(file_path)
+        export_format = export_format or detected_format
+        compress = detected_compress if compress is None else compress
+        if export_format not in SUPPORTED_FORMATS:
+            raise ValueError(f"Unsupported export format: {export_format}")
+
+        self._cancel_event.clear()
+        sessions = iter(sessions)
+        temp_path = file_path + ".part"
+        opener = gzip.open if compress else open
+
+        try:
+            with opener(temp_path, "wb") as output:
+                if export_format == "csv":
+                    rows = self._write_csv(sessions, output, fieldnames)
+                else:
+                    rows = self._write_jsonl(sessions, output)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return rows
+
+    def export_in_background(self, sessions: Iterable[Dict], file_path: str,
+                             on_done: Optional[Callable[[int, Optional[Exception]], None]] = None,
+                             **options) -> threading.Thread:
+        """
+        Run export() on a worker thread
+
+        Args:
+            sessions: Session dicts (consumed on the worker thread)
+            file_path: Output path
+            on_done: Called from the worker with (rows, error); error is None on success
+            **options: Passed to export()
+
+        Returns:
+            threading.Thread: The started worker
+        """
+        def run():
+            try:
+                rows = self.export(sessions, file_path, **options)
+            except Exception as e:
+                if on_done:
+                    on_done(0, e)
+                return
+            if on_done:
+                on_done(rows, None)
+
+        worker = threading.Thread(target=run, name="result-export", daemon=True)
+        worker.start()
+        return worker
+
+    def _write_csv(self, sessions, output, fieldnames: Optional[List[str]]) -> int:
+        first = next(sessions, None)
+        if first is None:
+            return 0
+        first = _as_dict(first)
+        if fieldnames is None:
+            fieldnames = list(first.keys())
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+
+        rows = 0
+        for session in itertools.chain((first,), sessions):
+            writer.writerow(_as_dict(session))
+            rows += 1
+            if buffer.tell() >= self.chunk_bytes:
+                self._flush(buffer, output)
+            self._on_row(rows)
+
+        self._flush(buffer, output)
+        return rows
+
+    def _write_jsonl(self, sessions, output) -> int:
+        buffer = io.StringIO()
+        rows = 0
+        for session in sessions:
+            buffer.write(json.dumps(_as_dict(session), ensure_ascii=False, default=str))
+            buffer.write("\n")
+            rows += 1
+            if buffer.tell() >= self.chunk_bytes:
+                self._flush(buffer, output)
+            self._on_row(rows)
+
+        self._flush(buffer, output)
+        return rows
+
+    def _on_row(self, rows: int) -> None:
+        if rows % self.progress_interval:
+            return
+        if self._cancel_event.is_set():
+            raise ExportCancelled(f"Export cancelled after {rows} rows")
+        if self.progress_callback:
+            self.progress_callback(rows)
+
+    @staticmethod
+    def _flush(buffer: io.StringIO, output) -> None:
+        """Write the buffered text as one chunk and reuse the buffer"""
+        data = buffer.getvalue()
+        if data:
+            output.write(data.encode("utf-8"))
+        buffer.seek(0)
+        buffer.truncate()
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    def generate_sessions(count):
+        for index in range(count):
+            yield {"session": index, "wpm": 40 + index % 30, "accuracy": 90 + index % 10,
+                   "timestamp": time.time()}
+
+    path = sys.argv[1] if len(sys.argv) > 1 else "results.csv.gz"
+    exporter = ResultExporter(progress_callback=lambda rows: print(f"{rows} rows written"),
+                              progress_interval=100000)
+    print(f"Exported {exporter.export(generate_sessions(300000), path)} rows to {path}")
@@ -0,0 +1,181 @@
+"""
+Compact Result Records
+======================
+
+Immutable, __slots__-based records returned by Calculator:
+- A fraction of the memory of per-result dicts
+- Attribute access for hot paths, dict-style access and to_dict() for compatibility
+- Each record class gets a generated __init__ that assigns its slots directly
+- Array-backed ResultTable for large batches of numeric results
+"""
+
+from array import array
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+
+def _make_init(cls) -> Callable:
+    """
+    Generate an __init__ taking the fields of a record class as arguments
+
+    The slots are assigned through their descriptors, bypassing the
+    immutable __setattr__ without the cost of a generic loop.
+
+    Args:
+        cls: ResultRecord subclass
+
+    Returns:
+        function: __init__(self, field, ...) for the class
+    """
+    namespace = {f"_set_{name}": getattr(cls, name).__set__ for name in cls._fields}
+    arguments = ", ".join(cls._fields)
+    body = "".join(f"\n    _set_{name}(self, {name})" for name in cls._fields) or "\n    pass"
+    exec(f"def __init__(self, {arguments}):{body}", namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    return init
+
+
+class ResultRecord:
+    __slots__ = ()
+    # Field names in order; set by each subclass
+    _fields: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__init__ = _make_init(cls)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dict
+
+        Returns:
+            dict: Field names mapped to values
+        """
+        return {name: getattr(self, name) for name in self._fields}
+
+    # Read-only mapping protocol so existing dict-based callers keep working
+    def __getitem__(self, key: str):
+        if key not in self._fields:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+    def values(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return ((name, getattr(self, name)) for name in self._fields)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ResultRecord):
+            return type(self) is type(other) and self.values() == other.values()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.values()))
+
+    def __reduce__(self):
+        return type(self), self.values()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({fields})"
+
+
+class AccuracyResult(ResultRecord):
+    _fields = ("accuracy", "correct_chars", "total_chars", "errors", "error_rate", "completion")
+    __slots__ = _fields
+
+
+class GradeResult(ResultRecord):
+    _fields = ("speed_grade", "accuracy_grade", "overall_performance")
+    __slots__ = _fields
+
+
+class ProgressMetrics(ResultRecord):
+    _fields = ("total_sessions", "average_wpm", "average_accuracy", "best_wpm", "worst_wpm",
+               "best_accuracy", "worst_accuracy", "wpm_improvement_percent", "accuracy_improvement_percent")
+    __slots__ = _fields
+
+
+class WordResult(ResultRecord):
+    _fields = ("word", "errors", "corrections", "keystrokes", "wpm")
+    __slots__ = _fields
+
+
+class ResultTable:
+    def __init__(self, record_type=AccuracyResult):
+        """
+        Column-oriented table of numeric records backed by arrays
+
+        Column types (integer or float) are taken from the first appended record.
+
+        Args:
+            record_type: ResultRecord subclass whose fields are all numeric
+        """
+        self.record_type = record_type
+        self.columns = {}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, record: ResultRecord) -> None:
+        """
+        Append a record
+
+        Args:
+            record: Record of the table's record type
+        """
+        if not self.columns:
+            self.columns = {name: array('q' if isinstance(getattr(record, name), int) else 'd')
+                            for name in self.record_type._fields}
+
+        for name, column in self.columns.items():
+            column.append(getattr(record, name))
+        self._length += 1
+
+    def column(self, name: str) -> array:
+        """
+        Get one field of every row
+
+        Args:
+            name: Field name
+
+        Returns:
+            array: Column values
+        """
+        if name not in self.record_type._fields:
+            raise KeyError(name)
+        return self.columns.get(name, array('d'))
+
+    def __getitem__(self, index: int) -> ResultRecord:
+        if not -self._length <= index < self._length:
+            raise IndexError("ResultTable index out of range")
+        return self.record_type(*(column[index] for column in self.columns.values()))
+
+    def __iter__(self) -> Iterator[ResultRecord]:
+        for index in range(self._length):
+            yield self[index]
@@ -0,0 +1,255 @@
+"""
+Session History Charts
+======================
+
+Chart data for long result histories:
+- Column arrays of session time, WPM and accuracy
+- Per-day and per-week rollups maintained incrementally as sessions are added;
+  buckets follow local time, like the dates shown in the charts
+- Zoomed ranges served from the coarsest resolution that still has enough points
+  (narrow zooms over dense ranges fall back to the individual sessions)
+- Largest-triangle-three-buckets (LTTB) downsampling to a bounded point count
+"""
+
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Optional, Tuple
+
+DAY_SECONDS = 86400
+WEEK_SECONDS = 7 * DAY_SECONDS
+
+# Default number of points drawn per chart
+DEFAULT_MAX_POINTS = 500
+# Rollups are only drawn with at least max_points // ROLLUP_MIN_FRACTION points
+ROLLUP_MIN_FRACTION = 4
+
+METRICS = ("wpm", "accuracy")
+
+Series = Tuple[array, array]
+
+
+def _utc_offset(timestamp: float) -> int:
+    """Local UTC offset in seconds at a time (follows daylight saving changes)"""
+    return time.localtime(timestamp).tm_gmtoff
+
+
+def lttb(xs, ys, threshold: int) -> Series:
+    """
+    Downsample a series with the largest-triangle-three-buckets algorithm
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with its neighbours, which preserves
+    the visual shape (peaks and dips) of the series.
+
+    Args:
+        xs: Ascending x values
+        ys: y values
+        threshold: Maximum number of points returned
+
+    Returns:
+        Series: (xs, ys) arrays with at most threshold points
+    """
+    length = len(xs)
+    if length <= threshold:
+        return array('d', xs), array('d', ys)
+    if threshold < 3:
+        # Too few points for buckets: keep the end points only
+        indices = (0, length - 1)[:max(threshold, 0)]
+        return array('d', (xs[i] for i in indices)), array('d', (ys[i] for i in indices))
+
+    sampled_x = array('d', [xs[0]])
+    sampled_y = array('d', [ys[0]])
+    bucket_size = (length - 2) / (threshold - 2)
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Average of the next bucket is the third triangle point
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, length)
+        count = next_end - next_start
+        average_x = sum(xs[next_start:next_end]) / count
+        average_y = sum(ys[next_start:next_end]) / count
+
+        point_x = xs[previous]
+        point_y = ys[previous]
+        best_area = -1.0
+        best = start
+        for index in range(start, end):
+            area = abs((point_x - average_x) * (ys[index] - point_y)
+                       - (point_x - xs[index]) * (average_y - point_y))
+            if area > best_area:
+                best_area = area
+                best = index
+
+        sampled_x.append(xs[best])
+        sampled_y.append(ys[best])
+        previous = best
+
+    sampled_x.append(xs[-1])
+    sampled_y.append(ys[-1])
+    return sampled_x, sampled_y
+
+
+class _Rollup:
+    """Per-bucket session counts and metric sums for one bucket width (in local time)"""
+
+    __slots__ = ("width", "buckets", "counts", "sums")
+
+    def __init__(self, width: int):
+        self.width = width
+        self.buckets = array('q')
+        self.counts = array('I')
+        self.sums = {metric: array('d') for metric in METRICS}
+
+    def bucket_of(self, timestamp: float) -> int:
+        return int((timestamp + _utc_offset(timestamp)) // self.width)
+
+    def add(self, timestamp: float, values: Dict[str, float]) -> None:
+        bucket = self.bucket_of(timestamp)
+        if self.buckets and self.buckets[-1] == bucket:
+            position = len(self.buckets) - 1
+        elif not self.buckets or self.buckets[-1] < bucket:
+            position = len(self.buckets)
+            self._insert(position, bucket)
+        else:
+            # Out-of-order session (e.g. imported history)
+            position = bisect_left(self.buckets, bucket)
+            if position == len(self.buckets) or self.buckets[position] != bucket:
+                self._insert(position, bucket)
+
+        self.counts[position] += 1
+        for metric in METRICS:
+            self.sums[metric][position] += values[metric]
+
+    def _insert(self, position: int, bucket: int) -> None:
+        self.buckets.insert(position, bucket)
+        self.counts.insert(position, 0)
+        for sums in self.sums.values():
+            sums.insert(position, 0.0)
+
+    def _bounds(self, start: float, end: float) -> Tuple[int, int]:
+        return (bisect_left(self.buckets, self.bucket_of(start)),
+                bisect_right(self.buckets, self.bucket_of(end)))
+
+    def count_between(self, start: float, end: float) -> int:
+        first, last = self._bounds(start, end)
+        return last - first
+
+    def series(self, metric: str, start: float, end: float) -> Series:
+        first, last = self._bounds(start, end)
+        # Points sit in the middle of their bucket
+        xs = array('d', ((bucket + 0.5) * self.width - _utc_offset(bucket * self.width)
+                         for bucket in self.buckets[first:last]))
+        sums = self.sums[metric]
+        ys = array('d', (sums[i] / self.counts[i] for i in range(first, last)))
+        return xs, ys
+
+
+class SessionHistory:
+    def __init__(self, sessions: Iterable[Dict] = ()):
+        """
+        Initialize the history
+
+        Args:
+            sessions: Initial session results (dicts or records with "wpm" and "accuracy";
+                      "timestamp" defaults to now), in any order
+        """
+        self.timestamps = array('d')
+        self.values = {metric: array('d') for metric in METRICS}
+        self.rollups = (_Rollup(DAY_SECONDS), _Rollup(WEEK_SECONDS))
+
+        # Sorted first so every session appends (imported histories are often unordered)
+        now = time.time()
+        entries = sorted((self._timestamp(session, now), index, session)
+                         for index, session in enumerate(sessions))
+        for timestamp, _, session in entries:
+            self._insert(timestamp, session)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def add(self, session: Dict) -> None:
+        """
+        Add one session result
+
+        Args:
+            session: Result with "wpm", "accuracy" and optionally "timestamp" (seconds)
+        """
+        self._insert(self._timestamp(session, time.time()), session)
+
+    @staticmethod
+    def _timestamp(session: Dict, default: float) -> float:
+        return float(session.get("timestamp") or default)
+
+    def _insert(self, timestamp: float, session: Dict) -> None:
+        values = {metric: float(session.get(metric, 0.0)) for metric in METRICS}
+
+        position = len(self.timestamps)
+        if self.timestamps and timestamp < self.timestamps[-1]:
+            position = bisect_right(self.timestamps, timestamp)
+        self.timestamps.insert(position, timestamp)
+        for metric in METRICS:
+            self.values[metric].insert(position, values[metric])
+
+        for rollup in self.rollups:
+            rollup.add(timestamp, values)
+
+    def time_range(self) -> Tuple[float, float]:
+        """
+        Get the time span of the history
+
+        Returns:
+            tuple: (first, last) session timestamps, (0.0, 0.0) when empty
+        """
+        if not self.timestamps:
+            return 0.0, 0.0
+        return self.timestamps[0], self.timestamps[-1]
+
+    def get_series(self, metric: str, start: Optional[float] = None, end: Optional[float] = None,
+                   max_points: int = DEFAULT_MAX_POINTS) -> Tuple[Series, str]:
+        """
+        Get chart points for a time range
+
+        Individual sessions are used while the range holds few enough of them;
+        wider ranges read the daily or weekly rollups, so the work depends on
+        the number of points drawn rather than the number of sessions. A rollup
+        is skipped when it would leave fewer than max_points // 4 points (a few
+        dense days), and the sessions or daily values are downsampled instead.
+
+        Args:
+            metric: "wpm" or "accuracy"
+            start: Range start (first session by default)
+            end: Range end (last session by default)
+            max_points: Maximum number of points returned
+
+        Returns:
+            tuple: ((xs, ys), resolution) with resolution "session", "day" or "week"
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        first_time, last_time = self.time_range()
+        start = first_time if start is None else start
+        end = last_time if end is None else end
+
+        # Rollups are used once a resolution would need heavy downsampling,
+        # unless they are too coarse to draw (a narrow zoom over dense days)
+        budget = max_points * 4
+        minimum = max_points // ROLLUP_MIN_FRACTION
+        days, weeks = self.rollups
+        first = bisect_left(self.timestamps, start)
+        last = bisect_right(self.timestamps, end)
+        if last - first <= budget or days.count_between(start, end) < minimum:
+            xs = self.timestamps[first:last]
+            ys = self.values[metric][first:last]
+            return lttb(xs, ys, max_points), "session"
+
+        if days.count_between(start, end) <= budget or weeks.count_between(start, end) < minimum:
+            rollup, resolution = days, "day"
+        else:
+            rollup, resolution = weeks, "week"
+        xs, ys = rollup.series(metric, start, end)
+        return lttb(xs, ys, max_points), resolution
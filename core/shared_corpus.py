@@ -0,0 +1,330 @@
+"""
+Shared-Memory Corpus
+====================
+
+One copy of the passage corpus for every app process on a host:
+- A loader process publishes encoded passages and their offset index into
+  multiprocessing.shared_memory
+- App processes attach read-only and decode passages on demand
+- Sequence views plug into TextManager in place of its in-process lists
+- Custom texts added by one process go to a small local overlay; duplicate
+  checks against the shared passages use a compact hash index instead of a
+  copy of their text
+"""
+
+import atexit
+import json
+import struct
+import time
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+# Default segment name used by the loader and the app
+DEFAULT_SEGMENT_NAME = "typing_test_corpus"
+
+# Layout: header | group table (JSON, padded to 8 bytes) | offsets (int64 x count+1) | UTF-8 data
+_MAGIC = b"TTCORP01"
+_HEADER = struct.Struct("<8sQQ")
+
+CUSTOM_GROUP = "custom"
+_DEFAULT_PREFIX = "default:"
+
+
+def _attach_segment(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without letting this process unlink it on exit"""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 attaching registers the segment with this
+        # process's resource tracker, which would unlink it at exit
+        segment = shared_memory.SharedMemory(name=name)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(segment._name, "shared_memory")
+        except Exception:
+            pass
+        return segment
+
+
+class SharedTextList(Sequence):
+    """Read-only list of passages decoded from the shared segment on access"""
+
+    __slots__ = ("_corpus", "_start", "_stop", "_hashes", "_hash_positions")
+
+    def __init__(self, corpus: "SharedCorpus", start: int, stop: int):
+        self._corpus = corpus
+        self._start = start
+        self._stop = stop
+        # Sorted passage hashes and the position of each, built on the first lookup
+        self._hashes = None
+        self._hash_positions = None
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._corpus.get_passage(self._start + i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SharedTextList index out of range")
+        return self._corpus.get_passage(self._start + index)
+
+    def __contains__(self, text) -> bool:
+        if not isinstance(text, str):
+            return False
+        if self._hashes is None:
+            self._build_hash_index()
+
+        key = hash(text)
+        hashes = self._hashes
+        position = bisect_left(hashes, key)
+        while position < len(hashes) and hashes[position] == key:
+            if self[self._hash_positions[position]] == text:
+                return True
+            position += 1
+        return False
+
+    def _build_hash_index(self) -> None:
+        """Index passage hashes (12 bytes per passage) so lookups do not scan the segment"""
+        hashes = array('q', (hash(self._corpus.get_passage(index)) for index in range(self._start, self._stop)))
+        positions = sorted(range(len(hashes)), key=hashes.__getitem__)
+        self._hashes = array('q', (hashes[position] for position in positions))
+        self._hash_positions = array('I', positions)
+
+
+class OverlayTextList(Sequence):
+    """Shared passages followed by passages added by this process"""
+
+    __slots__ = ("shared", "local", "_local_set")
+
+    def __init__(self, shared: SharedTextList):
+        self.shared = shared
+        self.local: List[str] = []
+        self._local_set = set()
+
+    def __len__(self) -> int:
+        return len(self.shared) + len(self.local)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        shared_count = len(self.shared)
+        if 0 <= index < shared_count:
+            return self.shared[index]
+        if not shared_count <= index < len(self):
+            raise IndexError("OverlayTextList index out of range")
+        return self.local[index - shared_count]
+
+    def __contains__(self, text) -> bool:
+        return text in self._local_set or text in self.shared
+
+    def append(self, text: str) -> None:
+        """
+        Add a passage after the shared ones (kept in this process only)
+
+        Args:
+            text: Passage text
+        """
+        self.local.append(text)
+        self._local_set.add(text)
+
+
+class SharedCorpus:
+    def __init__(self, segment: shared_memory.SharedMemory, owner: bool = False):
+        """
+        Wrap a published corpus segment (use publish() or attach())
+
+        Args:
+            segment: Shared memory segment holding the corpus
+            owner: Whether this process created the segment (and may unlink it)
+        """
+        self.segment = segment
+        self.owner = owner
+        self._view = segment.buf.toreadonly()
+
+        magic, count, table_size = _HEADER.unpack_from(self._view, 0)
+        if magic != _MAGIC:
+            self._view.release()
+            raise ValueError(f"Shared memory segment {segment.name!r} does not hold a corpus")
+
+        table_start = _HEADER.size
+        self.groups: Dict[str, Tuple[int, int]] = {
+            name: (start, stop)
+            for name, start, stop in json.loads(str(self._view[table_start:table_start + table_size], "utf-8"))
+        }
+        offsets_start = table_start + table_size
+        offsets_end = offsets_start + 8 * (count + 1)
+        self.count = count
+        self._offsets = self._view[offsets_start:offsets_end].cast("q")
+        self._data = self._view[offsets_end:]
+        # Views must be released before the segment is closed at interpreter exit
+        atexit.register(self.close)
+
+    @classmethod
+    def publish(cls, groups: Dict[str, List[str]], name: Optional[str] = DEFAULT_SEGMENT_NAME) -> "SharedCorpus":
+        """
+        Encode passages into a new shared memory segment
+
+        Args:
+            groups: Passages by group name (see from_text_manager)
+            name: Segment name, or None for a generated one
+
+        Returns:
+            SharedCorpus: Owning handle; keep it alive while apps are attached
+
+        Raises:
+            FileExistsError: If a segment with this name already exists
+        """
+        table = []
+        encoded = []
+        offsets = [0]
+        for group_name, texts in groups.items():
+            start = len(encoded)
+            for text in texts:
+                data = text.encode("utf-8")
+                encoded.append(data)
+                offsets.append(offsets[-1] + len(data))
+            table.append((group_name, start, len(encoded)))
+
+        table_data = json.dumps(table).encode("utf-8")
+        table_data += b" " * (-len(table_data) % 8)
+        offsets_data = struct.pack(f"<{len(offsets)}q", *offsets)
+        size = _HEADER.size + len(table_data) + len(offsets_data) + offsets[-1]
+
+        segment = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        buffer = segment.buf
+        position = _HEADER.size
+        _HEADER.pack_into(buffer, 0, _MAGIC, len(encoded), len(table_data))
+        for chunk in (table_data, offsets_data, *encoded):
+            buffer[position:position + len(chunk)] = chunk
+            position += len(chunk)
+
+        return cls(segment, owner=True)
+
+    @classmethod
+    def from_text_manager(cls, text_manager, name: Optional[str] = DEFAULT_SEGMENT_NAME) -> "SharedCorpus":
+        """
+        Publish the default and custom texts of a TextManager
+
+        Args:
+            text_manager: TextManager whose texts are published
+            name: Segment name, or None for a generated one
+
+        Returns:
+            SharedCorpus: Owning handle
+        """
+        groups = {_DEFAULT_PREFIX + difficulty: texts for difficulty, texts in text_manager.default_texts.items()}
+        groups[CUSTOM_GROUP] = text_manager.costum_texts
+        return cls.publish(groups, name)
+
+    @classmethod
+    def attach(cls, name: str = DEFAULT_SEGMENT_NAME) -> "SharedCorpus":
+        """
+        Attach read-only to a corpus published by another process
+
+        Args:
+            name: Segment name
+
+        Returns:
+            SharedCorpus: Read-only handle
+
+        Raises:
+            FileNotFoundError: If no corpus is published under this name
+        """
+        return cls(_attach_segment(name))
+
+    @property
+    def name(self) -> str:
+        return self.segment.name
+
+    def get_passage(self, index: int) -> str:
+        """
+        Decode one passage
+
+        Args:
+            index: Passage index across all groups
+
+        Returns:
+            str: Passage text
+        """
+        return str(self._data[self._offsets[index]:self._offsets[index + 1]], "utf-8")
+
+    def group(self, name: str) -> SharedTextList:
+        """
+        Get the passages of one group
+
+        Args:
+            name: Group name
+
+        Returns:
+            SharedTextList: Lazily decoded passages (empty if the group is unknown)
+        """
+        start, stop = self.groups.get(name, (0, 0))
+        return SharedTextList(self, start, stop)
+
+    def default_texts(self) -> Dict[str, SharedTextList]:
+        """
+        Get default texts in TextManager.default_texts form
+
+        Returns:
+            dict: Difficulty level to passages
+        """
+        return {name[len(_DEFAULT_PREFIX):]: self.group(name)
+                for name in self.groups if name.startswith(_DEFAULT_PREFIX)}
+
+    def custom_texts(self) -> SharedTextList:
+        """
+        Get custom texts
+
+        Returns:
+            SharedTextList: Custom passages
+        """
+        return self.group(CUSTOM_GROUP)
+
+    def close(self) -> None:
+        """Detach from the segment (the owner also removes it)"""
+        if self._view is None:
+            return
+        atexit.unregister(self.close)
+        self._offsets.release()
+        self._data.release()
+        self._view.release()
+        self._view = None
+        self.segment.close()
+        if self.owner:
+            self.segment.unlink()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    try:
+        from .text_manager import TextManager
+    except ImportError:
+        from text_manager import TextManager
+
+    parser = argparse.ArgumentParser(description="Publish the passage corpus in shared memory")
+    parser.add_argument("sources", nargs="*", help="text files or directories to add as custom texts")
+    parser.add_argument("--name", default=DEFAULT_SEGMENT_NAME, help="shared memory segment name")
+    args = parser.parse_args()
+
+    manager = TextManager()
+    for source in args.sources:
+        manager.load_texts_from_source(source)
+
+    corpus = SharedCorpus.from_text_manager(manager, args.name)
+    print(f"Published {corpus.count} passages ({corpus.segment.size} bytes) as {corpus.name!r}; Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        corpus.close()
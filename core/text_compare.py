@@ -0,0 +1,184 @@
+"""
+Text Comparison
+===============
+
+Normalization and fast character comparison for scoring:
+- NFC normalization plus typographic punctuation folding (smart quotes,
+  dashes, non-breaking spaces), so visually identical text compares equal
+- Target texts are normalized once and cached per passage
+- Typed input is normalized incrementally as it grows
+- ASCII fast path comparing whole byte strings in C instead of per character
+"""
+
+import operator
+import unicodedata
+from functools import lru_cache
+
+# Passages whose normalized form is kept
+TARGET_CACHE_SIZE = 256
+
+# Typographic characters folded to what a keyboard types (one character each,
+# so offsets stay aligned with the passage)
+PUNCTUATION_FOLDING = str.maketrans({
+    "\u2018": "'", "\u2019": "'", "\u201a": "'", "\u201b": "'", "\u2032": "'",
+    "\u201c": '"', "\u201d": '"', "\u201e": '"', "\u201f": '"', "\u2033": '"',
+    "\u2010": "-", "\u2011": "-", "\u2012": "-", "\u2013": "-", "\u2014": "-", "\u2212": "-",
+    "\u00a0": " ", "\u2007": " ", "\u202f": " ", "\u2009": " "
+})
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for comparison
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        str: NFC-normalized text with typographic punctuation folded
+
+    Raises:
+        TypeError: If text is not a string
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"Expected text as str, got {type(text).__name__}")
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFC", text).translate(PUNCTUATION_FOLDING)
+
+
+@lru_cache(maxsize=TARGET_CACHE_SIZE)
+def normalize_target(text: str) -> str:
+    """
+    Normalize a passage, caching the result for repeated scoring
+
+    Args:
+        text: Passage text
+
+    Returns:
+        str: Normalized passage
+    """
+    return normalize_text(text)
+
+
+def count_matches(first: str, second: str) -> int:
+    """
+    Count positions where two normalized texts hold the same character
+
+    Only the common length is compared.
+
+    Args:
+        first: Normalized text
+        second: Normalized text
+
+    Returns:
+        int: Number of matching positions
+    """
+    length = min(len(first), len(second))
+    if not length:
+        return 0
+    first = first[:length] if len(first) > length else first
+    second = second[:length] if len(second) > length else second
+    if first == second:
+        return length
+
+    if first.isascii() and second.isascii():
+        # XOR of the byte strings is zero exactly at matching positions
+        difference = int.from_bytes(first.encode("ascii"), "big") ^ int.from_bytes(second.encode("ascii"), "big")
+        return difference.to_bytes(length, "big").count(0)
+
+    return sum(map(operator.eq, first, second))
+
+
+def _is_identity(text: str) -> bool:
+    """Check whether normalize_text leaves text unchanged"""
+    return text.isascii() or (unicodedata.is_normalized("NFC", text) and text.translate(PUNCTUATION_FOLDING) == text)
+
+
+def _is_boundary(text: str, position: int) -> bool:
+    """
+    Check whether NFC can never combine text[position] with what precedes it
+
+    A character starts a stable segment when it is a starter (combining class 0)
+    that does not compose with what precedes it. Only the adjacent starter can
+    compose with it, itself possibly composed from up to two characters
+    (Hangul leading + vowel + trailing jamo; vowel and trailing jamo have
+    NFC_Quick_Check=Maybe), so the two previous characters are checked.
+    """
+    if unicodedata.combining(text[position]):
+        return False
+    if position == 0:
+        return True
+    window = text[max(0, position - 2):position + 1]
+    return window.isascii() or unicodedata.is_normalized("NFC", window)
+
+
+class IncrementalNormalizer:
+    def __init__(self):
+        """
+        Normalize typed input as it grows, re-normalizing only the unstable tail
+
+        The input is split before its last normalization boundary (a starter
+        that cannot compose with the character before it); the normalized form
+        of everything before that boundary is final and kept between updates.
+        While the input is already normalized, which is the common case for
+        keyboard input, update() returns it as is without copying.
+
+        Updates must only change the end of the input (typing and backspace);
+        call reset() after other edits.
+
+        NFC can merge or split characters, so offsets in the normalized text
+        may differ from offsets in the raw input. The typing display marks raw
+        positions; only scoring uses the normalized text.
+        """
+        self.reset()
+
+    def update(self, raw: str) -> str:
+        """
+        Normalize the current input
+
+        Args:
+            raw: Complete input typed so far
+
+        Returns:
+            str: Normalized input (raw itself when normalization changes nothing)
+        """
+        stable = self._stable_length
+        if len(raw) <= stable:
+            # Backspace into the stable part: back up to a boundary still inside the input
+            stable = len(raw) - 1
+            while stable > 0 and not _is_boundary(raw, stable):
+                stable -= 1
+            stable = max(stable, 0)
+            if self._stable_normalized is not None:
+                # The normalized length of the shortened prefix is unknown: start over
+                self._stable_normalized = None if _is_identity(raw[:stable]) else normalize_text(raw[:stable])
+            self._stable_length = stable
+        self.raw = raw
+
+        # Move the boundary to the last starter that cannot compose backwards
+        boundary = len(raw) - 1
+        if raw[stable:].isascii():
+            boundary = max(stable, boundary)
+        else:
+            while boundary > stable and not _is_boundary(raw, boundary):
+                boundary -= 1
+        if boundary > stable:
+            segment = raw[stable:boundary]
+            if self._stable_normalized is None and not _is_identity(segment):
+                self._stable_normalized = raw[:stable]
+            if self._stable_normalized is not None:
+                self._stable_normalized += normalize_text(segment)
+            self._stable_length = stable = boundary
+
+        tail = raw[stable:]
+        if self._stable_normalized is None:
+            return raw if _is_identity(tail) else raw[:stable] + normalize_text(tail)
+        return self._stable_normalized + normalize_text(tail)
+
+    def reset(self) -> None:
+        """Forget the input (e.g. when a new test starts)"""
+        self.raw = ""
+        self._stable_length = 0
+        # Normalized form of raw[:_stable_length], None while it equals the raw text
+        self._stable_normalized = None
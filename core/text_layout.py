@@ -0,0 +1,140 @@
+"""
+Text Layout Helpers
+===================
+
+Precomputed layout data for passages:
+- Word start/end offsets and an offset-to-word lookup table
+- Word-wrapped line start offsets for a fixed column width
+"""
+
+import re
+from array import array
+from bisect import bisect_right
+from typing import Tuple
+
+_WORD_PATTERN = re.compile(r'\S+')
+
+
+def word_spans(text: str) -> Tuple[array, array]:
+    """
+    Compute the start and end offsets of every word
+
+    Args:
+        text: Passage text
+
+    Returns:
+        tuple: (starts, ends) arrays, word i is text[starts[i]:ends[i]]
+    """
+    starts = array('I')
+    ends = array('I')
+    for match in _WORD_PATTERN.finditer(text):
+        starts.append(match.start())
+        ends.append(match.end())
+    return starts, ends
+
+
+class WordIndex:
+    __slots__ = ("text", "starts", "ends", "char_words")
+
+    def __init__(self, text: str):
+        """
+        Word boundaries of a passage with O(1) offset-to-word lookup
+
+        Args:
+            text: Passage text
+        """
+        self.text = text
+        self.starts, self.ends = word_spans(text)
+        # Word index of every character offset (-1 for whitespace)
+        self.char_words = array('i', [-1]) * len(text)
+        for word, (start, end) in enumerate(zip(self.starts, self.ends)):
+            self.char_words[start:end] = array('i', [word]) * (end - start)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def word_at(self, offset: int) -> int:
+        """
+        Get the word containing a character offset
+
+        Args:
+            offset: Character offset
+
+        Returns:
+            int: Word index, or -1 for whitespace and offsets outside the text
+        """
+        if 0 <= offset < len(self.char_words):
+            return self.char_words[offset]
+        return -1
+
+    def word(self, index: int) -> str:
+        """
+        Get the text of a word
+
+        Args:
+            index: Word index
+
+        Returns:
+            str: Word text
+        """
+        return self.text[self.starts[index]:self.ends[index]]
+
+    def word_length(self, index: int) -> int:
+        return self.ends[index] - self.starts[index]
+
+
+def wrap_lines(text: str, width: int) -> array:
+    """
+    Word-wrap text to a column width
+
+    Lines break after whitespace when possible; words longer than the width
+    are split. A newline always starts a new line and stays at the end of
+    the previous one.
+
+    Args:
+        text: Passage text
+        width: Maximum number of characters per line
+
+    Returns:
+        array: Start offset of every line (the first is always 0)
+    """
+    if width < 1:
+        raise ValueError(f"Invalid line width: {width}")
+
+    line_starts = array('I', [0])
+    line_start = 0
+    break_at = 0
+    length = len(text)
+    position = 0
+
+    while position < length:
+        char = text[position]
+        if char == '\n':
+            line_start = break_at = position + 1
+            line_starts.append(line_start)
+        elif position - line_start >= width and not char.isspace():
+            # The line is full: break after the last whitespace, or hard-break
+            line_start = break_at if break_at > line_start else position
+            line_starts.append(line_start)
+        elif char.isspace():
+            break_at = position + 1
+        position += 1
+
+    if line_starts[-1] >= length and len(line_starts) > 1:
+        line_starts.pop()
+
+    return line_starts
+
+
+def line_of_offset(line_starts: array, offset: int) -> int:
+    """
+    Get the line containing a character offset
+
+    Args:
+        line_starts: Result of wrap_lines
+        offset: Character offset
+
+    Returns:
+        int: Line index
+    """
+    return bisect_right(line_starts, offset) - 1
@@ -1,7 +1,261 @@
 import random
 import re
-from typing import List, Optional
-from contracts.i_text_manager import iTextManager
+import threading
+from collections.abc import Sequence
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+# Handle imports for both standalone and module execution
+try:
+    from .contracts.i_text_manager import iTextManager
+except ImportError:
+    import sys
+    import os
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, current_dir)
+    from contracts.i_text_manager import iTextManager
+
+try:
+    from .ngram_index import NgramIndex, WeakNgrams
+    from .text_search import TextSearchIndex
+    from .text_sources import iter_source_files, iter_text_chunks
+    from .resource_monitor import track_instance
+    from .shared_corpus import OverlayTextList, SharedCorpus
+    from .passage_sampler import DEFAULT_REPEAT_WINDOW, PassageSampler
+    from .text_layout import WordIndex
+    from .metrics import CORPUS_TEXTS
+except ImportError:
+    from ngram_index import NgramIndex, WeakNgrams
+    from text_search import TextSearchIndex
+    from text_sources import iter_source_files, iter_text_chunks
+    from resource_monitor import track_instance
+    from shared_corpus import OverlayTextList, SharedCorpus
+    from passage_sampler import DEFAULT_REPEAT_WINDOW, PassageSampler
+    from text_layout import WordIndex
+    from metrics import CORPUS_TEXTS
+
+# Max length for each segment produced from large texts
+MAX_SEGMENT_LENGTH = 200
+
+# Sentence-ending punctuation followed by space/newline
+SENTENCE_BOUNDARY_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# Words whose trailing period does not end a sentence (lowercase, without the final period)
+ABBREVIATIONS = frozenset({
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "vs",
+    "e.g", "i.e", "cf", "al", "approx", "dept", "est", "fig", "inc",
+    "ltd", "co", "corp", "vol", "jan", "feb", "mar", "apr",
+    "jun", "jul", "aug", "sep", "sept", "oct", "nov", "dec"
+})
+MAX_ABBREVIATION_LENGTH = max(len(word) for word in ABBREVIATIONS) + 2
+
+# Longest text without a sentence boundary kept while streaming before it is cut
+MAX_PENDING_SENTENCE_LENGTH = 1024 * 1024
+
+# Custom texts analyzed per step of the difficulty index (a page request or a
+# background batch), so no single call analyzes the whole library
+DIFFICULTY_INDEX_BATCH = 2000
+
+
+def ends_with_abbreviation(content: str, start: int, end: int) -> bool:
+    """
+    Check whether the word ending at content[end - 1] is a known abbreviation
+
+    Args:
+        content: Block of text
+        start: Start of the current sentence
+        end: Position just after the sentence-ending punctuation
+
+    Returns:
+        bool: True if the punctuation belongs to an abbreviation
+    """
+    if content[end - 1] != '.':
+        return False
+
+    # Walk back over the last word only, abbreviations are short
+    word_start = end - 1
+    limit = max(start, end - 1 - MAX_ABBREVIATION_LENGTH)
+    while word_start > limit and not content[word_start - 1].isspace():
+        word_start -= 1
+
+    if word_start > start and not content[word_start - 1].isspace():
+        return False
+
+    word = content[word_start:end - 1].lstrip('(\'"').lower()
+    return word in ABBREVIATIONS
+
+
+def format_text(text: str) -> str:
+    """
+    Format text by stripping extra spaces and normalizing whitespace
+
+    Args:
+        text: Raw text to format
+
+    Returns:
+        str: Formatted text ending with sentence punctuation
+    """
+    if not text:
+        return ""
+
+    # Remove leading/trailing whitespace and normalize internal spaces
+    text = re.sub(r'\s+', ' ', text.strip())
+
+    if text and text[-1] not in {'.', '!', '?'}:
+        text += '.'
+
+    return text
+
+
+def iter_sentences_from_chunks(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Scan streamed text once and yield its sentences
+
+    The unfinished sentence at the end of a chunk is carried over to the
+    next one (up to MAX_PENDING_SENTENCE_LENGTH characters).
+
+    Args:
+        chunks: Consecutive pieces of one text
+
+    Yields:
+        str: Stripped sentences, abbreviations do not end a sentence
+    """
+    tail = ""
+    for chunk in chunks:
+        content = tail + chunk if tail else chunk
+        start = 0
+        # Boundaries inside the carried-over tail were already checked, so
+        # each character is scanned once however long the tail grows
+        for match in SENTENCE_BOUNDARY_PATTERN.finditer(content, len(tail)):
+            if ends_with_abbreviation(content, start, match.start()):
+                continue
+
+            sentence = content[start:match.start()].strip()
+            start = match.end()
+            if sentence:
+                yield sentence
+
+        tail = content[start:]
+        if len(tail) > MAX_PENDING_SENTENCE_LENGTH:
+            sentence = tail.strip()
+            tail = ""
+            if sentence:
+                yield sentence
+
+    sentence = tail.strip()
+    if sentence:
+        yield sentence
+
+
+def pack_segments(sentences: Iterable[str]) -> Iterator[str]:
+    """
+    Pack sentences into segments without building intermediate strings
+
+    Args:
+        sentences: Stripped sentences
+
+    Yields:
+        str: Formatted text segments of at most MAX_SEGMENT_LENGTH characters
+             (a single longer sentence is kept whole)
+    """
+    parts = []
+    current_length = 0
+
+    for sentence in sentences:
+        if parts and current_length + 1 + len(sentence) > MAX_SEGMENT_LENGTH:
+            yield format_text(" ".join(parts))
+            parts = [sentence]
+            current_length = len(sentence)
+        else:
+            current_length += len(sentence) + 1 if parts else len(sentence)
+            parts.append(sentence)
+
+    if parts:
+        yield format_text(" ".join(parts))
+
+
+def iter_text_segments(content: str) -> Iterator[str]:
+    """
+    Lazily split a block of text into formatted segments
+
+    Args:
+        content: Large block of text
+
+    Yields:
+        str: Formatted text segments (see pack_segments)
+    """
+    return pack_segments(iter_sentences_from_chunks((content,)))
+
+
+def text_statistics(text: str, word_index: Optional[WordIndex] = None) -> dict:
+    """
+    Get statistics of a text
+
+    Args:
+        text: Text to analyze
+        word_index: Precomputed word boundaries of the text, if available
+
+    Returns:
+        dict: Statistics including character count, word count and estimated difficulty
+    """
+    if not text:
+        return {}
+
+    if word_index is not None:
+        word_count = len(word_index)
+        word_characters = sum(word_index.ends) - sum(word_index.starts)
+    else:
+        words = text.split()
+        word_count = len(words)
+        word_characters = sum(map(len, words))
+
+    # Calculate word count(including spaces)
+    total_characters = word_count
+
+    # Calculate character count (excluding spaces)
+    chars_no_spaces = len(text) - text.count(" ")
+
+    # count sentences
+    sentences = re.split(r'[.!?]+', text)
+    sentence_count = len([s for s in sentences if s.strip()])
+
+    # Average word length
+    avg_word_length = word_characters / word_count if word_count > 0 else 0
+
+    # Estimated difificulty level based on average word length
+    if avg_word_length < 4:
+        estimated_difficulty = "easy"
+    elif avg_word_length < 6:
+        estimated_difficulty = "medium"
+    else:
+        estimated_difficulty = "hard"
+
+    return {"total_characters": total_characters, "chars_no_spaces": chars_no_spaces, "word_count": word_count, "sentence_count": sentence_count, "avg_word_length": avg_word_length, "estimated_difficulty": estimated_difficulty}
+
+
+class CorpusPassages(Sequence):
+    """Default texts (in difficulty order) then custom texts of a TextManager, by passage ID"""
+
+    __slots__ = ("_text_manager",)
+
+    def __init__(self, text_manager: "TextManager"):
+        self._text_manager = text_manager
+
+    def __len__(self) -> int:
+        return self._text_manager.count_texts()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            for texts in self._text_manager.default_texts.values():
+                if index < len(texts):
+                    return texts[index]
+                index -= len(texts)
+            if index < len(self._text_manager.costum_texts):
+                return self._text_manager.costum_texts[index]
+        raise IndexError("Passage ID out of range")
 
 
 class TextManager(iTextManager):
@@ -13,9 +267,33 @@ class TextManager(iTextManager):
             texts: Optional list of texts to manage
         """
         self.costum_texts = texts or []
+        self._costum_text_set = set(self.costum_texts)
         self.current_text = ""
         self.default_texts = self._load_default_texts()
         self.difficulty_level = "medium"
+        # Indexes refer to passages by ID instead of holding copies
+        self.passages = CorpusPassages(self)
+        self.ngram_index = None
+        self.search_index = None
+        self.search_index_path = None
+        # Estimated difficulty of the first custom texts (built incrementally, see _index_costum_difficulties)
+        self._costum_difficulties: List[Optional[str]] = []
+        self._costum_difficulty_index = {}
+        self._difficulty_lock = threading.Lock()
+        self._difficulty_thread = None
+        self.shared_corpus = None
+        # Word boundaries of current_text, computed when a passage is selected
+        self.word_index: Optional[WordIndex] = None
+        # One weighted sampler per text pool (None for custom texts, else the difficulty)
+        self.text_weight: Optional[Callable[[str], float]] = None
+        self.repeat_window = DEFAULT_REPEAT_WINDOW
+        self.sampling_seed: Optional[int] = None
+        self._samplers = {}
+        self._sampler_lock = threading.Lock()
+        # Called without arguments whenever texts are added, cleared or replaced
+        self._corpus_listeners: List[Callable[[], None]] = []
+        self._corpus_changed()
+        track_instance(self)
 
     def _load_default_texts(self) -> dict:
         """Load default texts categorized by difficulty levels"""
@@ -57,16 +335,291 @@ class TextManager(iTextManager):
         Returns:
             str: Randomly selected text
         """
-        if self.costum_texts:
-            text = random.choice(self.costum_texts)
-        else:
-            texts = self.default_texts.get(self.difficulty_level, [])
-            text = random.choice(texts) if texts else ""
+        text = self.choose_text()
+        self.select_text(text)
+        return text
+
+    def select_text(self, text: str, word_index: Optional[WordIndex] = None) -> WordIndex:
+        """
+        Make a text the current passage and precompute its word boundaries
 
+        Args:
+            text: Passage text
+            word_index: Already computed word index of the text (e.g. from the prefetcher)
+
+        Returns:
+            WordIndex: Word index of the passage
+        """
         self.current_text = text
-        return text
+        if word_index is None or word_index.text != text:
+            word_index = self.get_word_index(text)
+        self.word_index = word_index
+        return word_index
+
+    def get_word_index(self, text: Optional[str] = None) -> WordIndex:
+        """
+        Get the word boundaries of a text (reused for the current passage)
+
+        Args:
+            text: Text to index; current_text by default
+
+        Returns:
+            WordIndex: Word start/end offsets and offset-to-word lookup
+        """
+        if text is None:
+            text = self.current_text
+        if self.word_index is not None and self.word_index.text == text:
+            return self.word_index
+        return WordIndex(text)
+
+    def choose_text(self, difficulty: Optional[str] = None) -> str:
+        """
+        Pick a random text without changing current_text (safe to call from worker threads)
+        
+        Args:
+            difficulty: Optional difficulty level; by default custom texts are preferred,
+                        then default texts of the current difficulty level
+        
+        Returns:
+            str: Randomly selected text
+        """
+        if difficulty is None and self.costum_texts:
+            pool, texts = None, self.costum_texts
+        else:
+            pool = difficulty or self.difficulty_level
+            texts = self.default_texts.get(pool, [])
+
+        if not texts:
+            return ""
+        try:
+            return texts[self._get_sampler(pool, texts).draw()]
+        except IndexError:
+            # Every text of the pool has a zero weight
+            return ""
+
+    def choose_formatted_text(self, difficulty: Optional[str] = None) -> str:
+        """
+        Pick a random text as choose_text does, formatted for display
+
+        Args:
+            difficulty: Optional difficulty level (see choose_text)
+
+        Returns:
+            str: Formatted text
+        """
+        return self._formated_text(self.choose_text(difficulty))
+
+    def set_text_sampling(self, weight: Optional[Callable[[str], float]] = None,
+                          repeat_window: int = DEFAULT_REPEAT_WINDOW, seed: Optional[int] = None) -> None:
+        """
+        Configure how texts are picked
+
+        Args:
+            weight: Function giving a text's non-negative weight (uniform by default),
+                    e.g. from make_text_weight
+            repeat_window: Number of most recent texts of a pool excluded from the next pick
+            seed: Random seed for reproducible selections (e.g. exam papers)
+        """
+        with self._sampler_lock:
+            self.text_weight = weight
+            self.repeat_window = repeat_window
+            self.sampling_seed = seed
+            self._samplers = {}
+
+    def make_text_weight(self, difficulty_weights: Optional[dict] = None,
+                         preferred_length: Optional[int] = None) -> Callable[[str], float]:
+        """
+        Build a weight function for set_text_sampling
+
+        Args:
+            difficulty_weights: Weight factor per estimated difficulty (missing levels count 1.0)
+            preferred_length: Texts closer to this length (characters) are weighted higher
+
+        Returns:
+            Callable[[str], float]: Weight function
+        """
+        def weight(text: str) -> float:
+            value = 1.0
+            if difficulty_weights:
+                difficulty = self.get_text_statistics(text).get("estimated_difficulty")
+                value *= difficulty_weights.get(difficulty, 1.0)
+            if preferred_length:
+                value /= 1.0 + abs(len(text) - preferred_length) / preferred_length
+            return value
+
+        return weight
+
+    def _get_sampler(self, pool: Optional[str], texts) -> PassageSampler:
+        """Get the sampler of a text pool, (re)building it if the pool was resized"""
+        with self._sampler_lock:
+            sampler = self._samplers.get(pool)
+            if sampler is None or len(sampler) != len(texts):
+                weights = [self.text_weight(text) for text in texts] if self.text_weight else [1.0] * len(texts)
+                seed = None if self.sampling_seed is None else f"{self.sampling_seed}:{pool}"
+                sampler = self._samplers[pool] = PassageSampler(weights, self.repeat_window, seed)
+            return sampler
+
+    def _drop_samplers(self, pools: Optional[Iterable[Optional[str]]] = None) -> None:
+        """
+        Forget the weights and recent picks of replaced text pools
+
+        Args:
+            pools: Pools to drop (None for custom texts, else a difficulty); all by default
+        """
+        with self._sampler_lock:
+            if pools is None:
+                self._samplers = {}
+            else:
+                for pool in pools:
+                    self._samplers.pop(pool, None)
     
     
+    def attach_shared_corpus(self, name: Optional[str] = None) -> SharedCorpus:
+        """
+        Read default and custom texts from a corpus published in shared memory
+
+        Passages are decoded on access instead of being held in this process.
+        Custom texts added afterwards are kept locally on top of the shared ones.
+
+        Args:
+            name: Segment name (the loader's default by default)
+
+        Returns:
+            SharedCorpus: Attached corpus
+
+        Raises:
+            FileNotFoundError: If no corpus is published under this name
+        """
+        corpus = SharedCorpus.attach(name) if name else SharedCorpus.attach()
+        self.shared_corpus = corpus
+        self.default_texts = corpus.default_texts()
+        self.costum_texts = OverlayTextList(corpus.custom_texts())
+        # The overlay answers membership itself, without copying the shared texts
+        self._costum_text_set = None
+        self._reset_costum_difficulties()
+        # Rebuilt on next use over the shared passages
+        self.ngram_index = None
+        self.search_index = None
+        self._drop_samplers()
+        self._corpus_changed()
+        return corpus
+
+    def build_ngram_index(self) -> NgramIndex:
+        """
+        Build the character n-gram index over default and custom texts
+
+        Custom texts added afterwards are indexed incrementally.
+
+        Returns:
+            NgramIndex: The index (passage IDs follow default then custom order)
+        """
+        index = NgramIndex(passages=self.passages)
+        for text in self.passages:
+            index.add_passage(text)
+
+        self.ngram_index = index
+        return index
+
+    def get_text_for_weak_ngrams(self, weak_ngrams: WeakNgrams, candidates: int = 5) -> str:
+        """
+        Get a text that practices the given weak character n-grams
+
+        Args:
+            weak_ngrams: Bigrams/trigrams to practice, optionally mapped to weights
+            candidates: Number of best-covering passages to choose from
+
+        Returns:
+            str: Selected text, or a random text if no passage matches
+        """
+        if self.ngram_index is None:
+            self.build_ngram_index()
+
+        best = self.ngram_index.find_best_passages(weak_ngrams, limit=candidates)
+        if not best:
+            return self.get_random_text()
+
+        passage_id, _ = random.choice(best)
+        text = self.ngram_index.get_passage(passage_id)
+        self.select_text(text)
+        return text
+
+    def enable_search_index(self, index_path: Optional[str] = None) -> TextSearchIndex:
+        """
+        Enable full-text search over default and custom texts
+
+        A previously saved index is reused and only passages missing from it
+        are indexed. Custom texts added afterwards are indexed incrementally.
+
+        Args:
+            index_path: Optional path where the index is persisted
+
+        Returns:
+            TextSearchIndex: The search index
+        """
+        index = TextSearchIndex.load(index_path, self.passages) if index_path else None
+        if index is None:
+            index = TextSearchIndex(self.passages)
+
+        for passage_id in range(len(index), len(self.passages)):
+            index.add_document(self.passages[passage_id])
+
+        self.search_index = index
+        self.search_index_path = index_path
+        return index
+
+    def search_texts(self, query: str, limit: int = 20, difficulty: Optional[str] = None) -> List[str]:
+        """
+        Search passages by words, the last word may be incomplete
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            difficulty: Optional difficulty level (custom texts use their estimated difficulty)
+
+        Returns:
+            List[str]: Matching passages, best match first
+        """
+        if self.search_index is None:
+            self.enable_search_index(self.search_index_path)
+
+        document_filter = None
+        if difficulty is not None:
+            # Passage IDs of the difficulty: one range of default texts plus the matching custom texts
+            first = last = 0
+            for level, texts in self.default_texts.items():
+                if level == difficulty:
+                    last = first + len(texts)
+                    break
+                first += len(texts)
+            custom_start = self._default_text_count()
+
+            def document_filter(passage_id: int) -> bool:
+                if passage_id < custom_start:
+                    return first <= passage_id < last
+                return self._costum_difficulty(passage_id - custom_start) == difficulty
+
+        return [self.search_index.get_document(document_id)
+                for document_id, _ in self.search_index.search(query, limit, document_filter=document_filter)]
+
+    def save_search_index(self) -> bool:
+        """
+        Persist the search index to the path given to enable_search_index
+
+        Custom texts are saved too. When they differ at the next start (e.g.
+        they are imported again in another order), the postings of the default
+        texts are still reused and only the custom texts are indexed again.
+
+        Returns:
+            bool: True if the index was saved successfully
+        """
+        if self.search_index is None or not self.search_index_path:
+            return False
+        return self.search_index.save(self.search_index_path, prefixes=[self._default_text_count()])
+
+    def _default_text_count(self) -> int:
+        """Number of default texts (custom texts follow them in passage ID order)"""
+        return sum(len(texts) for texts in self.default_texts.values())
+
     def set_difficulty_level(self, difficulty: str) -> None:
         """
         Set the difficulty level for text selection
@@ -102,10 +655,9 @@ class TextManager(iTextManager):
         if difficulty not in self.default_texts:
             difficulty = "medium"
             
-        texts = self.default_texts[difficulty]
-        text = random.choice(texts)
-        self.current_text = text
-        return self._format_text(text)
+        text = self.choose_formatted_text(difficulty)
+        self.select_text(text)
+        return text
     
     
     def get_available_difficulty_levels(self) -> List[str]:
@@ -131,57 +683,136 @@ class TextManager(iTextManager):
         if not text or not text.strip():
             return False
         
-        formatted_text = self._formated_text(text)
-        if formatted_text not in self.costum_texts:
-            self.costum_texts.append(formatted_text)
-            return True
-        
-        return False
-    
-    def _formated_text(self, text: str) -> str:
-        """Format text by stripping extra spaces and normalizing whitespace
-        
+        added = self._append_costum_text(self._formated_text(text))
+        if added:
+            self._corpus_changed()
+        return added
+
+    def add_costum_texts(self, texts: Iterable[str]) -> int:
+        """
+        Add many already formatted texts to the collection
+
         Args:
-            text: Raw text to format
-            
+            texts: Formatted texts to add (e.g. from the corpus pipeline)
+
         Returns:
-            str: Formatted text
+            int: Number of texts added
         """
-        if not text:
-            return ""
-        
-        # Remove leading/trailing whitespace and normalize internal spaces
-        text = re.sub(r'\s+', ' ', text.strip())
+        added = 0
+        for text in texts:
+            if text and self._append_costum_text(text):
+                added += 1
 
-        if text and text[-1] not in {'.', '!', '?'}:
-            text += '.'
-        
-        return text
+        if added:
+            self._corpus_changed()
+        return added
+
+    def add_analyzed_texts(self, items: Iterable[Tuple[str, dict]]) -> int:
+        """
+        Add formatted texts together with statistics computed elsewhere
+
+        The estimated difficulty in each text's statistics goes straight into
+        the difficulty index (when it is up to date), so the texts are not
+        analyzed again.
+
+        Args:
+            items: (formatted text, get_text_statistics result) pairs, e.g. from the corpus pipeline
+
+        Returns:
+            int: Number of texts added
+        """
+        added = 0
+        for text, statistics in items:
+            if text and self._append_costum_text(text, statistics.get("estimated_difficulty")):
+                added += 1
+
+        if added:
+            self._corpus_changed()
+        return added
+
+    def _append_costum_text(self, formatted_text: str, difficulty: Optional[str] = None) -> bool:
+        """Append a formatted custom text unless it is already known
+
+        Args:
+            formatted_text: Text already passed through _formated_text
+            difficulty: Estimated difficulty if already known
+
+        Returns:
+            bool: True if the text was appended
+        """
+        known = self.costum_texts if self._costum_text_set is None else self._costum_text_set
+        if formatted_text in known:
+            return False
+
+        if self._costum_text_set is not None:
+            self._costum_text_set.add(formatted_text)
+        self.costum_texts.append(formatted_text)
+        if difficulty is not None:
+            with self._difficulty_lock:
+                # Texts behind a pending backlog are analyzed when the index catches up
+                if len(self._costum_difficulties) == len(self.costum_texts) - 1:
+                    self._record_costum_difficulty(difficulty)
+        if self.ngram_index is not None:
+            self.ngram_index.add_passage(formatted_text)
+        if self.search_index is not None:
+            self.search_index.add_document(formatted_text)
+        sampler = self._samplers.get(None)
+        if sampler is not None and len(sampler) == len(self.costum_texts) - 1:
+            sampler.add(self.text_weight(formatted_text) if self.text_weight else 1.0)
+        return True
+    
+    def _formated_text(self, text: str) -> str:
+        """Format text by stripping extra spaces and normalizing whitespace (see format_text)"""
+        return format_text(text)
     
     def load_texts_from_file(self, file_path: str) -> bool:
         """
         Load texts from a file, one text per line
         
         Args:
-            file_path: Path to the text file
+            file_path: Path to the text file (plain or .gz/.bz2/.xz compressed)
         Returns:
             bool: True if texts were loaded successfully
         """
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = file.read()
-
-            texts = self._split_text_into_segments(lines)
-
-            for text in texts:
-                self.add_costum_text(text)
+            segment_count = 0
+            for text in self._iter_text_segments_from_chunks(iter_text_chunks(file_path)):
+                self._append_costum_text(text)
+                segment_count += 1
 
-            return len(texts) > 0
+            return segment_count > 0
 
         except Exception as e:
             print(f"Error loading texts from file: {e}")
             return False
+        finally:
+            self._corpus_changed()
+
+    def load_texts_from_source(self, source_path: str) -> int:
+        """
+        Stream texts from a file or a directory of (compressed) text files
+
+        Files are decompressed and decoded chunk by chunk, so large archives
+        are never fully held in memory or extracted to disk.
+
+        Args:
+            source_path: File, or directory walked recursively
+        Returns:
+            int: Number of texts added
+        """
+        added = 0
+        for file_path in iter_source_files(source_path):
+            try:
+                for text in self._iter_text_segments_from_chunks(iter_text_chunks(file_path)):
+                    if self._append_costum_text(text):
+                        added += 1
+            except Exception as e:
+                print(f"Error loading texts from {file_path}: {e}")
+
+        if added:
+            self._corpus_changed()
+        return added
     
     def _split_text_into_segments(self, content: str) -> List[str]:
         """Split large text into smaller segments based on punctuation
@@ -192,28 +823,49 @@ class TextManager(iTextManager):
         Returns:
             List[str]: List of text segments
         """
-        # Split by sentence-ending punctuation followed by space/newline
-        sentences = re.split(r'(?<=[.!?])\s+', content)
-        segments = []
-        
-        current_segment = ""
-        max_length = 200  # Max length for each segment
+        return list(self._iter_text_segments(content))
 
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
+    def _iter_text_segments(self, content: str) -> Iterator[str]:
+        """Lazily split large text into formatted segments
 
-            if current_segment and len(current_segment+" "+sentence) > max_length:
-                segments.append(self._formated_text(current_segment))
-                current_segment = sentence
-            else:
-                current_segment += " " + sentence if current_segment else sentence
+        Args:
+            content: Large block of text
+
+        Yields:
+            str: Formatted text segments of at most MAX_SEGMENT_LENGTH characters
+                 (a single longer sentence is kept whole)
+        """
+        return self._pack_segments(self._iter_sentences(content))
+
+    def _iter_text_segments_from_chunks(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Lazily split streamed text into formatted segments
 
-        if current_segment:
-            segments.append(self._formated_text(current_segment))
+        Args:
+            chunks: Consecutive pieces of one text
+
+        Yields:
+            str: Formatted text segments, as _iter_text_segments would for the joined text
+        """
+        return self._pack_segments(self._iter_sentences_from_chunks(chunks))
 
-        return segments
+    def _iter_sentences(self, content: str) -> Iterator[str]:
+        """Scan text once and yield its sentences
+
+        Args:
+            content: Block of text
+
+        Yields:
+            str: Stripped sentences, abbreviations do not end a sentence
+        """
+        return self._iter_sentences_from_chunks((content,))
+
+    def _iter_sentences_from_chunks(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Scan streamed text once and yield its sentences (see iter_sentences_from_chunks)"""
+        return iter_sentences_from_chunks(chunks)
+
+    def _pack_segments(self, sentences: Iterable[str]) -> Iterator[str]:
+        """Pack sentences into formatted segments (see pack_segments)"""
+        return pack_segments(sentences)
     
     def get_text_statistics(self, text: str = None) -> dict:
         """
@@ -227,52 +879,180 @@ class TextManager(iTextManager):
         """
         if text is None:
             text = self.current_text
+        # Word lengths come from the precomputed boundaries of the current passage
+        word_index = self.word_index if self.word_index is not None and self.word_index.text == text else None
+        return text_statistics(text, word_index)
 
-        if not text:
-            return {}
+    def get_all_texts(self) -> dict:
+        """
+        Get all available texts organized by source
         
-        # Calculate word count(including spaces)
-        words = text.split()
-        total_characters = len(words)
+        Returns:
+            dict: All texts organized by source and difficulty
+        """
+        return {
+            "default": self.default_texts,
+            "custom": self.costum_texts
+        }
+
+    def count_texts(self, difficulty: Optional[str] = None) -> int:
+        """
+        Count default and custom texts, optionally filtered by difficulty
 
-        # Calculate character count (excluding spaces)
-        chars_no_spaces = len(text.replace(" ", ""))
+        Args:
+            difficulty: Optional difficulty level (custom texts use their estimated
+                        difficulty; only custom texts analyzed so far are counted,
+                        see get_difficulty_index_progress)
 
-        # Calculate word count (including spaces)
-        word_count = len(text.split())
+        Returns:
+            int: Number of matching texts
+        """
+        if difficulty is None:
+            return sum(len(texts) for texts in self.default_texts.values()) + len(self.costum_texts)
 
-        # count sentences
-        sentences = re.split(r'[.!?]+', text)
-        sentence_count = len([s for s in sentences if s.strip()])
+        default_count = len(self.default_texts.get(difficulty, []))
+        return default_count + len(self._costum_difficulty_index.get(difficulty, ()))
+
+    def get_texts_page(self, offset: int = 0, limit: int = 50, difficulty: Optional[str] = None) -> List[str]:
+        """
+        Get one page of texts without copying the whole collection
 
-        # Average word length
-        avg_word_length = sum(len(word) for word in words) / word_count if word_count > 0 else 0
+        Default texts come first (in difficulty order), followed by custom texts.
+        With a difficulty filter, custom texts are paged over as far as the
+        difficulty index is built; each call analyzes at most one more batch.
 
-        # Estimated difificulty level based on average word length
-        if avg_word_length < 4:
-            estimated_difficulty = "easy"
-        elif avg_word_length < 6:
-            estimated_difficulty = "medium"
+        Args:
+            offset: Index of the first text of the page
+            limit: Maximum number of texts in the page
+            difficulty: Optional difficulty level (custom texts use their estimated difficulty)
+
+        Returns:
+            List[str]: Texts of the page
+        """
+        if offset < 0 or limit <= 0:
+            return []
+
+        if difficulty is None:
+            default_texts = [text for texts in self.default_texts.values() for text in texts]
         else:
-            estimated_difficulty = "hard"
+            default_texts = self.default_texts.get(difficulty, [])
 
-        return {"total_characters": total_characters, "chars_no_spaces": chars_no_spaces, "word_count": word_count, "sentence_count": sentence_count, "avg_word_length": avg_word_length, "estimated_difficulty": estimated_difficulty}
+        page = default_texts[offset:offset + limit]
+        custom_offset = max(0, offset - len(default_texts))
+        remaining = limit - len(page)
+        if remaining <= 0:
+            return page
 
-    def get_all_texts(self) -> dict:
+        if difficulty is None:
+            page.extend(self.costum_texts[custom_offset:custom_offset + remaining])
+        else:
+            self._index_costum_difficulties(DIFFICULTY_INDEX_BATCH, difficulty, custom_offset + remaining)
+            positions = self._costum_difficulty_index.get(difficulty, [])
+            page.extend(self.costum_texts[position]
+                        for position in positions[custom_offset:custom_offset + remaining])
+
+        return page
+
+    def get_difficulty_index_progress(self) -> Tuple[int, int]:
         """
-        Get all available texts organized by source
-        
+        Get how far the custom text difficulty index is built
+
         Returns:
-            dict: All texts organized by source and difficulty
+            tuple: (custom texts analyzed, custom texts)
         """
-        return {
-            "default": self.default_texts,
-            "custom": self.custom_texts
-        }
+        return len(self._costum_difficulties), len(self.costum_texts)
+
+    def index_difficulties_in_background(self) -> bool:
+        """
+        Analyze the remaining custom texts on a worker thread, one batch at a time
+
+        Filtered counts and pages grow as batches complete (see
+        get_difficulty_index_progress).
+
+        Returns:
+            bool: True if texts remain to be analyzed
+        """
+        if len(self._costum_difficulties) >= len(self.costum_texts):
+            return False
+        if self._difficulty_thread is None or not self._difficulty_thread.is_alive():
+            self._difficulty_thread = threading.Thread(target=self._index_remaining_difficulties,
+                                                       name="difficulty-index", daemon=True)
+            self._difficulty_thread.start()
+        return True
+
+    def _index_remaining_difficulties(self) -> None:
+        while self._index_costum_difficulties(DIFFICULTY_INDEX_BATCH):
+            pass
+
+    def _index_costum_difficulties(self, limit: int, difficulty: Optional[str] = None, wanted: int = 0) -> bool:
+        """
+        Analyze the next custom texts into the difficulty index
+
+        Args:
+            limit: Maximum number of texts analyzed by this call
+            difficulty: Stop early once this difficulty has wanted positions
+            wanted: Number of positions wanted for difficulty
+
+        Returns:
+            bool: True if texts remain to be analyzed
+        """
+        with self._difficulty_lock:
+            texts = self.costum_texts
+            analyzed = 0
+            while len(self._costum_difficulties) < len(texts) and analyzed < limit:
+                if difficulty is not None and len(self._costum_difficulty_index.get(difficulty, ())) >= wanted:
+                    break
+                text = texts[len(self._costum_difficulties)]
+                self._record_costum_difficulty(text_statistics(text).get("estimated_difficulty"))
+                analyzed += 1
+            return len(self._costum_difficulties) < len(texts)
+
+    def _record_costum_difficulty(self, difficulty: Optional[str]) -> None:
+        """Add the difficulty of the next custom text (caller holds the difficulty lock)"""
+        self._costum_difficulty_index.setdefault(difficulty, []).append(len(self._costum_difficulties))
+        self._costum_difficulties.append(difficulty)
+
+    def _costum_difficulty(self, position: int) -> Optional[str]:
+        """Get the estimated difficulty of a custom text, analyzing it if not indexed yet"""
+        difficulties = self._costum_difficulties
+        if position < len(difficulties):
+            return difficulties[position]
+        return text_statistics(self.costum_texts[position]).get("estimated_difficulty")
+
+    def _reset_costum_difficulties(self) -> None:
+        """Forget the difficulty index after the custom texts were replaced"""
+        with self._difficulty_lock:
+            self._costum_difficulties = []
+            self._costum_difficulty_index = {}
 
     def clear_custom_texts(self) -> None:
-        """Clear all custom texts"""
-        self.custom_texts.clear()
+        """Clear all custom texts (the indexes forget them too)"""
+        self.costum_texts = []
+        self._costum_text_set = set()
+        self._reset_costum_difficulties()
+        # Rebuilt on next use without the cleared texts (passage IDs past the defaults are gone)
+        self.ngram_index = None
+        self.search_index = None
+        self._drop_samplers([None])
+        self._corpus_changed()
+
+    def add_corpus_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Get notified when texts are added, cleared or replaced
+
+        Args:
+            callback: Called without arguments after each change (e.g. PassagePrefetcher.invalidate)
+        """
+        self._corpus_listeners.append(callback)
+
+    def _corpus_changed(self) -> None:
+        """Publish the number of passages to the runtime metrics and notify listeners"""
+        CORPUS_TEXTS.set(self.count_texts())
+        for callback in self._corpus_listeners:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Corpus listener error: {e}")
 
     def get_text_count(self) -> dict:
         """
@@ -281,7 +1061,7 @@ class TextManager(iTextManager):
         Returns:
             dict: Text counts by category
         """
-        counts = {"custom": len(self.custom_texts)}
+        counts = {"custom": len(self.costum_texts)}
         
         for difficulty, texts in self.default_texts.items():
             counts[difficulty] = len(texts)
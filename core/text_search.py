@@ -0,0 +1,380 @@
+"""
+Full-text Passage Search
+========================
+
+Word-level inverted index over the passage corpus:
+- Incremental indexing as passages are added
+- Prefix search on the last query word (search-as-you-type)
+- BM25 ranking of the matching passages
+- Passages can be referenced by position in an external sequence (e.g. a
+  shared-memory corpus) instead of being copied into the index
+- JSON persistence so the index is not rebuilt at every startup; the saved
+  postings are reused for the longest saved prefix of passages that is
+  unchanged (e.g. the default texts when the custom texts differ)
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+from array import array
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+INDEX_FORMAT_VERSION = 3
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Maximum number of index terms a query prefix expands to
+MAX_PREFIX_EXPANSIONS = 64
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search terms
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List[str]: Terms in order of appearance
+    """
+    return _WORD_PATTERN.findall(text.lower())
+
+
+def fingerprint_documents(documents: Sequence[str], count: int) -> str:
+    """
+    Fingerprint the first passages of a sequence
+
+    Args:
+        documents: Passages
+        count: Number of passages covered
+
+    Returns:
+        str: Hex digest identifying the passages and their order
+    """
+    return fingerprint_prefixes(documents, [count])[count]
+
+
+def fingerprint_prefixes(documents: Sequence[str], counts: Iterable[int]) -> Dict[int, str]:
+    """
+    Fingerprint several prefixes of a sequence in a single pass
+
+    Args:
+        documents: Passages
+        counts: Prefix lengths (at most len(documents))
+
+    Returns:
+        Dict[int, str]: Prefix length -> fingerprint_documents(documents, length)
+    """
+    fingerprints = {}
+    digest = hashlib.sha256()
+    document_id = 0
+    for count in sorted(set(counts)):
+        while document_id < count:
+            digest.update(documents[document_id].encode("utf-8"))
+            digest.update(b"\0")
+            document_id += 1
+        fingerprints[count] = digest.copy().hexdigest()
+    return fingerprints
+
+
+class TextSearchIndex:
+    def __init__(self, documents: Optional[Sequence[str]] = None):
+        """
+        Initialize an empty search index
+
+        Args:
+            documents: Passages referenced by position (the document ID); only
+                       postings are stored and add_document must follow their
+                       order. By default the index keeps its own copy of each text.
+        """
+        self._owns_documents = documents is None
+        self._documents = [] if documents is None else documents
+        # Duplicate detection is only needed when the index owns the texts
+        self._document_ids: Optional[Dict[str, int]] = {} if documents is None else None
+        self._document_count = 0
+        self._document_lengths = array('I')
+        self._total_length = 0
+        # term -> {document_id: term frequency}
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._sorted_terms: List[str] = []
+        self._terms_dirty = False
+
+    def __len__(self) -> int:
+        return self._document_count
+
+    def __contains__(self, text: str) -> bool:
+        if self._document_ids is not None:
+            return text in self._document_ids
+        return any(self._documents[document_id] == text for document_id in range(self._document_count))
+
+    def add_document(self, text: str) -> int:
+        """
+        Index a passage
+
+        An index that owns its texts ignores passages that are already indexed;
+        an index over external documents expects the next passage in their order.
+
+        Args:
+            text: Passage text
+
+        Returns:
+            int: Document ID of the passage
+        """
+        document_id = self._document_count
+        if self._owns_documents:
+            existing = self._document_ids.get(text)
+            if existing is not None:
+                return existing
+            self._documents.append(text)
+            self._document_ids[text] = document_id
+        self._document_count += 1
+
+        terms = tokenize(text)
+        self._document_lengths.append(len(terms))
+        self._total_length += len(terms)
+
+        for term in terms:
+            posting = self._postings.get(term)
+            if posting is None:
+                posting = self._postings[term] = {}
+                self._terms_dirty = True
+            posting[document_id] = posting.get(document_id, 0) + 1
+
+        return document_id
+
+    def get_document(self, document_id: int) -> str:
+        """
+        Get passage text by document ID
+
+        Args:
+            document_id: ID returned by add_document
+
+        Returns:
+            str: Passage text
+        """
+        return self._documents[document_id]
+
+    def expand_prefix(self, prefix: str, limit: int = MAX_PREFIX_EXPANSIONS) -> List[str]:
+        """
+        Get indexed terms starting with a prefix
+
+        Args:
+            prefix: Lowercase term prefix
+            limit: Maximum number of terms to return
+
+        Returns:
+            List[str]: Matching terms in alphabetical order
+        """
+        if self._terms_dirty:
+            self._sorted_terms = sorted(self._postings)
+            self._terms_dirty = False
+
+        terms = self._sorted_terms
+        matches = []
+        position = bisect_left(terms, prefix)
+        while position < len(terms) and len(matches) < limit and terms[position].startswith(prefix):
+            matches.append(terms[position])
+            position += 1
+
+        return matches
+
+    def search(self, query: str, limit: int = 20, prefix: Optional[bool] = None,
+               document_filter: Optional[Callable[[int], bool]] = None) -> List[Tuple[int, float]]:
+        """
+        Find the passages containing every query word
+
+        Args:
+            query: Search query
+            limit: Maximum number of results
+            prefix: Treat the last word as a prefix; by default it is a prefix
+                    unless the query ends with whitespace
+            document_filter: Optional predicate on document IDs applied before ranking
+
+        Returns:
+            List[Tuple[int, float]]: (document_id, score) sorted by score descending
+        """
+        terms = tokenize(query)
+        if not terms or not self._document_count:
+            return []
+
+        if prefix is None:
+            prefix = not query[-1:].isspace()
+
+        # Each query word becomes a group of index terms (one term, or a prefix expansion)
+        groups = [[term] for term in terms]
+        if prefix:
+            groups[-1] = self.expand_prefix(terms[-1])
+
+        group_postings = []
+        for group in groups:
+            postings = [self._postings[term] for term in group if term in self._postings]
+            if not postings:
+                return []
+            group_postings.append(postings)
+
+        # Intersect starting from the rarest group so the candidate set stays small
+        group_postings.sort(key=lambda postings: sum(len(posting) for posting in postings))
+        candidates = set()
+        for posting in group_postings[0]:
+            candidates.update(posting)
+        for postings in group_postings[1:]:
+            candidates = {document_id for document_id in candidates
+                          if any(document_id in posting for posting in postings)}
+            if not candidates:
+                return []
+
+        if document_filter is not None:
+            candidates = {document_id for document_id in candidates if document_filter(document_id)}
+            if not candidates:
+                return []
+
+        scores = self._score(candidates, group_postings)
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+
+    def _score(self, candidates: set, group_postings: List[List[Dict[int, int]]]) -> Dict[int, float]:
+        """Compute BM25 scores of candidate documents"""
+        document_count = self._document_count
+        average_length = self._total_length / document_count if document_count else 0.0
+        scores = dict.fromkeys(candidates, 0.0)
+
+        for postings in group_postings:
+            for posting in postings:
+                frequency = len(posting)
+                idf = math.log(1 + (document_count - frequency + 0.5) / (frequency + 0.5))
+                for document_id in candidates:
+                    term_frequency = posting.get(document_id)
+                    if not term_frequency:
+                        continue
+                    length_ratio = self._document_lengths[document_id] / average_length if average_length else 1.0
+                    norm = term_frequency + BM25_K1 * (1 - BM25_B + BM25_B * length_ratio)
+                    scores[document_id] += idf * term_frequency * (BM25_K1 + 1) / norm
+
+        return scores
+
+    def save(self, file_path: str, count: Optional[int] = None, prefixes: Iterable[int] = ()) -> bool:
+        """
+        Save the index to a file
+
+        Texts are stored only when the index owns them; an index over external
+        documents stores fingerprints of them instead, for the saved documents
+        and for each of the given prefixes.
+
+        Args:
+            file_path: Path of the index file
+            count: Save only the first count documents (all by default)
+            prefixes: Shorter document counts the saved postings may be reused
+                      for when the later documents change (e.g. the default texts)
+
+        Returns:
+            bool: True if the index was saved successfully
+        """
+        try:
+            count = self._document_count if count is None else min(count, self._document_count)
+            counts = [prefix for prefix in prefixes if 0 < prefix < count] + [count]
+            fingerprints = fingerprint_prefixes(self._documents, counts)
+            postings = {}
+            for term, posting in self._postings.items():
+                # Posting lists are stored flat: [id, frequency, id, frequency, ...]
+                flat = [value for item in posting.items() if item[0] < count for value in item]
+                if flat:
+                    postings[term] = flat
+            data = {
+                "version": INDEX_FORMAT_VERSION,
+                "count": count,
+                # [count, fingerprint] of each prefix, longest last
+                "checkpoints": [[prefix, fingerprint] for prefix, fingerprint in fingerprints.items()],
+                "postings": postings
+            }
+            if self._owns_documents:
+                data["documents"] = self._documents[:count]
+
+            temp_path = file_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(temp_path, file_path)
+            return True
+        except Exception as e:
+            print(f"Error saving search index: {e}")
+            return False
+
+    @classmethod
+    def load(cls, file_path: str, documents: Optional[Sequence[str]] = None) -> Optional["TextSearchIndex"]:
+        """
+        Load an index saved with save()
+
+        An index over external documents keeps the postings of the longest
+        saved prefix that still matches the documents; the caller indexes the
+        remaining documents.
+
+        Args:
+            file_path: Path of the index file
+            documents: External passages the index refers to (see __init__)
+
+        Returns:
+            TextSearchIndex: Loaded index, or None if missing, incompatible or
+                             saved for different passages
+        """
+        try:
+            if not os.path.exists(file_path):
+                return None
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_FORMAT_VERSION:
+                return None
+
+            count = data["count"]
+            if documents is None:
+                if "documents" not in data:
+                    return None
+                index = cls()
+                index._documents = data["documents"]
+                index._document_ids = {text: document_id for document_id, text in enumerate(index._documents)}
+            else:
+                checkpoints = [(prefix, fingerprint) for prefix, fingerprint in data["checkpoints"]
+                               if prefix <= len(documents)]
+                fingerprints = fingerprint_prefixes(documents, [prefix for prefix, _ in checkpoints])
+                matching = [prefix for prefix, fingerprint in checkpoints if fingerprints[prefix] == fingerprint]
+                if not matching:
+                    return None
+                count = max(matching)
+                index = cls(documents)
+
+            lengths = array('I', bytes(4 * count))
+            for term, flat in data["postings"].items():
+                posting = {document_id: term_frequency
+                           for document_id, term_frequency in zip(flat[::2], flat[1::2])
+                           if document_id < count}
+                if not posting:
+                    continue
+                index._postings[term] = posting
+                for document_id, term_frequency in posting.items():
+                    lengths[document_id] += term_frequency
+            index._document_count = count
+            index._document_lengths = lengths
+            index._total_length = sum(lengths)
+            index._terms_dirty = True
+            return index
+        except Exception as e:
+            print(f"Error loading search index: {e}")
+            return None
+
+
+if __name__ == "__main__":
+    index = TextSearchIndex()
+    for passage in ["The quick brown fox jumps over the lazy dog.",
+                    "Pack my box with five dozen liquor jugs.",
+                    "How vexingly quick daft zebras jump!"]:
+        index.add_document(passage)
+
+    for query in ["quick", "qui", "jump", "quick zeb"]:
+        results = [(index.get_document(document_id), round(score, 3))
+                   for document_id, score in index.search(query)]
+        print(f"{query!r}: {results}")
@@ -0,0 +1,150 @@
+"""
+Streaming Text Sources
+======================
+
+Reads corpora without loading them whole:
+- Plain, gzip, bzip2 and xz/lzma files via the standard library
+- Lazy recursive directory walks
+- Encoding detection from a small sample (BOM, UTF-8, fallback)
+- Incremental decoding into fixed-size text chunks
+"""
+
+import bz2
+import codecs
+import gzip
+import lzma
+import os
+from typing import BinaryIO, Iterator
+
+# Bytes read per chunk from the (decompressed) stream
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Encoding used when the sample is not valid UTF-8
+FALLBACK_ENCODING = "cp1252"
+
+COMPRESSED_OPENERS = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".lzma": lzma.open
+}
+
+# File types picked up when walking a directory
+TEXT_SUFFIXES = (".txt", ".text", ".md")
+
+_BOMS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16")
+)
+
+
+def is_text_source(file_path: str) -> bool:
+    """
+    Check whether a file looks like a (possibly compressed) text file
+
+    Args:
+        file_path: Path of the file
+
+    Returns:
+        bool: True for text files and compressed text files
+    """
+    name = file_path.lower()
+    for suffix in COMPRESSED_OPENERS:
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    return name.endswith(TEXT_SUFFIXES)
+
+
+def iter_source_files(path: str) -> Iterator[str]:
+    """
+    Lazily list the files of a source
+
+    Args:
+        path: A file, or a directory walked recursively for text files
+
+    Yields:
+        str: File paths (directory entries in name order)
+    """
+    if not os.path.isdir(path):
+        yield path
+        return
+
+    pending = [path]
+    while pending:
+        directory = pending.pop()
+        with os.scandir(directory) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+
+        subdirectories = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif entry.is_file() and is_text_source(entry.name):
+                yield entry.path
+        pending.extend(reversed(subdirectories))
+
+
+def open_binary(file_path: str) -> BinaryIO:
+    """
+    Open a file for streaming reads, decompressing by suffix
+
+    Args:
+        file_path: Path of the file
+
+    Returns:
+        BinaryIO: Binary stream of the (decompressed) content
+    """
+    suffix = os.path.splitext(file_path)[1].lower()
+    opener = COMPRESSED_OPENERS.get(suffix)
+    return opener(file_path, "rb") if opener else open(file_path, "rb")
+
+
+def detect_encoding(sample: bytes) -> str:
+    """
+    Detect the encoding of a text from its first bytes
+
+    Args:
+        sample: Beginning of the content
+
+    Returns:
+        str: Codec name
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    try:
+        # final=False tolerates a multi-byte character cut at the end of the sample
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+
+
+def iter_text_chunks(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Stream the decoded text of a file in chunks
+
+    Args:
+        file_path: Path of a plain or compressed text file
+        chunk_size: Bytes read per chunk
+
+    Yields:
+        str: Decoded text chunks
+    """
+    with open_binary(file_path) as stream:
+        chunk = stream.read(chunk_size)
+        decoder = codecs.getincrementaldecoder(detect_encoding(chunk))(errors="replace")
+        while chunk:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+            chunk = stream.read(chunk_size)
+
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
@@ -17,13 +17,26 @@ import os
 
 # Import
 from typing import Callable, Optional
-from contracts.i_timer import iTimer
+
+# Handle imports for both standalone and module execution
+try:
+    from .contracts.i_timer import iTimer
+    from .metrics import TIMER_LAG_SECONDS
+    from .resource_monitor import track_instance
+except ImportError:
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from contracts.i_timer import iTimer
+    from metrics import TIMER_LAG_SECONDS
+    from resource_monitor import track_instance
 
 # Adjust sys.path to include project root for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(current_dir)
 sys.path.insert(0, project_root)
 
+# Seconds between real-time callback updates
+UPDATE_INTERVAL = 0.1
+
 
 class Timer(iTimer):
     def __init__(self, duration: int = 60, callback: Optional[Callable[[float], None]] = None):
@@ -34,8 +47,12 @@ class Timer(iTimer):
         self.is_running = False
         self.is_paused = False
         self.elapsed_paused_time = 0.0
+        # One update thread per timer, parked between runs and reused by the next start
         self._timer_thread = None
+        self._active_event = threading.Event()
         self._stop_event = threading.Event()
+        self._closed = False
+        track_instance(self)
 
     def start_timer(self) -> None:
         """Start the timer"""
@@ -48,10 +65,10 @@ class Timer(iTimer):
         self.is_paused = False
         self._stop_event.clear()
         
-        # Start background thread for real-time updates
+        # Wake the background thread for real-time updates
         if self.callback:
-            self._timer_thread = threading.Thread(target=self._timer_loop, daemon=True)
-            self._timer_thread.start()
+            self._ensure_thread()
+            self._active_event.set()
 
     def stop(self) -> None:
         """Stop the timer"""
@@ -62,10 +79,9 @@ class Timer(iTimer):
         self.is_running = False
         self.is_paused = False
         
-        # Stop background thread
-        if self._timer_thread:
-            self._stop_event.set()
-            self._timer_thread = None
+        # Park the background thread until the next start
+        self._active_event.clear()
+        self._stop_event.set()
 
     def pause(self) -> None:
         """Pause the timer"""
@@ -84,12 +100,22 @@ class Timer(iTimer):
         self.is_paused = False
 
     def reset(self) -> None:
-        """Reset the timer"""
+        """Reset the timer in place, keeping its update thread for the next start"""
         self.stop()
         self.start_time = None
         self.end_time = None
+        self.is_paused = False
         self.elapsed_paused_time = 0.0
 
+    def close(self) -> None:
+        """Stop the timer and end its update thread"""
+        self.stop()
+        self._closed = True
+        self._active_event.set()
+        if self._timer_thread is not None:
+            self._timer_thread.join()
+            self._timer_thread = None
+
     def get_elapsed_time(self) -> float:
         """
         Get elapsed time in seconds
@@ -155,18 +181,33 @@ class Timer(iTimer):
         """
         self.callback = callback
 
+    def _ensure_thread(self) -> None:
+        """Start the update thread unless it is already running"""
+        if self._timer_thread is None or not self._timer_thread.is_alive():
+            self._closed = False
+            self._timer_thread = threading.Thread(target=self._timer_loop, name="timer", daemon=True)
+            self._timer_thread.start()
+
     def _timer_loop(self) -> None:
         """Background thread loop for real-time updates"""
-        while not self._stop_event.is_set() and self.is_running:
-            if not self.is_paused and self.callback:
+        while True:
+            # Parked between runs instead of exiting, so restarts create no threads
+            self._active_event.wait()
+            if self._closed:
+                return
+
+            if self.is_running and not self.is_paused and self.callback:
                 try:
                     elapsed = self.get_elapsed_time()
                     self.callback(elapsed)
                 except Exception as e:
                     print(f"Timer callback error: {e}")
-                    
-            # Update every 100ms for smooth real-time updates
-            time.sleep(0.1)
+
+            # Update every 100ms for smooth real-time updates; stop() cuts the wait short
+            expected = time.perf_counter() + UPDATE_INTERVAL
+            if self._stop_event.wait(UPDATE_INTERVAL):
+                continue
+            TIMER_LAG_SECONDS.observe(max(0.0, time.perf_counter() - expected))
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -0,0 +1,438 @@
+"""
+Synthetic Typist Load Generator
+===============================
+
+Realistic key-event streams for stress tests:
+- Per-session WPM drawn from a configurable distribution, jittered key intervals
+- Typos, backspace corrections and bursty thinking pauses
+- Replays through the core scoring path or a live MainWindow (synthetic Tk events)
+- Latency sweeps over WPM and passage length to find where input handling degrades
+"""
+
+import math
+import random
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Handle imports for both standalone and module execution
+try:
+    from .calculator import Calculator
+    from .keystroke_analytics import KeystrokeAnalytics
+    from .text_compare import IncrementalNormalizer
+except ImportError:
+    import sys
+    import os
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, current_dir)
+    from calculator import Calculator
+    from keystroke_analytics import KeystrokeAnalytics
+    from text_compare import IncrementalNormalizer
+
+BACKSPACE = "BackSpace"
+
+# (timestamp in seconds from the start of the test, key); key is a single
+# character or BACKSPACE
+KeyEvent = Tuple[float, str]
+
+# Tk keysyms of characters that are not their own keysym
+KEYSYMS = {
+    " ": "space", "!": "exclam", '"': "quotedbl", "#": "numbersign", "$": "dollar",
+    "%": "percent", "&": "ampersand", "'": "apostrophe", "(": "parenleft",
+    ")": "parenright", "*": "asterisk", "+": "plus", ",": "comma", "-": "minus",
+    ".": "period", "/": "slash", ":": "colon", ";": "semicolon", "<": "less",
+    "=": "equal", ">": "greater", "?": "question", "@": "at", "[": "bracketleft",
+    "\\": "backslash", "]": "bracketright", "^": "asciicircum", "_": "underscore",
+    "`": "grave", "{": "braceleft", "|": "bar", "}": "braceright", "~": "asciitilde"
+}
+_KEYSYM_CHARS = {keysym: char for char, keysym in KEYSYMS.items()}
+
+# Rows of a QWERTY keyboard, used to pick plausible neighbouring typos
+_KEYBOARD_ROWS = ("`1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./")
+
+# Default latency budget per keystroke for load sweeps (milliseconds)
+DEFAULT_LATENCY_BUDGET_MS = 16.0
+
+
+def keysym_for_char(char: str) -> str:
+    """
+    Get the Tk keysym that types a character
+
+    Args:
+        char: Single character
+
+    Returns:
+        str: Keysym name
+    """
+    return KEYSYMS.get(char, char)
+
+
+def char_for_keysym(keysym: str) -> str:
+    """
+    Get the character typed by a Tk keysym
+
+    Args:
+        keysym: Keysym name
+
+    Returns:
+        str: The character, or "" for non-character keys
+    """
+    if len(keysym) == 1:
+        return keysym
+    return _KEYSYM_CHARS.get(keysym, "")
+
+
+def _neighbour_key(char: str, rng: random.Random) -> str:
+    """Pick a key next to a character on the keyboard (or a random letter)"""
+    lower = char.lower()
+    for row in _KEYBOARD_ROWS:
+        index = row.find(lower)
+        if index >= 0:
+            neighbours = [row[i] for i in (index - 1, index + 1) if 0 <= i < len(row)]
+            typo = rng.choice(neighbours)
+            return typo.upper() if char.isupper() else typo
+    return rng.choice("etaoinshrdlu")
+
+
+class TypistProfile:
+    __slots__ = ("wpm_mean", "wpm_stddev", "min_wpm", "jitter", "error_rate", "correction_rate",
+                 "correction_delay", "pause_rate", "pause_mean", "burst_length")
+
+    def __init__(self, wpm_mean: float = 60.0, wpm_stddev: float = 10.0, min_wpm: float = 5.0,
+                 jitter: float = 0.35, error_rate: float = 0.03, correction_rate: float = 0.8,
+                 correction_delay: int = 2, pause_rate: float = 0.02, pause_mean: float = 0.8,
+                 burst_length: int = 3):
+        """
+        Behaviour of a synthetic typist
+
+        Args:
+            wpm_mean: Mean words per minute of a session (5 characters per word)
+            wpm_stddev: Standard deviation of the session WPM
+            min_wpm: Lower bound for the drawn session WPM
+            jitter: Spread of individual key intervals (sigma of a log-normal)
+            error_rate: Probability of a typo per character
+            correction_rate: Probability that a typo is noticed and backspaced
+            correction_delay: Maximum extra keys typed before a noticed typo is corrected
+            pause_rate: Probability of a thinking pause before a word
+            pause_mean: Mean pause length in seconds (exponentially distributed)
+            burst_length: Maximum number of words a pause burst spans
+        """
+        self.wpm_mean = wpm_mean
+        self.wpm_stddev = wpm_stddev
+        self.min_wpm = min_wpm
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.correction_rate = correction_rate
+        self.correction_delay = correction_delay
+        self.pause_rate = pause_rate
+        self.pause_mean = pause_mean
+        self.burst_length = burst_length
+
+
+class SyntheticTypist:
+    def __init__(self, profile: Optional[TypistProfile] = None, seed: Optional[int] = None):
+        """
+        Initialize the generator
+
+        Args:
+            profile: Typist behaviour (defaults to TypistProfile())
+            seed: Random seed for reproducible streams
+        """
+        self.profile = profile or TypistProfile()
+        self.rng = random.Random(seed)
+
+    def draw_wpm(self) -> float:
+        """
+        Draw the WPM of one session from the profile
+
+        Returns:
+            float: Session WPM
+        """
+        profile = self.profile
+        return max(profile.min_wpm, self.rng.gauss(profile.wpm_mean, profile.wpm_stddev))
+
+    def generate(self, text: str, wpm: Optional[float] = None) -> Iterator[KeyEvent]:
+        """
+        Generate the key events of one typing session
+
+        Args:
+            text: Passage to type
+            wpm: Session WPM (drawn from the profile by default)
+
+        Yields:
+            KeyEvent: (timestamp, key) in time order
+        """
+        profile = self.profile
+        rng = self.rng
+        wpm = wpm if wpm is not None else self.draw_wpm()
+        # Log-normal intervals whose mean matches the target speed
+        mean_interval = 60.0 / (wpm * 5)
+        mu = math.log(mean_interval) - profile.jitter ** 2 / 2
+
+        clock = 0.0
+        position = 0
+        # Position of an uncorrected typo the typist will still notice, and when
+        pending_typo = None
+        correct_at = 0
+        paused_words = 0
+
+        while position < len(text):
+            if pending_typo is not None and position >= correct_at:
+                # Notice the typo: pause briefly, then delete back to it
+                clock += rng.expovariate(1 / (mean_interval * 3))
+                while position > pending_typo:
+                    clock += rng.lognormvariate(mu, profile.jitter) * 0.6
+                    position -= 1
+                    yield clock, BACKSPACE
+                pending_typo = None
+                continue
+
+            char = text[position]
+            starts_word = position == 0 or (text[position - 1] == " " and char != " ")
+            if starts_word:
+                if paused_words:
+                    paused_words -= 1
+                    clock += rng.expovariate(1 / profile.pause_mean)
+                elif rng.random() < profile.pause_rate:
+                    paused_words = rng.randint(0, max(0, profile.burst_length - 1))
+                    clock += rng.expovariate(1 / profile.pause_mean)
+
+            clock += rng.lognormvariate(mu, profile.jitter)
+            if rng.random() < profile.error_rate:
+                yield clock, _neighbour_key(char, rng)
+                if pending_typo is None and rng.random() < profile.correction_rate:
+                    pending_typo = position
+                    correct_at = position + 1 + rng.randint(0, profile.correction_delay)
+            else:
+                yield clock, char
+            position += 1
+
+        if pending_typo is not None:
+            # Typo noticed on the last characters: still correct it
+            clock += rng.expovariate(1 / (mean_interval * 3))
+            while position > pending_typo:
+                clock += rng.lognormvariate(mu, profile.jitter) * 0.6
+                position -= 1
+                yield clock, BACKSPACE
+            for char in text[pending_typo:]:
+                clock += rng.lognormvariate(mu, profile.jitter)
+                yield clock, char
+
+
+def build_passage(text_manager, length: int, difficulty: Optional[str] = None) -> str:
+    """
+    Build a passage of roughly a given length from TextManager texts
+
+    Args:
+        text_manager: TextManager to draw texts from
+        length: Target length in characters
+        difficulty: Difficulty level, or None for the TextManager's default choice
+
+    Returns:
+        str: Passage of at least length characters (cut at a word boundary when possible)
+    """
+    parts = []
+    total = 0
+    while total < length:
+        text = text_manager._formated_text(text_manager.choose_text(difficulty))
+        if not text:
+            break
+        parts.append(text)
+        total += len(text) + 1
+
+    passage = " ".join(parts)
+    if len(passage) > length:
+        cut = passage.rfind(" ", 0, length)
+        passage = passage[:cut if cut > 0 else length]
+    return passage
+
+
+def _latency_summary(latencies: List[float]) -> Dict[str, float]:
+    """Summarize per-event latencies (seconds) in milliseconds"""
+    if not latencies:
+        return {"events": 0, "mean_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "events": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered) * 1000, 4),
+        "p95_ms": round(p95 * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4)
+    }
+
+
+def replay_core(text: str, events: Iterable[KeyEvent],
+                analytics: Optional[KeystrokeAnalytics] = None) -> Dict:
+    """
+    Feed key events through the core scoring path, timing each event
+
+    Every keystroke is recorded in keystroke analytics and rescored (live WPM
+    and accuracy of the input so far), as the typing display does.
+
+    Args:
+        text: Passage being typed
+        events: Key events from SyntheticTypist.generate
+        analytics: Keystroke statistics to update (a new instance by default)
+
+    Returns:
+        dict: Final accuracy, net WPM and latency summary
+    """
+    analytics = analytics or KeystrokeAnalytics()
+    normalizer = IncrementalNormalizer()
+    typed = []
+    latencies = []
+    timestamp = 0.0
+    accuracy = Calculator.calculate_detailed_accuracy("", text)
+
+    for timestamp, key in events:
+        started = time.perf_counter()
+        if key == BACKSPACE:
+            if typed:
+                typed.pop()
+        elif len(typed) < len(text):
+            analytics.record_keystroke(text[len(typed)], key, timestamp)
+            typed.append(key)
+
+        user_input = normalizer.update("".join(typed))
+        accuracy = Calculator.calculate_detailed_accuracy(user_input, text, input_normalized=True)
+        Calculator.calculate_real_time_wpm(accuracy.correct_chars, timestamp)
+        latencies.append(time.perf_counter() - started)
+
+    analytics.end_stream()
+    minutes = timestamp / 60
+    net_wpm = Calculator.calculate_words_per_minute_net(accuracy.correct_chars, accuracy.errors, minutes)
+    return {
+        "duration": round(timestamp, 3),
+        "accuracy": accuracy.accuracy,
+        "net_wpm": net_wpm,
+        "latency": _latency_summary(latencies)
+    }
+
+
+def drive_window(window, text: str, events: Sequence[KeyEvent], speed: float = 1.0,
+                 on_done: Optional[Callable[[Dict], None]] = None) -> None:
+    """
+    Type a passage into a live MainWindow with synthetic Tk key events
+
+    Events are scheduled on the Tk event loop at their (scaled) timestamps; the
+    handler time of each event and the scheduling lag of the loop are measured.
+
+    Args:
+        window: MainWindow (any Tk widget whose key handler is bound works)
+        text: Passage to load before typing
+        events: Key events from SyntheticTypist.generate
+        speed: Time scale (2.0 types twice as fast; 0 dispatches as fast as possible)
+        on_done: Called on the Tk thread with the latency summaries
+    """
+    window.load_passage(text)
+    window.focus_force()
+    handler_times = []
+    lags = []
+    events = list(events)
+    started = time.perf_counter()
+
+    def dispatch(index: int):
+        timestamp, key = events[index]
+        due = timestamp / speed if speed else 0.0
+        before = time.perf_counter()
+        lags.append(max(0.0, before - started - due))
+        window.event_generate("<KeyPress>", keysym=BACKSPACE if key == BACKSPACE else keysym_for_char(key))
+        handler_times.append(time.perf_counter() - before)
+
+        index += 1
+        if index < len(events):
+            next_due = events[index][0] / speed if speed else 0.0
+            delay = max(0, int((next_due - (time.perf_counter() - started)) * 1000))
+            window.after(delay, dispatch, index)
+        elif on_done:
+            on_done({"handler": _latency_summary(handler_times), "loop_lag": _latency_summary(lags)})
+
+    if events:
+        window.after(0, dispatch, 0)
+    elif on_done:
+        on_done({"handler": _latency_summary([]), "loop_lag": _latency_summary([])})
+
+
+def run_load_sweep(text_manager, wpms: Sequence[float], lengths: Sequence[int],
+                   sessions: int = 3, profile: Optional[TypistProfile] = None,
+                   seed: Optional[int] = 0) -> List[Dict]:
+    """
+    Measure core scoring latency over a grid of typing speeds and passage lengths
+
+    Args:
+        text_manager: TextManager providing the passages
+        wpms: Session speeds to test
+        lengths: Passage lengths (characters) to test
+        sessions: Sessions simulated per combination
+        profile: Typist behaviour (speed is overridden by wpms)
+        seed: Random seed for reproducible runs
+
+    Returns:
+        List[Dict]: One row per (wpm, length) with the worst latency of its sessions
+    """
+    typist = SyntheticTypist(profile, seed)
+    rows = []
+    for length in lengths:
+        for wpm in wpms:
+            worst = None
+            for _ in range(sessions):
+                passage = build_passage(text_manager, length)
+                result = replay_core(passage, typist.generate(passage, wpm))
+                if worst is None or result["latency"]["p95_ms"] > worst["latency"]["p95_ms"]:
+                    worst = result
+            rows.append({"wpm": wpm, "length": length, **worst["latency"],
+                         "accuracy": worst["accuracy"], "net_wpm": worst["net_wpm"]})
+    return rows
+
+
+def find_degradation(rows: Iterable[Dict], budget_ms: float = DEFAULT_LATENCY_BUDGET_MS) -> Optional[Dict]:
+    """
+    Find the first sweep row whose p95 latency exceeds a budget
+
+    Args:
+        rows: Rows from run_load_sweep
+        budget_ms: Per-keystroke latency budget in milliseconds
+
+    Returns:
+        Optional[Dict]: The first row over budget, or None if all are within it
+    """
+    for row in rows:
+        if row["p95_ms"] > budget_ms:
+            return row
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    try:
+        from .text_manager import TextManager
+    except ImportError:
+        from text_manager import TextManager
+
+    parser = argparse.ArgumentParser(description="Stress-test scoring with synthetic typists")
+    parser.add_argument("--wpm", type=float, nargs="+", default=[40, 80, 120, 160])
+    parser.add_argument("--lengths", type=int, nargs="+", default=[200, 1000, 5000])
+    parser.add_argument("--sessions", type=int, default=3)
+    parser.add_argument("--error-rate", type=float, default=0.03)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_LATENCY_BUDGET_MS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    profile = TypistProfile(error_rate=args.error_rate)
+    rows = run_load_sweep(TextManager(), args.wpm, args.lengths, args.sessions, profile, args.seed)
+
+    print(f"{'wpm':>6} {'length':>7} {'events':>7} {'mean ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for row in rows:
+        print(f"{row['wpm']:>6g} {row['length']:>7} {row['events']:>7} "
+              f"{row['mean_ms']:>9.3f} {row['p95_ms']:>9.3f} {row['max_ms']:>9.3f}")
+
+    degraded = find_degradation(rows, args.budget_ms)
+    if degraded:
+        print(f"Latency over {args.budget_ms} ms from {degraded['wpm']:g} WPM, {degraded['length']} characters")
+        return 1
+    print(f"All combinations within {args.budget_ms} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,140 @@
+"""
+Per-Word Statistics
+===================
+
+Attributes keystrokes to the words of a passage:
+- O(1) per keystroke through the passage's precomputed WordIndex
+- Errors, corrections and elapsed time per word, stored in flat arrays
+- Per-word WPM and the most-missed words for the results view
+"""
+
+import string
+from array import array
+from typing import List, Tuple
+
+# Handle imports for both standalone and module execution
+try:
+    from .results import WordResult
+    from .text_layout import WordIndex
+except ImportError:
+    import sys
+    import os
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, current_dir)
+    from results import WordResult
+    from text_layout import WordIndex
+
+# Stripped from words when grouping them for most-missed statistics
+_WORD_PUNCTUATION = string.punctuation + "\u2018\u2019\u201c\u201d"
+
+
+class WordTracker:
+    def __init__(self, word_index: WordIndex):
+        """
+        Initialize empty statistics for a passage
+
+        Args:
+            word_index: Word index of the passage being typed
+        """
+        self.errors = array('I')
+        self.corrections = array('I')
+        self.keystrokes = array('I')
+        # Time the word was started (the previous keystroke) and its last keystroke
+        self.start_times = array('d')
+        self.end_times = array('d')
+        self.reset(word_index)
+
+    def reset(self, word_index: WordIndex) -> None:
+        """
+        Start over for a new passage, reusing the existing arrays
+
+        Args:
+            word_index: Word index of the passage being typed
+        """
+        self.word_index = word_index
+        count = len(word_index)
+        for values, fill in ((self.errors, 0), (self.corrections, 0), (self.keystrokes, 0),
+                             (self.start_times, -1.0), (self.end_times, 0.0)):
+            values[:] = array(values.typecode, [fill]) * count
+        self._previous_time = None
+
+    def record_keystroke(self, position: int, typed_char: str, timestamp: float) -> None:
+        """
+        Record a typed character
+
+        Args:
+            position: Offset of the character in the passage
+            typed_char: Character typed
+            timestamp: Time of the keystroke in seconds
+        """
+        word = self.word_index.word_at(position)
+        if word >= 0:
+            if self.start_times[word] < 0:
+                start = self._previous_time if self._previous_time is not None else timestamp
+                self.start_times[word] = start
+            self.keystrokes[word] += 1
+            if typed_char != self.word_index.text[position]:
+                self.errors[word] += 1
+            self.end_times[word] = timestamp
+        self._previous_time = timestamp
+
+    def record_backspace(self, position: int, timestamp: float) -> None:
+        """
+        Record a deleted character
+
+        Args:
+            position: Offset of the deleted character in the passage
+            timestamp: Time of the keystroke in seconds
+        """
+        word = self.word_index.word_at(position)
+        if word >= 0:
+            self.corrections[word] += 1
+            self.end_times[word] = timestamp
+        self._previous_time = timestamp
+
+    def get_word_wpm(self, word: int) -> float:
+        """
+        Get the typing speed of one word
+
+        Args:
+            word: Word index
+
+        Returns:
+            float: WPM while typing the word (0.0 if not typed or instantaneous)
+        """
+        duration = self.end_times[word] - self.start_times[word]
+        if self.start_times[word] < 0 or duration <= 0:
+            return 0.0
+        return round((self.word_index.word_length(word) / 5) / (duration / 60), 1)
+
+    def get_word_results(self) -> List[WordResult]:
+        """
+        Get statistics of every word typed so far
+
+        Returns:
+            List[WordResult]: Results in passage order
+        """
+        return [
+            WordResult(self.word_index.word(word), self.errors[word], self.corrections[word],
+                       self.keystrokes[word], self.get_word_wpm(word))
+            for word in range(len(self.word_index)) if self.start_times[word] >= 0
+        ]
+
+    def get_most_missed_words(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        Get the words with the most errors (occurrences of a word are combined)
+
+        Args:
+            limit: Maximum number of words
+
+        Returns:
+            List[Tuple[str, int]]: (word, errors) with the most errors first
+        """
+        totals = {}
+        for word in range(len(self.word_index)):
+            errors = self.errors[word]
+            if errors:
+                key = self.word_index.word(word).strip(_WORD_PUNCTUATION).lower() or self.word_index.word(word)
+                totals[key] = totals.get(key, 0) + errors
+
+        return sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:limit]
@@ -1,5 +1,9 @@
+import copy
+import hashlib
 import json
+import marshal
 import os
+import sys
 from typing import Dict, Any
 
 try:
@@ -10,12 +14,46 @@ except ImportError:
     sys.path.insert(0, current_dir)
     from contracts.i_config import iConfig
 
+try:
+    from core.grading import GradingScheme, DEFAULT_GRADING
+    from core.metrics import CONFIG_SAVES
+except ImportError:
+    import sys
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, project_root)
+    from core.grading import GradingScheme, DEFAULT_GRADING
+    from core.metrics import CONFIG_SAVES
+
+# Merged settings are cached next to the config file in this file (config.json.snapshot)
+SNAPSHOT_SUFFIX = ".snapshot"
+# Bump when the snapshot layout changes
+SNAPSHOT_VERSION = 1
+# Modules whose defaults end up in the snapshot (this one and DEFAULT_GRADING's)
+DEFAULTS_SOURCES = (__file__, sys.modules[GradingScheme.__module__].__file__)
+
+
+def _defaults_fingerprint() -> tuple:
+    """Identify the default settings sources, so editing any of them invalidates snapshots"""
+    fingerprint = [SNAPSHOT_VERSION]
+    for path in DEFAULTS_SOURCES:
+        stat = os.stat(path)
+        fingerprint.extend((stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
 class AppConfig(iConfig):
     def __init__(self, theme: str = "light", config_file: str = "config.json"):
         self.theme = theme
+        self._theme = theme
+        self._saved_theme = None
         self.config_file = config_file
-        self._settings = self._load_default_settings()
+        self.snapshot_file = config_file + SNAPSHOT_SUFFIX
+        # Built by load_config only when no valid snapshot exists
+        self._settings = None
+        self._grading_scheme = None
         self.load_config()
+        if self._settings is None:
+            self._settings = self._load_default_settings()
 
         if theme:
             self._theme = theme
@@ -82,7 +120,33 @@ class AppConfig(iConfig):
                 "auto_start": False,
                 "show_errors": True,
                 "highlight_errors": True,
-                "sound_enabled": False
+                "sound_enabled": False,
+                "grading": copy.deepcopy(DEFAULT_GRADING)
+            },
+            "monitoring": {
+                "enabled": False,
+                "interval_seconds": 60,
+                "log_file": "resource_monitor.log"
+            },
+            "metrics": {
+                # Prometheus text exposition, see core/metrics.py
+                "enabled": False,
+                "textfile": "typing_test.prom",
+                "interval_seconds": 15,
+                # Localhost scrape endpoint; None disables it
+                "http_port": None
+            },
+            "leaderboard": {
+                # Submit results to a server started with core/leaderboard.py
+                "enabled": False,
+                "host": "127.0.0.1",
+                "port": 8765,
+                "player_name": "anonymous"
+            },
+            "corpus": {
+                # Attach to a corpus published by core/shared_corpus.py instead of loading one
+                "shared_memory": False,
+                "segment_name": "typing_test_corpus"
             }
         }
     
@@ -152,6 +216,22 @@ class AppConfig(iConfig):
         theme_colors = self._settings["Themes"].get(self._theme, {})
         return theme_colors.get(element, "#000000")
     
+    def get_grading_scheme(self) -> GradingScheme:
+        """
+        Get the grading scheme compiled from the "typing" -> "grading" settings
+        
+        Returns:
+            GradingScheme: Compiled grading scheme (built-in scheme if the settings are invalid)
+        """
+        if self._grading_scheme is None:
+            try:
+                self._grading_scheme = GradingScheme(self._settings.get("typing", {}).get("grading"))
+            except (ValueError, TypeError, KeyError) as e:
+                print(f"Error compiling grading scheme: {e}")
+                self._grading_scheme = GradingScheme.default()
+        
+        return self._grading_scheme
+    
     def get_font(self, font_type: str) -> tuple:
         """
         Get font configuration for specified type
@@ -179,18 +259,123 @@ class AppConfig(iConfig):
         """
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, "r") as f:
-                    saved_config = json.load(f)
+                if self._load_snapshot():
+                    return True
 
-                    # Merge saved config with default settings
-                    self._merge_config(saved_config)
+                with open(self.config_file, "rb") as f:
+                    data = f.read()
+                saved_config = json.loads(data)
 
-                    self._theme = saved_config.get("theme", self._theme)
-                    return True
+                # Merge saved config with default settings
+                if self._settings is None:
+                    self._settings = self._load_default_settings()
+                self._merge_config(saved_config)
+
+                self._theme = saved_config.get("theme", self._theme)
+                self._saved_theme = saved_config.get("theme")
+                self._save_snapshot(data)
+                return True
         except Exception as e:
             print(f"Error loading config: {e}")
 
         return False
+
+    def _load_snapshot(self) -> bool:
+        """
+        Load the merged settings from the snapshot if it matches the config file
+
+        The snapshot is used when the file's mtime and size are unchanged, or
+        when its content hash is (e.g. after a touch or a copy).
+
+        Returns:
+            bool: True if the snapshot was valid and loaded
+        """
+        try:
+            with open(self.snapshot_file, "rb") as f:
+                snapshot = marshal.load(f)
+            stat = os.stat(self.config_file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+
+        if not isinstance(snapshot, dict) or snapshot.get("defaults") != _defaults_fingerprint():
+            return False
+
+        if (snapshot.get("mtime_ns"), snapshot.get("size")) != (stat.st_mtime_ns, stat.st_size):
+            with open(self.config_file, "rb") as f:
+                data = f.read()
+            if hashlib.sha256(data).hexdigest() != snapshot.get("sha256"):
+                return False
+            # Same content under a new mtime: refresh the fast-path key
+            snapshot["mtime_ns"], snapshot["size"] = stat.st_mtime_ns, stat.st_size
+            self._write_snapshot(snapshot)
+
+        self._settings = snapshot["settings"]
+        self._grading_scheme = None
+        if snapshot["has_theme"]:
+            self._theme = snapshot["theme"]
+        self._saved_theme = snapshot["theme"]
+        return True
+
+    def _save_snapshot(self, data: bytes) -> None:
+        """
+        Cache the merged settings for the config file content just loaded or saved
+
+        Args:
+            data: Raw content of the config file
+        """
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            return
+        self._write_snapshot({
+            "defaults": _defaults_fingerprint(),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "settings": self._settings,
+            "theme": self._saved_theme,
+            "has_theme": self._saved_theme is not None
+        })
+
+    def _write_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        """Write a snapshot atomically; a failure only costs the next startup a full parse"""
+        temp_path = self.snapshot_file + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                marshal.dump(snapshot, f)
+            os.replace(temp_path, self.snapshot_file)
+        except (OSError, ValueError) as e:
+            print(f"Error writing config snapshot: {e}")
+    
+    def reload_config(self) -> set:
+        """
+        Re-read the configuration file and report which sections changed
+        
+        Returns:
+            set: Names of changed top-level settings sections (e.g. "Themes", "fonts",
+                 "typing"), plus "theme" if the selected theme changed
+        """
+        old_settings = self._settings
+        old_theme = self._theme
+        old_saved_theme = self._saved_theme
+        
+        self._settings = self._load_default_settings()
+        if not self.load_config():
+            # Keep the running configuration if the file is missing or invalid
+            self._settings = old_settings
+            self._theme = old_theme
+            return set()
+        
+        # Only a theme edited in the file replaces the theme currently in use
+        if self._saved_theme == old_saved_theme:
+            self._theme = old_theme
+        
+        self._grading_scheme = None
+        changed = {section for section in set(old_settings) | set(self._settings)
+                   if old_settings.get(section) != self._settings.get(section)}
+        if self._theme != old_theme:
+            changed.add("theme")
+        return changed
     
     def save_config(self) -> bool:
         """
@@ -205,8 +390,12 @@ class AppConfig(iConfig):
                 "settings": self._settings
             }
 
-            with open(self.config_file, "w") as f:
-                json.dump(config_to_save, f, indent=4)
+            data = json.dumps(config_to_save, indent=4).encode("utf-8")
+            with open(self.config_file, "wb") as f:
+                f.write(data)
+            self._saved_theme = self._theme
+            self._save_snapshot(data)
+            CONFIG_SAVES.inc()
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -229,12 +418,14 @@ class AppConfig(iConfig):
         
         if "settings" in saved_config:
             merge_dicts(self._settings, saved_config["settings"])
+            self._grading_scheme = None
         
     def reset_to_defaults(self) -> None:
         """
         Reset configuration to default settings
         """
         self._settings = self._load_default_settings()
+        self._grading_scheme = None
         self._theme = "light"
         self.save_config()
     
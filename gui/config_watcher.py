@@ -0,0 +1,114 @@
+import os
+from typing import Callable, Dict, List, Optional, Set
+
+from gui.config import AppConfig
+
+# How often the config file is checked for changes (ms)
+DEFAULT_POLL_INTERVAL_MS = 2000
+
+# Subscribers of this section are notified about every change
+ALL_SECTIONS = "*"
+
+
+class ConfigWatcher:
+    def __init__(self, config: AppConfig, interval_ms: int = DEFAULT_POLL_INTERVAL_MS):
+        """
+        Watch the config file and notify subscribers about changed sections
+
+        Polling only stats the file; it is re-parsed when its mtime or size
+        changes, and subscribers are called only for sections whose merged
+        settings actually differ.
+
+        Args:
+            config: Application config to reload
+            interval_ms: Polling interval in milliseconds
+        """
+        self.config = config
+        self.interval_ms = interval_ms
+        self._subscribers: Dict[str, List[Callable[[Set[str]], None]]] = {}
+        self._signature = self._stat_signature()
+        self._widget = None
+        self._job = None
+
+    def subscribe(self, section: str, callback: Callable[[Set[str]], None]) -> None:
+        """
+        Register a callback for changes of a settings section
+
+        Args:
+            section: Section name ("Themes", "fonts", "typing", "theme", ...) or ALL_SECTIONS
+            callback: Called with the set of changed sections
+        """
+        self._subscribers.setdefault(section, []).append(callback)
+
+    def unsubscribe(self, section: str, callback: Callable[[Set[str]], None]) -> None:
+        """
+        Remove a callback registered with subscribe
+
+        Args:
+            section: Section name used when subscribing
+            callback: Callback to remove
+        """
+        callbacks = self._subscribers.get(section, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def poll(self) -> Set[str]:
+        """
+        Check the config file once and dispatch changes
+
+        Returns:
+            set: Changed sections (empty if nothing changed)
+        """
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return set()
+
+        self._signature = signature
+        changed = self.config.reload_config()
+        if changed:
+            self._notify(changed)
+        return changed
+
+    def start(self, widget) -> None:
+        """
+        Start polling on the Tk event loop
+
+        Args:
+            widget: Any Tk widget used to schedule the polls
+        """
+        self.stop()
+        self._widget = widget
+        self._job = widget.after(self.interval_ms, self._tick)
+
+    def stop(self) -> None:
+        """Stop polling"""
+        if self._widget is not None and self._job is not None:
+            self._widget.after_cancel(self._job)
+        self._job = None
+
+    def _tick(self) -> None:
+        try:
+            self.poll()
+        except Exception as e:
+            print(f"Error reloading config: {e}")
+        self._job = self._widget.after(self.interval_ms, self._tick)
+
+    def _notify(self, changed: Set[str]) -> None:
+        notified = set()
+        for section in list(changed) + [ALL_SECTIONS]:
+            for callback in self._subscribers.get(section, []):
+                # A callback subscribed to several changed sections runs once
+                if callback in notified:
+                    continue
+                notified.add(callback)
+                try:
+                    callback(changed)
+                except Exception as e:
+                    print(f"Config subscriber error: {e}")
+
+    def _stat_signature(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.config.config_file)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
@@ -2,7 +2,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import sys
 import os
-from typing import Dict
+import time
+from typing import Callable, Dict
 
 # Adjust sys.path to include project root for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -12,9 +13,27 @@ sys.path.insert(0, project_root)
 # Imports from best_practice modules
 from gui.config import AppConfig
 from gui.contracts.i_main_window import iMainWindow
+from gui.passage_picker import PassagePicker
+from gui.passage_view import VirtualPassageView
+from gui.config_watcher import ConfigWatcher
+from gui.statistics_view import StatisticsDialog
 from core.calculator import Calculator
 from core.text_manager import TextManager
 from core.timer import Timer
+from core.leaderboard import (DEFAULT_HOST as DEFAULT_LEADERBOARD_HOST, DEFAULT_PORT as DEFAULT_LEADERBOARD_PORT,
+                              LeaderboardClient)
+from core.result_exporter import ResultExporter
+from core.prefetcher import PassagePrefetcher
+from core.resource_monitor import ResourceMonitor
+from core.typist_simulator import BACKSPACE, char_for_keysym
+from core.word_stats import WordTracker
+from core.keystroke_analytics import KeystrokeAnalytics
+from core.session_history import SessionHistory
+from core.metrics import (KEYSTROKES_SCORED, SCORING_SECONDS, SESSIONS_COMPLETED, SESSIONS_STARTED,
+                          MetricsExporter)
+
+# Persisted full-text index of the passage corpus
+SEARCH_INDEX_FILE = "search_index.json"
 
 class MenuBar(tk.Menu):
     def __init__(self, master=None, callbacks: dict = None):
@@ -75,6 +94,8 @@ class MenuBar(tk.Menu):
                               command=self.callbacks.get('show_instructions', self.default_show_instructions))
         help_menu.add_command(label="Statistics",
                               command=self.callbacks.get('show_statistics', self.default_show_statistics))
+        help_menu.add_command(label="Leaderboard",
+                              command=self.callbacks.get('show_leaderboard', self.default_show_leaderboard))
         help_menu.add_separator()
         help_menu.add_command(label="About",
                               command=self.callbacks.get('show_about', self.default_show_about))
@@ -96,6 +117,8 @@ class MenuBar(tk.Menu):
         messagebox.showinfo("Instructions", "Instructions action triggered.")
     def default_show_statistics(self):
         messagebox.showinfo("Statistics", "Statistics action triggered.")
+    def default_show_leaderboard(self):
+        messagebox.showinfo("Leaderboard", "Leaderboard action triggered.")
     def default_show_about(self):
         messagebox.showinfo("About", "About action triggered.")
     
@@ -126,6 +149,7 @@ class BaseWindow(tk.Tk, iMainWindow):
                 'change_difficulty': self.dependencies.get('change_difficulty_handler'),
                 'show_instructions': self.dependencies.get('show_instructions_handler'),
                 'show_statistics': self.dependencies.get('show_statistics_handler'),
+                'show_leaderboard': self.dependencies.get('show_leaderboard_handler'),
                 'show_about': self.dependencies.get('show_about_handler')
             }
             self.menu_bar = MenuBar(self, callbacks=menu_callbacks)
@@ -142,7 +166,8 @@ class BaseWindow(tk.Tk, iMainWindow):
     
 class MainWindow(BaseWindow, iMainWindow):
     def __init__(self, config: AppConfig = None, menu_bar: MenuBar = None,
-                 calculator: Calculator= None, text_manager: TextManager= None, timer: Timer=None):
+                 calculator: Calculator= None, text_manager: TextManager= None, timer: Timer=None,
+                 leaderboard_client: LeaderboardClient = None):
         
         # Create dependencies dictionary
         dependencies = {
@@ -156,6 +181,7 @@ class MainWindow(BaseWindow, iMainWindow):
             "change_difficulty_handler": self.handle_change_difficulty,
             "show_instructions_handler": self.handle_show_instructions,
             "show_statistics_handler": self.handle_show_statistics,
+            "show_leaderboard_handler": self.handle_show_leaderboard,
             "show_about_handler": self.handle_show_about,
         }
         
@@ -166,5 +192,438 @@ class MainWindow(BaseWindow, iMainWindow):
         self.calculator = calculator or Calculator()
         self.timer = timer or Timer()
         self.text_manager = text_manager or TextManager()
+        Calculator.set_grading_scheme(self.app_config.get_grading_scheme())
+        # Optional connection to a local leaderboard server
+        leaderboard = self.app_config._settings.get("leaderboard", {})
+        if leaderboard_client is None and leaderboard.get("enabled"):
+            leaderboard_client = LeaderboardClient(leaderboard.get("host", DEFAULT_LEADERBOARD_HOST),
+                                                   int(leaderboard.get("port", DEFAULT_LEADERBOARD_PORT)))
+        self.leaderboard_client = leaderboard_client
+        self.player_name = leaderboard.get("player_name", "anonymous")
+
+        # Completed session results, oldest first
+        self.session_history = []
+        # Column store with day/week rollups for the statistics charts
+        self.history = SessionHistory()
+        # Per-key and per-transition timing across every test of the session
+        self.keystroke_analytics = KeystrokeAnalytics()
+        self.exporter = None
+
+        # Share one copy of the corpus between app processes on multi-seat hosts
+        corpus_settings = self.app_config._settings.get("corpus", {})
+        if corpus_settings.get("shared_memory"):
+            try:
+                self.text_manager.attach_shared_corpus(corpus_settings.get("segment_name"))
+            except (FileNotFoundError, ValueError) as e:
+                print(f"Shared corpus unavailable, using local texts: {e}")
+        if self.text_manager.shared_corpus is not None:
+            # Indexed on the first search so attaching stays instant
+            self.text_manager.search_index_path = SEARCH_INDEX_FILE
+        else:
+            self.text_manager.enable_search_index(SEARCH_INDEX_FILE)
+
+        # Typing display (only the visible lines of long passages are materialized)
+        self.passage_view = VirtualPassageView(self, font=self.app_config.get_font("monospace"),
+                                               colors=self.get_passage_colors())
+        self.passage_view.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+
+        # Apply config file changes without restarting, touching only affected parts
+        self.config_watcher = ConfigWatcher(self.app_config)
+        self.config_watcher.subscribe("fonts", self.on_fonts_changed)
+        self.config_watcher.subscribe("Themes", self.on_theme_changed)
+        self.config_watcher.subscribe("theme", self.on_theme_changed)
+        self.config_watcher.subscribe("typing", self.on_typing_settings_changed)
+        self.config_watcher.start(self)
+
+        # Characters typed for the current passage (real or synthetic key events)
+        self.typed_chars = []
+        self.word_tracker = None
+        self.bind("<KeyPress>", self.on_key_press)
+
+        # Keep the next passages selected, analyzed and laid out in the background
+        self.current_passage = None
+        self.prefetcher = PassagePrefetcher(self.text_manager, line_width=self.passage_view.columns)
+        self.prefetcher.request()
+
+        # Optional leak monitoring for long-running kiosks
+        self.resource_monitor = None
+        monitoring = self.app_config._settings.get("monitoring", {})
+        if monitoring.get("enabled"):
+            self.resource_monitor = ResourceMonitor(monitoring.get("log_file", "resource_monitor.log"))
+            self.resource_monitor.start(self, int(monitoring.get("interval_seconds", 60) * 1000))
+
+        # Optional Prometheus metrics for fleet monitoring
+        self.metrics_exporter = None
+        metrics = self.app_config._settings.get("metrics", {})
+        if metrics.get("enabled"):
+            self.metrics_exporter = MetricsExporter(textfile=metrics.get("textfile"),
+                                                    interval=metrics.get("interval_seconds", 15),
+                                                    http_port=metrics.get("http_port"))
+            try:
+                self.metrics_exporter.start()
+            except OSError as e:
+                print(f"Metrics endpoint unavailable: {e}")
+
+        # Closing the window stops the background workers too
+        self.protocol("WM_DELETE_WINDOW", self.handle_exit_app)
+
+    def handle_new_test(self):
+        """Start a new test with a prefetched passage"""
+        self.prefetcher.set_line_width(self.passage_view.columns)
+        passage = self.prefetcher.take()
+
+        self.current_passage = passage
+        self.reset_test(passage.text, passage.word_index, passage.line_starts)
+
+        if self.resource_monitor:
+            self.resource_monitor.mark_test_boundary_in_background()
+
+    def reset_test(self, text: str, word_index=None, line_starts=None):
+        """
+        Reset the test state in place for a new passage
+
+        The display widget, its tags, the typed-character buffer, the word
+        statistics arrays and the timer thread are all reused, so repeated
+        restarts redraw in one pass and allocate nothing that outlives a test.
+
+        Args:
+            text: Passage text
+            word_index: Optional precomputed word index of the passage
+            line_starts: Optional precomputed line wrapping of the passage
+        """
+        self.timer.reset()
+        word_index = self.text_manager.select_text(text, word_index)
+        if self.word_tracker is None:
+            self.word_tracker = WordTracker(word_index)
+        else:
+            self.word_tracker.reset(word_index)
+        self.typed_chars.clear()
+        self.keystroke_analytics.end_stream()
+        self.passage_view.set_text(text, line_starts)
+
+    def handle_change_difficulty(self, difficulty: str):
+        """
+        Change the difficulty level and prepare passages for it
+
+        Args:
+            difficulty: Difficulty level (easy, medium, hard, programming)
+        """
+        try:
+            self.text_manager.set_difficulty_level(difficulty)
+        except ValueError as e:
+            messagebox.showerror("Difficulty", str(e))
+            return
+        # Passages prepared for the old level are no longer wanted
+        self.prefetcher.invalidate()
+
+    def handle_change_theme(self, theme: str):
+        """
+        Switch to another theme and save it in the config
+
+        Args:
+            theme: Theme name (dark/light)
+        """
+        if theme not in self.app_config.get_available_themes():
+            messagebox.showerror("Theme", f"Unknown theme: {theme}")
+            return
+        self.app_config.set_theme(theme)
+        self.on_theme_changed({"theme"})
+
+    def on_fonts_changed(self, changed: set):
+        """Restyle text widgets after a font change in the config"""
+        self.passage_view.set_font(self.app_config.get_font("monospace"))
+
+    def on_theme_changed(self, changed: set):
+        """Recolor widgets after a theme change in the config"""
+        self.passage_view.apply_colors(self.get_passage_colors())
+
+    def on_typing_settings_changed(self, changed: set):
+        """Update the timer and grading after a typing settings change in the config"""
+        typing_settings = self.app_config._settings.get("typing", {})
+        duration = typing_settings.get("default_duration")
+        if duration and not self.timer.is_running:
+            self.timer.duration = duration
+        Calculator.set_grading_scheme(self.app_config.get_grading_scheme())
+
+    def get_passage_colors(self) -> Dict[str, str]:
+        """
+        Get typing display colors for the current theme
+
+        Returns:
+            dict: Colors keyed by display element
+        """
+        return {
+            "background": self.app_config.get_color("display_bg"),
+            "foreground": self.app_config.get_color("display_fg"),
+            "correct": self.app_config.get_color("success"),
+            "error": self.app_config.get_color("error"),
+            "current": self.app_config.get_color("warning")
+        }
+
+    def handle_load_text(self):
+        """Open the passage picker to search the corpus or import a file"""
+        PassagePicker(self, self.text_manager, on_select=self.load_passage)
+
+    def load_passage(self, text: str):
+        """
+        Use a passage for the next test
+
+        Args:
+            text: Passage text
+        """
+        self.current_passage = None
+        self.reset_test(text)
+
+    def on_key_press(self, event):
+        """
+        Apply one keystroke to the current passage
+
+        Args:
+            event: Tk key event
+        """
+        text = self.text_manager.current_text
+        if not text:
+            return None
+
+        if event.keysym == BACKSPACE:
+            if self.typed_chars:
+                self.typed_chars.pop()
+                if self.word_tracker:
+                    self.word_tracker.record_backspace(len(self.typed_chars), self.timer.get_elapsed_time())
+                # The keystroke after a correction is not a transition from the deleted one
+                self.keystroke_analytics.end_stream()
+                self.passage_view.clear_char(len(self.typed_chars))
+                self.passage_view.set_caret(len(self.typed_chars))
+            return "break"
+
+        char = event.char or char_for_keysym(event.keysym)
+        position = len(self.typed_chars)
+        if not char or not char.isprintable() or position >= len(text):
+            return None
+
+        if position == 0 and not self.timer.is_running:
+            self.timer.start_timer()
+            SESSIONS_STARTED.inc()
+        self.typed_chars.append(char)
+        elapsed = self.timer.get_elapsed_time()
+        if self.word_tracker:
+            self.word_tracker.record_keystroke(position, char, elapsed)
+        self.keystroke_analytics.record_keystroke(text[position], char, elapsed)
+        self.passage_view.mark_char(position, char == text[position])
+        self.passage_view.set_caret(position + 1)
+        KEYSTROKES_SCORED.inc()
+        if position + 1 == len(text):
+            self.finish_test()
+        return "break"
+
+    def finish_test(self) -> Dict:
+        """
+        Score the current test and store its result
+
+        Returns:
+            dict: Session result
+        """
+        self.timer.stop()
+        duration = self.timer.get_elapsed_time()
+        with SCORING_SECONDS.time():
+            accuracy = Calculator.calculate_detailed_accuracy("".join(self.typed_chars),
+                                                              self.text_manager.current_text)
+            minutes = duration / 60
+            wpm, _, _ = Calculator.calculate_wpm(accuracy.correct_chars, accuracy.total_chars, minutes)
+            net_wpm = Calculator.calculate_words_per_minute_net(accuracy.correct_chars, accuracy.errors, minutes)
+
+        result = {
+            "timestamp": time.time(),
+            "difficulty": self.text_manager.get_difificulty_level(),
+            "duration": round(duration, 2),
+            "wpm": wpm,
+            "net_wpm": net_wpm,
+            "accuracy": accuracy.accuracy,
+            "errors": accuracy.errors
+        }
+        self.record_session(result)
+        SESSIONS_COMPLETED.inc()
+        self.submit_to_leaderboard(self.player_name, wpm, net_wpm, accuracy.accuracy,
+                                   on_done=self._on_leaderboard_submitted)
+        return result
+
+    def _on_leaderboard_submitted(self, response: Dict):
+        """Show the rank of a submitted result in the title bar"""
+        if response.get("ok"):
+            self.title(f"{self.app_config.APP_NAME} - rank {response['rank']} of {response['total']}")
+        else:
+            print(f"Leaderboard submit failed: {response.get('error')}")
+
+    def get_word_results(self) -> Dict:
+        """
+        Get per-word results of the current test for the results view
+
+        Returns:
+            dict: "words" (per-word WordResult list) and "most_missed" ((word, errors) list)
+        """
+        if not self.word_tracker:
+            return {"words": [], "most_missed": []}
+        return {
+            "words": self.word_tracker.get_word_results(),
+            "most_missed": self.word_tracker.get_most_missed_words()
+        }
+
+    def record_session(self, result: Dict):
+        """
+        Store a completed session result
+
+        Args:
+            result: Session result with "wpm", "accuracy" and "timestamp"
+        """
+        self.session_history.append(result)
+        self.history.add(result)
+
+    def handle_show_statistics(self):
+        """Show WPM and accuracy history charts"""
+        StatisticsDialog(self, self.history, self.keystroke_analytics, colors={
+            "background": self.app_config.get_color("display_bg"),
+            "foreground": self.app_config.get_color("display_fg"),
+            "grid": self.app_config.get_color("secondary"),
+            "line": self.app_config.get_color("primary")
+        })
+
+    def handle_show_leaderboard(self):
+        """Show the leaderboard standings for the current difficulty"""
+        if not self.leaderboard_client:
+            messagebox.showinfo("Leaderboard", "No leaderboard server is configured.")
+            return
+
+        def on_done(response):
+            if not response.get("ok"):
+                messagebox.showerror("Leaderboard", f"Leaderboard unavailable: {response.get('error')}")
+                return
+            lines = [f"{entry['rank']}. {entry['name']}  {entry['score']:.1f} WPM  {entry['accuracy']:.1f}%"
+                     for entry in response["entries"]]
+            messagebox.showinfo(f"Leaderboard - {self.text_manager.get_difificulty_level()}",
+                                "\n".join(lines) or "No results yet.")
+
+        self.fetch_leaderboard(on_done)
+
+    def handle_open_settings(self):
+        """Tell where preferences are kept (the config file is reloaded while the app runs)"""
+        messagebox.showinfo("Preferences",
+                            f"Preferences are read from {os.path.abspath(self.app_config.config_file)}.\n"
+                            "Changes to fonts, themes and typing settings apply without restarting.")
+
+    def handle_show_instructions(self):
+        """Show how to take a test"""
+        messagebox.showinfo("Instructions",
+                            "1. Start a new test with File > New Test (Ctrl+N), or pick a passage "
+                            "with File > Load Text (Ctrl+O).\n"
+                            "2. Type the passage; the timer starts with the first key.\n"
+                            "3. Backspace corrects the last character.\n"
+                            "4. The test ends after the last character; see Help > Statistics "
+                            "for your progress.")
+
+    def handle_show_about(self):
+        """Show the application name and version"""
+        messagebox.showinfo("About", f"{self.app_config.APP_NAME} {self.app_config.VERSION}")
+
+    def iter_session_results(self):
+        """
+        Iterate over stored session results without copying them
+
+        Yields:
+            dict: One session result
+        """
+        yield from self.session_history
+
+    def handle_save_results(self):
+        """Export session results to CSV or JSONL on a worker thread"""
+        if self.exporter is not None:
+            messagebox.showinfo("Save Results", "An export is already running.")
+            return
+
+        file_path = filedialog.asksaveasfilename(
+            title="Save Results", defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"),
+                       ("Compressed CSV", "*.csv.gz"), ("Compressed JSON Lines", "*.jsonl.gz")])
+        if not file_path:
+            return
+
+        title = self.title()
+        on_progress = self._on_tk_thread(lambda rows: self.title(f"{title} - exporting ({rows} rows)"))
+
+        def on_done(rows, error):
+            self.exporter = None
+            self.title(title)
+            if error:
+                messagebox.showerror("Save Results", f"Export failed: {error}")
+            else:
+                messagebox.showinfo("Save Results", f"Exported {rows} results to {file_path}")
+
+        self.exporter = ResultExporter(progress_callback=on_progress)
+        self.exporter.export_in_background(self.iter_session_results(), file_path,
+                                           on_done=self._on_tk_thread(on_done))
+
+    def handle_export_config(self):
+        """Export the current configuration to a file"""
+        file_path = filedialog.asksaveasfilename(title="Export Config", defaultextension=".json",
+                                                 filetypes=[("JSON", "*.json")])
+        if not file_path:
+            return
+        if self.app_config.export_config(file_path):
+            messagebox.showinfo("Export Config", f"Configuration exported to {file_path}")
+        else:
+            messagebox.showerror("Export Config", f"Could not export the configuration to {file_path}")
+
+    def handle_exit_app(self):
+        """Stop background work and close the window"""
+        self.shutdown()
+        self.destroy()
+
+    def shutdown(self):
+        """Stop every background thread, server and scheduled callback owned by the window"""
+        self.config_watcher.stop()
+        if self.exporter is not None:
+            self.exporter.cancel()
+        self.timer.close()
+        self.prefetcher.stop()
+        if self.metrics_exporter:
+            self.metrics_exporter.stop()
+        if self.resource_monitor:
+            self.resource_monitor.close()
+        if self.leaderboard_client:
+            self.leaderboard_client.close()
+
+    def submit_to_leaderboard(self, name: str, wpm: float, net_wpm: float, accuracy: float,
+                              on_done: Callable[[Dict], None] = None):
+        """
+        Submit a result to the leaderboard without blocking the UI
+
+        Args:
+            name: Player name
+            wpm: Gross WPM
+            net_wpm: Net WPM
+            accuracy: Accuracy percentage
+            on_done: Called on the Tk thread with the server response
+        """
+        if not self.leaderboard_client:
+            return
+        self.leaderboard_client.submit_result(
+            name, self.text_manager.get_difificulty_level(), wpm, net_wpm, accuracy,
+            callback=self._on_tk_thread(on_done))
+
+    def fetch_leaderboard(self, on_done: Callable[[Dict], None], limit: int = 10):
+        """
+        Fetch standings for the current difficulty without blocking the UI
+
+        Args:
+            on_done: Called on the Tk thread with the server response
+            limit: Maximum number of entries
+        """
+        if not self.leaderboard_client:
+            return
+        self.leaderboard_client.fetch_standings(
+            self.text_manager.get_difificulty_level(), limit, callback=self._on_tk_thread(on_done))
 
-        
\ No newline at end of file
+    def _on_tk_thread(self, callback: Callable = None) -> Callable:
+        """Wrap a callback so it runs on the Tk thread when called from a worker"""
+        if callback is None:
+            return None
+        return lambda *args: self.after(0, lambda: callback(*args))
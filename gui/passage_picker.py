@@ -0,0 +1,169 @@
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+from typing import Callable, Optional
+
+from gui.virtual_list import VirtualListView
+
+# Delay before a search runs while the user is still typing (ms)
+SEARCH_DELAY_MS = 150
+# Interval between list updates while custom texts are still being analyzed (ms)
+INDEX_PROGRESS_MS = 250
+MAX_RESULTS = 200
+ALL_DIFFICULTIES = "all"
+
+
+class PassagePicker(tk.Toplevel):
+    def __init__(self, master, text_manager, on_select: Optional[Callable[[str], None]] = None):
+        """
+        Dialog to search the passage corpus and import text files
+
+        Args:
+            master: Parent window
+            text_manager: TextManager providing search, paging and file import
+            on_select: Called with the chosen passage
+        """
+        super().__init__(master)
+        self.text_manager = text_manager
+        self.on_select = on_select
+        self._search_job = None
+        self._progress_job = None
+        # The search index is saved once when the dialog closes
+        self._imported = False
+
+        self.title("Load Text")
+        self.geometry("600x400")
+        self.transient(master)
+        self.create_widgets()
+        self.search_entry.focus_set()
+        self.run_search()
+
+    def create_widgets(self):
+        """Create the search field, result list and buttons"""
+        self.query_var = tk.StringVar()
+        self.query_var.trace_add("write", lambda *args: self.schedule_search())
+
+        search_frame = ttk.Frame(self)
+        search_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
+        self.search_entry = ttk.Entry(search_frame, textvariable=self.query_var)
+        self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
+        self.difficulty_var = tk.StringVar(value=ALL_DIFFICULTIES)
+        difficulty_box = ttk.Combobox(
+            search_frame, textvariable=self.difficulty_var, state="readonly", width=14,
+            values=[ALL_DIFFICULTIES] + self.text_manager.get_available_difficulty_levels())
+        difficulty_box.pack(side=tk.RIGHT, padx=(5, 0))
+        difficulty_box.bind("<<ComboboxSelected>>", lambda event: self.run_search())
+
+        # Browses the whole library page by page when the search field is empty
+        self.result_list = VirtualListView(self, on_activate=self.use_passage)
+        self.result_list.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        self.status_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.status_var).pack(fill=tk.X, padx=10, pady=5)
+
+        button_frame = ttk.Frame(self)
+        button_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(button_frame, text="Import File...", command=self.import_file).pack(side=tk.LEFT)
+        ttk.Button(button_frame, text="Import Folder...", command=self.import_folder).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Cancel", command=self.destroy).pack(side=tk.RIGHT)
+        ttk.Button(button_frame, text="Use Passage", command=self.use_selected).pack(side=tk.RIGHT, padx=5)
+
+    def schedule_search(self):
+        """Run the search once the user pauses typing"""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(SEARCH_DELAY_MS, self.run_search)
+
+    def run_search(self):
+        """Search the corpus, or browse it when the query is empty"""
+        self._search_job = None
+        if self._progress_job is not None:
+            self.after_cancel(self._progress_job)
+            self._progress_job = None
+        query = self.query_var.get()
+        difficulty = self.difficulty_var.get()
+        difficulty = None if difficulty == ALL_DIFFICULTIES else difficulty
+
+        if query.strip():
+            results = self.text_manager.search_texts(query, MAX_RESULTS, difficulty)
+            self.result_list.set_source(lambda offset, limit: results[offset:offset + limit], len(results))
+            self.status_var.set(f"{len(results)} passages found")
+        else:
+            total = self.text_manager.count_texts(difficulty)
+            self.result_list.set_source(
+                lambda offset, limit: self.text_manager.get_texts_page(offset, limit, difficulty), total)
+            self.status_var.set(f"{total} passages")
+            # Filtered browsing shows the texts analyzed so far and grows as the rest is analyzed
+            if difficulty is not None and self.text_manager.index_difficulties_in_background():
+                self.update_progress(difficulty)
+
+    def update_progress(self, difficulty: str):
+        """
+        Grow the filtered list while the difficulty index is being built
+
+        Args:
+            difficulty: Difficulty filter of the list
+        """
+        self._progress_job = None
+        total = self.text_manager.count_texts(difficulty)
+        self.result_list.set_total(total)
+        analyzed, custom_total = self.text_manager.get_difficulty_index_progress()
+        if analyzed < custom_total:
+            self.status_var.set(f"{total} passages so far (analyzed {analyzed} of {custom_total} texts)")
+            self._progress_job = self.after(INDEX_PROGRESS_MS, lambda: self.update_progress(difficulty))
+        else:
+            self.status_var.set(f"{total} passages")
+
+    def use_selected(self):
+        """Use the selected passage and close the dialog"""
+        self.result_list.activate_selected()
+
+    def use_passage(self, text: str):
+        """
+        Use a passage and close the dialog
+
+        Args:
+            text: Chosen passage
+        """
+        if self.on_select:
+            self.on_select(text)
+        self.destroy()
+
+    def import_file(self):
+        """Import a text file into the corpus"""
+        file_path = filedialog.askopenfilename(
+            parent=self, title="Load Text",
+            filetypes=[("Text files", "*.txt"), ("Compressed text", "*.gz *.bz2 *.xz"), ("All files", "*.*")])
+        if not file_path:
+            return
+
+        if self.text_manager.load_texts_from_file(file_path):
+            self._imported = True
+            self.status_var.set(f"Imported {file_path}")
+            self.run_search()
+        else:
+            messagebox.showerror("Load Text", f"No texts could be loaded from {file_path}", parent=self)
+
+    def import_folder(self):
+        """Import every (compressed) text file of a folder into the corpus"""
+        folder = filedialog.askdirectory(parent=self, title="Load Texts From Folder")
+        if not folder:
+            return
+
+        added = self.text_manager.load_texts_from_source(folder)
+        if added:
+            self._imported = True
+            self.run_search()
+        self.status_var.set(f"Imported {added} texts from {folder}")
+
+    def destroy(self):
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+            self._search_job = None
+        if self._progress_job is not None:
+            self.after_cancel(self._progress_job)
+            self._progress_job = None
+        if self._imported:
+            self._imported = False
+            self.text_manager.save_search_index()
+        super().destroy()
@@ -0,0 +1,272 @@
+import tkinter as tk
+import tkinter.font as tkfont
+from tkinter import ttk
+from typing import Dict, Optional
+
+from core.text_layout import wrap_lines, line_of_offset
+
+# Per-character typing state kept in the backing buffer
+UNTYPED = 0
+CORRECT = 1
+ERROR = 2
+
+_STATE_TAGS = {CORRECT: "correct", ERROR: "error"}
+
+
+class VirtualPassageView(ttk.Frame):
+    def __init__(self, master=None, visible_lines: int = 8, margin_lines: int = 4,
+                 font: tuple = ("Courier New", 12), colors: Optional[Dict[str, str]] = None):
+        """
+        Typing display that only materializes the visible part of a passage
+
+        The full passage, its wrapped line offsets and the per-character typing
+        state live in compact buffers; the Text widget holds only the visible
+        lines plus a margin, so redraw cost does not grow with passage length.
+
+        Args:
+            master: Parent widget
+            visible_lines: Number of lines shown at once
+            margin_lines: Extra lines materialized above and below the visible ones
+            font: Monospace font used for the passage
+            colors: Colors for background, foreground, correct, error and current
+        """
+        super().__init__(master)
+        self.visible_lines = visible_lines
+        self.margin_lines = margin_lines
+        self.font = tkfont.Font(self, font=font)
+        self.colors = colors or {}
+
+        self.text = ""
+        self.states = bytearray()
+        self.line_starts = wrap_lines("", 1)
+        self.columns = 80
+        self.caret = 0
+        self.top_line = 0
+        # Materialized window: lines [window_first, window_last)
+        self.window_first = 0
+        self.window_last = 0
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Create the text widget and its scrollbar"""
+        self.display = tk.Text(self, height=self.visible_lines, wrap=tk.NONE, font=self.font,
+                               cursor="arrow", takefocus=0, borderwidth=0, highlightthickness=0,
+                               background=self.colors.get("background", "#ffffff"),
+                               foreground=self.colors.get("foreground", "#212529"))
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.display.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.apply_colors(self.colors)
+
+        self.display.configure(state=tk.DISABLED)
+        self.display.bind("<Configure>", self._on_resize)
+        self.display.bind("<MouseWheel>", self._on_mousewheel)
+        self.display.bind("<Button-4>", lambda event: self.scroll_lines(-1))
+        self.display.bind("<Button-5>", lambda event: self.scroll_lines(1))
+
+    def apply_colors(self, colors: Dict[str, str]):
+        """
+        Apply theme colors to the display
+
+        Args:
+            colors: Colors for background, foreground, correct, error and current
+        """
+        self.colors = colors
+        self.display.configure(background=colors.get("background", "#ffffff"),
+                               foreground=colors.get("foreground", "#212529"))
+        self.display.tag_configure("correct", foreground=colors.get("correct", "#28a745"))
+        self.display.tag_configure("error", foreground=colors.get("error", "#dc3545"), underline=True)
+        self.display.tag_configure("current", background=colors.get("current", "#ffc107"))
+
+    def set_font(self, font: tuple):
+        """
+        Change the passage font, re-wrapping for the new character width
+
+        Args:
+            font: Monospace font description
+        """
+        self.font = tkfont.Font(self, font=font)
+        self.display.configure(font=self.font)
+        self._update_columns(self.display.winfo_width())
+
+    def set_text(self, text: str, line_starts=None):
+        """
+        Show a new passage, resetting the typing state
+
+        Args:
+            text: Passage text (any length)
+            line_starts: Optional precomputed wrap_lines(text, self.columns)
+        """
+        self.text = text
+        # Reuse the state buffer across passages
+        self.states[:] = bytes(len(text))
+        self.caret = 0
+        self.top_line = 0
+        self._relayout(line_starts)
+
+    def mark_char(self, offset: int, correct: bool):
+        """
+        Record the typing state of one character
+
+        Args:
+            offset: Character offset in the passage
+            correct: Whether the character was typed correctly
+        """
+        if not 0 <= offset < len(self.text):
+            return
+
+        state = CORRECT if correct else ERROR
+        self.states[offset] = state
+        index = self._widget_index(offset)
+        if index is not None:
+            self.display.tag_remove(_STATE_TAGS[ERROR if correct else CORRECT], index)
+            self.display.tag_add(_STATE_TAGS[state], index)
+
+    def clear_char(self, offset: int):
+        """
+        Reset one character to untyped (e.g. after backspace)
+
+        Args:
+            offset: Character offset in the passage
+        """
+        if not 0 <= offset < len(self.text):
+            return
+
+        self.states[offset] = UNTYPED
+        index = self._widget_index(offset)
+        if index is not None:
+            self.display.tag_remove("correct", index)
+            self.display.tag_remove("error", index)
+
+    def set_caret(self, offset: int):
+        """
+        Move the caret, sliding the materialized window when it leaves the view
+
+        Args:
+            offset: Character offset of the next character to type
+        """
+        self.caret = max(0, min(offset, len(self.text)))
+        line = line_of_offset(self.line_starts, self.caret)
+
+        # Keep the caret on the second visible line so upcoming text is shown
+        if line < self.top_line or line >= self.top_line + self.visible_lines - 1:
+            self._scroll_to(max(0, line - 1))
+
+        self._update_caret_tag()
+
+    def scroll_lines(self, delta: int):
+        """
+        Scroll the view by a number of lines
+
+        Args:
+            delta: Lines to scroll (negative scrolls up)
+        """
+        self._scroll_to(self.top_line + delta)
+
+    def _scroll_to(self, top_line: int):
+        """Show the view starting at top_line, re-materializing if needed"""
+        max_top = max(0, len(self.line_starts) - self.visible_lines)
+        self.top_line = max(0, min(top_line, max_top))
+
+        last_visible = self.top_line + self.visible_lines
+        if self.top_line < self.window_first or last_visible > self.window_last:
+            self._materialize()
+        else:
+            self.display.yview_moveto(0)
+            self.display.yview_scroll(self.top_line - self.window_first, "units")
+        self._update_scrollbar()
+
+    def _relayout(self, line_starts=None):
+        """Recompute line wrapping for the current width (unless given) and redraw"""
+        self.line_starts = line_starts if line_starts is not None else wrap_lines(self.text, self.columns)
+        line = line_of_offset(self.line_starts, self.caret)
+        self.top_line = max(0, line - 1) if self.caret else 0
+        self._materialize()
+        self._update_caret_tag()
+        self._update_scrollbar()
+
+    def _materialize(self):
+        """Load the visible lines plus margin into the widget and tag them"""
+        line_count = len(self.line_starts)
+        self.window_first = max(0, self.top_line - self.margin_lines)
+        self.window_last = min(line_count, self.top_line + self.visible_lines + self.margin_lines)
+
+        text = self.text
+        line_starts = self.line_starts
+        lines = []
+        for line in range(self.window_first, self.window_last):
+            end = line_starts[line + 1] if line + 1 < line_count else len(text)
+            lines.append(text[line_starts[line]:end].rstrip("\n"))
+
+        self.display.configure(state=tk.NORMAL)
+        self.display.delete("1.0", tk.END)
+        self.display.insert("1.0", "\n".join(lines))
+        self._tag_window()
+        self.display.configure(state=tk.DISABLED)
+
+        self.display.yview_moveto(0)
+        self.display.yview_scroll(self.top_line - self.window_first, "units")
+
+    def _tag_window(self):
+        """Apply state tags to the materialized lines, one tag per run of equal states"""
+        if self.window_first >= self.window_last:
+            return
+
+        start = self.line_starts[self.window_first]
+        end = self.line_starts[self.window_last] if self.window_last < len(self.line_starts) else len(self.text)
+        states = self.states
+        position = start
+        while position < end:
+            state = states[position]
+            run_end = position + 1
+            while run_end < end and states[run_end] == state:
+                run_end += 1
+            if state != UNTYPED:
+                self.display.tag_add(_STATE_TAGS[state], self._widget_index(position),
+                                     self._widget_index(run_end - 1) + "+1c")
+            position = run_end
+
+    def _update_caret_tag(self):
+        """Highlight the character under the caret"""
+        self.display.tag_remove("current", "1.0", tk.END)
+        index = self._widget_index(self.caret)
+        if index is not None:
+            self.display.tag_add("current", index)
+
+    def _widget_index(self, offset: int) -> Optional[str]:
+        """Convert a passage offset to a widget index, or None if not materialized"""
+        if offset >= len(self.text):
+            return None
+
+        line = line_of_offset(self.line_starts, offset)
+        if not self.window_first <= line < self.window_last:
+            return None
+        return f"{line - self.window_first + 1}.{offset - self.line_starts[line]}"
+
+    def _update_scrollbar(self):
+        line_count = max(1, len(self.line_starts))
+        first = self.top_line / line_count
+        last = min(1.0, (self.top_line + self.visible_lines) / line_count)
+        self.scrollbar.set(first, last)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == tk.MOVETO:
+            self._scroll_to(int(float(value) * len(self.line_starts)))
+        elif action == tk.SCROLL:
+            step = self.visible_lines if unit == tk.PAGES else 1
+            self.scroll_lines(int(value) * step)
+
+    def _on_mousewheel(self, event):
+        self.scroll_lines(-1 if event.delta > 0 else 1)
+        return "break"
+
+    def _on_resize(self, event):
+        self._update_columns(event.width)
+
+    def _update_columns(self, width: int):
+        """Re-wrap the passage if the number of columns fitting in width changed"""
+        columns = max(10, width // max(1, self.font.measure("0")) - 1)
+        if columns != self.columns:
+            self.columns = columns
+            self._relayout()
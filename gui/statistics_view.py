@@ -0,0 +1,214 @@
+import time
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, Optional
+
+from core.keystroke_analytics import KeystrokeAnalytics
+from core.session_history import DAY_SECONDS, SessionHistory
+
+# Zoom levels: label and span in seconds (None shows the whole history)
+ZOOM_LEVELS = (
+    ("All", None),
+    ("Year", 365 * DAY_SECONDS),
+    ("Month", 30 * DAY_SECONDS),
+    ("Week", 7 * DAY_SECONDS),
+    ("Day", DAY_SECONDS)
+)
+GRID_LINES = 5
+PADDING = {"left": 48, "right": 12, "top": 12, "bottom": 24}
+# Pixels per plotted point; the point budget follows the chart width
+PIXELS_PER_POINT = 2
+# Slowest key transitions listed under the charts
+SLOWEST_TRANSITIONS = 5
+VISIBLE_SPACE = "\u2423"
+
+
+class HistoryChart(tk.Canvas):
+    def __init__(self, master=None, title: str = "", unit: str = "", colors: Optional[Dict[str, str]] = None,
+                 **kwargs):
+        """
+        Line chart of one history metric
+
+        All canvas items are created once and updated in place on redraw.
+
+        Args:
+            master: Parent widget
+            title: Chart title
+            unit: Unit shown after the axis values
+            colors: "background", "foreground", "grid" and "line" colors
+        """
+        colors = colors or {}
+        super().__init__(master, highlightthickness=0, background=colors.get("background", "#ffffff"), **kwargs)
+        self.title = title
+        self.unit = unit
+        self.colors = colors
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Create the reusable canvas items"""
+        foreground = self.colors.get("foreground", "#000000")
+        grid = self.colors.get("grid", "#dddddd")
+        self.grid_items = [self.create_line(0, 0, 0, 0, fill=grid) for _ in range(GRID_LINES)]
+        self.label_items = [self.create_text(0, 0, anchor=tk.E, fill=foreground, font=("Arial", 8))
+                            for _ in range(GRID_LINES)]
+        self.title_item = self.create_text(PADDING["left"], 2, anchor=tk.NW, fill=foreground,
+                                           font=("Arial", 9, "bold"), text=self.title)
+        self.range_item = self.create_text(0, 0, anchor=tk.SE, fill=foreground, font=("Arial", 8))
+        # A line needs at least two points; hidden until there is data
+        self.line_item = self.create_line(0, 0, 0, 0, fill=self.colors.get("line", "#4a9eff"),
+                                          width=1.5, state=tk.HIDDEN)
+        self.empty_item = self.create_text(0, 0, fill=foreground, text="No sessions yet", state=tk.HIDDEN)
+
+    def draw(self, xs, ys, x_range: tuple, caption: str = ""):
+        """
+        Show a series
+
+        Args:
+            xs: Timestamps
+            ys: Values
+            x_range: (start, end) of the time axis
+            caption: Text shown under the chart (e.g. the data resolution)
+        """
+        width = max(self.winfo_width(), 1)
+        height = max(self.winfo_height(), 1)
+        left, top = PADDING["left"], PADDING["top"]
+        right, bottom = width - PADDING["right"], height - PADDING["bottom"]
+
+        self.coords(self.range_item, right, height - 4)
+        self.itemconfigure(self.range_item, text=caption)
+
+        if not len(xs):
+            self.itemconfigure(self.line_item, state=tk.HIDDEN)
+            self.coords(self.empty_item, width / 2, height / 2)
+            self.itemconfigure(self.empty_item, state=tk.NORMAL)
+            for grid_item, label_item in zip(self.grid_items, self.label_items):
+                self.itemconfigure(grid_item, state=tk.HIDDEN)
+                self.itemconfigure(label_item, state=tk.HIDDEN)
+            return
+        self.itemconfigure(self.empty_item, state=tk.HIDDEN)
+
+        low, high = min(ys), max(ys)
+        if high - low < 1e-9:
+            low, high = low - 1, high + 1
+        start, end = x_range
+        span = (end - start) or 1.0
+        x_scale = (right - left) / span
+        y_scale = (bottom - top) / (high - low)
+
+        for index, (grid_item, label_item) in enumerate(zip(self.grid_items, self.label_items)):
+            value = low + (high - low) * index / (GRID_LINES - 1)
+            y = bottom - (value - low) * y_scale
+            self.coords(grid_item, left, y, right, y)
+            self.coords(label_item, left - 4, y)
+            self.itemconfigure(grid_item, state=tk.NORMAL)
+            self.itemconfigure(label_item, state=tk.NORMAL, text=f"{value:.0f}{self.unit}")
+
+        points = []
+        for x, y in zip(xs, ys):
+            points.append(left + (x - start) * x_scale)
+            points.append(bottom - (y - low) * y_scale)
+        if len(points) == 2:
+            # Single session: draw a short flat segment
+            points.extend((points[0] + 1, points[1]))
+        self.coords(self.line_item, *points)
+        self.itemconfigure(self.line_item, state=tk.NORMAL)
+
+
+class StatisticsDialog(tk.Toplevel):
+    def __init__(self, master, history: SessionHistory, analytics: Optional[KeystrokeAnalytics] = None,
+                 colors: Optional[Dict[str, str]] = None):
+        """
+        Dialog with WPM and accuracy history charts and the slowest key transitions
+
+        Args:
+            master: Parent window
+            history: Session history to chart
+            analytics: Keystroke statistics of the session
+            colors: Chart colors (see HistoryChart)
+        """
+        super().__init__(master)
+        self.history = history
+        self.analytics = analytics
+        self.colors = colors
+        self.span = None
+        self._redraw_job = None
+
+        self.title("Statistics")
+        self.geometry("700x500")
+        self.transient(master)
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Create the zoom buttons, charts and summary"""
+        zoom_frame = ttk.Frame(self)
+        zoom_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
+        ttk.Label(zoom_frame, text="Show:").pack(side=tk.LEFT)
+        for label, span in ZOOM_LEVELS:
+            ttk.Button(zoom_frame, text=label, command=lambda span=span: self.set_span(span)).pack(
+                side=tk.LEFT, padx=2)
+
+        self.wpm_chart = HistoryChart(self, title="WPM", colors=self.colors)
+        self.wpm_chart.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.accuracy_chart = HistoryChart(self, title="Accuracy", unit="%", colors=self.colors)
+        self.accuracy_chart.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        self.summary_var = tk.StringVar()
+        ttk.Label(self, textvariable=self.summary_var).pack(fill=tk.X, padx=10, pady=(0, 5))
+        self.transitions_var = tk.StringVar(value=self.describe_slowest_transitions())
+        ttk.Label(self, textvariable=self.transitions_var).pack(fill=tk.X, padx=10, pady=(0, 5))
+        ttk.Button(self, text="Close", command=self.destroy).pack(side=tk.RIGHT, padx=10, pady=(0, 10))
+
+        # Resizing fires many Configure events: redraw once they settle
+        self.wpm_chart.bind("<Configure>", lambda event: self.schedule_redraw())
+
+    def describe_slowest_transitions(self) -> str:
+        """
+        Describe the slowest key transitions of the session
+
+        Returns:
+            str: One line such as "Slowest transitions: th 0.31s, \u2423q 0.29s"
+        """
+        slowest = self.analytics.get_slowest_bigrams(SLOWEST_TRANSITIONS) if self.analytics else []
+        if not slowest:
+            return "Slowest transitions: not enough keystrokes yet"
+        # Spaces are shown as an open box so transitions stay readable
+        return "Slowest transitions: " + ", ".join(
+            f"{bigram.replace(' ', VISIBLE_SPACE)} {mean:.2f}s" for bigram, mean, _ in slowest)
+
+    def set_span(self, span: Optional[int]):
+        """
+        Zoom to the most recent span of time
+
+        Args:
+            span: Span in seconds, or None for the whole history
+        """
+        self.span = span
+        self.redraw()
+
+    def schedule_redraw(self):
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+        self._redraw_job = self.after(50, self.redraw)
+
+    def redraw(self):
+        """Fetch downsampled series for the current zoom and update both charts"""
+        self._redraw_job = None
+        first, last = self.history.time_range()
+        start = first if self.span is None else max(first, last - self.span)
+        max_points = max(10, self.wpm_chart.winfo_width() // PIXELS_PER_POINT)
+
+        for chart, metric in ((self.wpm_chart, "wpm"), (self.accuracy_chart, "accuracy")):
+            (xs, ys), resolution = self.history.get_series(metric, start, last, max_points)
+            caption = ""
+            if len(xs):
+                caption = (f"{time.strftime('%Y-%m-%d', time.localtime(start))} - "
+                           f"{time.strftime('%Y-%m-%d', time.localtime(last))}, per {resolution}")
+            chart.draw(xs, ys, (start, last), caption)
+
+        self.summary_var.set(f"{len(self.history)} sessions")
+
+    def destroy(self):
+        if self._redraw_job is not None:
+            self.after_cancel(self._redraw_job)
+            self._redraw_job = None
+        super().destroy()
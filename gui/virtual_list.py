@@ -0,0 +1,209 @@
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+from typing import Callable, List, Optional
+
+# Number of pages kept in memory at once
+MAX_CACHED_PAGES = 16
+
+
+class VirtualListView(ttk.Frame):
+    def __init__(self, master=None, fetch_page: Callable[[int, int], List[str]] = None,
+                 total: int = 0, page_size: int = 100, row_height: int = 22,
+                 font: tuple = ("Arial", 10), on_activate: Optional[Callable[[str], None]] = None):
+        """
+        List widget that only draws the visible rows of a large collection
+
+        Rows are Canvas items reused while scrolling, and items are fetched one
+        page at a time through fetch_page, with a bounded page cache.
+
+        Args:
+            master: Parent widget
+            fetch_page: Called with (offset, limit) and returns the items of a page
+            total: Total number of items
+            page_size: Number of items fetched per page
+            row_height: Row height in pixels
+            font: Row font
+            on_activate: Called with the item on double-click or Return
+        """
+        super().__init__(master)
+        self.fetch_page = fetch_page or (lambda offset, limit: [])
+        self.total = total
+        self.page_size = page_size
+        self.row_height = row_height
+        self.font = font
+        self.on_activate = on_activate
+
+        self.first_row = 0
+        self.selected = None
+        self._pages = OrderedDict()
+        self._row_items = []
+
+        self.create_widgets()
+
+    def create_widgets(self):
+        """Create the canvas and scrollbar"""
+        self.canvas = tk.Canvas(self, highlightthickness=0, background="#ffffff", takefocus=1)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<Double-Button-1>", lambda event: self.activate_selected())
+        self.canvas.bind("<Return>", lambda event: self.activate_selected())
+        self.canvas.bind("<Up>", lambda event: self.move_selection(-1))
+        self.canvas.bind("<Down>", lambda event: self.move_selection(1))
+        self.canvas.bind("<MouseWheel>", lambda event: self.scroll_rows(-3 if event.delta > 0 else 3))
+        self.canvas.bind("<Button-4>", lambda event: self.scroll_rows(-3))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll_rows(3))
+
+    def set_source(self, fetch_page: Callable[[int, int], List[str]], total: int):
+        """
+        Show a new collection
+
+        Args:
+            fetch_page: Called with (offset, limit) and returns the items of a page
+            total: Total number of items
+        """
+        self.fetch_page = fetch_page
+        self.total = total
+        self.first_row = 0
+        self.selected = None
+        self._pages.clear()
+        self.redraw()
+
+    def set_total(self, total: int):
+        """
+        Update the number of items of a growing collection, keeping the scroll position
+
+        Args:
+            total: Total number of items
+        """
+        if total == self.total:
+            return
+        self.total = total
+        # The last cached page may have been partial
+        self._pages.clear()
+        self.redraw()
+
+    def get_item(self, index: int) -> Optional[str]:
+        """
+        Get an item, fetching its page if needed
+
+        Args:
+            index: Item index
+
+        Returns:
+            str: Item, or None if out of range
+        """
+        if not 0 <= index < self.total:
+            return None
+
+        page_number, position = divmod(index, self.page_size)
+        page = self._pages.get(page_number)
+        if page is None:
+            page = self.fetch_page(page_number * self.page_size, self.page_size)
+            self._pages[page_number] = page
+            if len(self._pages) > MAX_CACHED_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_number)
+
+        return page[position] if position < len(page) else None
+
+    def visible_row_count(self) -> int:
+        return max(1, self.canvas.winfo_height() // self.row_height + 1)
+
+    def scroll_rows(self, delta: int):
+        """
+        Scroll by a number of rows
+
+        Args:
+            delta: Rows to scroll (negative scrolls up)
+        """
+        self.scroll_to(self.first_row + delta)
+
+    def scroll_to(self, first_row: int):
+        """
+        Scroll so that a row is the first visible one
+
+        Args:
+            first_row: Index of the first visible row
+        """
+        max_first = max(0, self.total - self.visible_row_count() + 1)
+        self.first_row = max(0, min(first_row, max_first))
+        self.redraw()
+
+    def redraw(self):
+        """Draw the visible rows, reusing existing canvas items"""
+        width = self.canvas.winfo_width()
+        row_count = self.visible_row_count()
+
+        # Grow the row pool to fit the view; extra rows are hidden, never deleted
+        while len(self._row_items) < row_count:
+            background = self.canvas.create_rectangle(0, 0, 0, 0, outline="", fill="")
+            label = self.canvas.create_text(0, 0, anchor=tk.W, font=self.font, text="")
+            self._row_items.append((background, label))
+
+        for row, (background, label) in enumerate(self._row_items):
+            index = self.first_row + row
+            item = self.get_item(index) if row < row_count else None
+            if item is None:
+                self.canvas.itemconfigure(background, state=tk.HIDDEN)
+                self.canvas.itemconfigure(label, state=tk.HIDDEN)
+                continue
+
+            top = row * self.row_height
+            fill = "#cce5ff" if index == self.selected else ""
+            self.canvas.coords(background, 0, top, width, top + self.row_height)
+            self.canvas.itemconfigure(background, fill=fill, state=tk.NORMAL)
+            self.canvas.coords(label, 6, top + self.row_height // 2)
+            self.canvas.itemconfigure(label, text=item, state=tk.NORMAL)
+
+        self._update_scrollbar(row_count)
+
+    def move_selection(self, delta: int):
+        """
+        Move the selection, scrolling it into view
+
+        Args:
+            delta: Rows to move (negative moves up)
+        """
+        if not self.total:
+            return
+
+        current = self.selected if self.selected is not None else self.first_row - delta
+        self.selected = max(0, min(current + delta, self.total - 1))
+        row_count = self.visible_row_count() - 1
+        if self.selected < self.first_row:
+            self.first_row = self.selected
+        elif self.selected >= self.first_row + row_count:
+            self.first_row = self.selected - row_count + 1
+        self.redraw()
+
+    def activate_selected(self):
+        """Call on_activate with the selected item"""
+        item = self.get_item(self.selected) if self.selected is not None else None
+        if item is not None and self.on_activate:
+            self.on_activate(item)
+
+    def _on_click(self, event):
+        self.canvas.focus_set()
+        index = self.first_row + event.y // self.row_height
+        if index < self.total:
+            self.selected = index
+            self.redraw()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == tk.MOVETO:
+            self.scroll_to(int(float(value) * self.total))
+        elif action == tk.SCROLL:
+            step = self.visible_row_count() if unit == tk.PAGES else 1
+            self.scroll_rows(int(value) * step)
+
+    def _update_scrollbar(self, row_count: int):
+        if not self.total:
+            self.scrollbar.set(0, 1)
+            return
+        self.scrollbar.set(self.first_row / self.total, min(1.0, (self.first_row + row_count) / self.total))
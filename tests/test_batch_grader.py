@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from core.batch_grader import BatchGrader, main, score_attempt
+
+
+def write_attempts(path, attempts):
+    with open(path, "w", encoding="utf-8") as file:
+        for attempt in attempts:
+            file.write(attempt if isinstance(attempt, str) else json.dumps(attempt))
+            file.write("\n")
+
+
+def read_results(path):
+    with open(path, "r", encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_score_attempt():
+    result = score_attempt({"id": 7, "target": "hello world", "typed": "hello world", "duration": 6})
+
+    assert result["id"] == 7
+    assert result["accuracy"] == 100
+    assert result["net_wpm"] == pytest.approx(22.0)
+    assert (result["speed_grade"], result["accuracy_grade"]) == ("Novice", "Excellent")
+
+
+def test_score_attempt_rejects_bad_types():
+    with pytest.raises(TypeError):
+        score_attempt({"target": "abc", "typed": 123, "duration": 1})
+    with pytest.raises(TypeError):
+        score_attempt(["abc"])
+    with pytest.raises(ValueError):
+        score_attempt({"target": "abc", "typed": "abc", "duration": "nan"})
+
+
+def test_bad_records_do_not_abort_the_job(tmp_path):
+    input_path = tmp_path / "attempts.jsonl"
+    output_path = tmp_path / "results.jsonl"
+    write_attempts(input_path, [
+        {"id": 1, "target": "abc", "typed": "abc", "duration": 1},
+        {"id": 2, "target": "abc", "typed": 5, "duration": 1},
+        "not json",
+        {"id": 4, "target": "abc", "typed": "abd", "duration": 1},
+    ])
+
+    processed = BatchGrader(max_workers=2, chunk_size=2).grade_file(str(input_path), str(output_path))
+
+    results = read_results(output_path)
+    assert processed == 4
+    assert [result.get("id") for result in results] == [1, None, None, 4]
+    assert results[1]["line"] == 2 and results[1]["error"].startswith("TypeError")
+    assert results[2]["line"] == 3
+    assert not (tmp_path / "results.jsonl.checkpoint").exists()
+
+
+def test_invalid_grading_is_rejected_up_front(tmp_path, capsys):
+    grading_path = tmp_path / "grading.json"
+    grading_path.write_text(json.dumps({"speed": []}), encoding="utf-8")
+    input_path = tmp_path / "attempts.jsonl"
+    write_attempts(input_path, [{"target": "abc", "typed": "abc", "duration": 1}])
+
+    status = main([str(input_path), str(tmp_path / "results.jsonl"), "--grading", str(grading_path)])
+
+    assert status == 2
+    assert "Invalid grading scales" in capsys.readouterr().out
+    assert main([str(input_path), str(tmp_path / "results.jsonl"),
+                 "--grading", str(tmp_path / "missing.json")]) == 2
+
+
+class Interrupted(Exception):
+    pass
+
+
+class InterruptedGrader(BatchGrader):
+    """Stops after writing the first chunk, like a job killed mid-run"""
+
+    def _run(self, chunks):
+        for index, item in enumerate(super()._run(chunks)):
+            if index == 1:
+                raise Interrupted()
+            yield item
+
+
+def test_interrupted_run_resumes_from_the_checkpoint(tmp_path):
+    input_path = tmp_path / "attempts.jsonl"
+    output_path = tmp_path / "results.jsonl"
+    write_attempts(input_path, [{"id": i, "target": "abc", "typed": "abc", "duration": 1} for i in range(1, 8)])
+
+    with pytest.raises(Interrupted):
+        InterruptedGrader(max_workers=1, chunk_size=3).grade_file(str(input_path), str(output_path))
+    assert (tmp_path / "results.jsonl.checkpoint").exists()
+    # A result written after the last checkpoint is dropped on resume
+    with open(output_path, "ab") as file:
+        file.write(b'{"id": "partial"')
+
+    grader = BatchGrader(max_workers=1, chunk_size=3)
+    processed = grader.grade_file(str(input_path), str(output_path))
+
+    assert processed == 4
+    assert grader.summary["resumed_at"] == 3
+    assert [result["id"] for result in read_results(output_path)] == list(range(1, 8))
+    assert not (tmp_path / "results.jsonl.checkpoint").exists()
@@ -0,0 +1,20 @@
+from core.calculator import Calculator
+from core.results import ProgressMetrics
+
+
+def test_progress_metrics_without_sessions_are_zero():
+    metrics = Calculator.calculate_progress_metrics([])
+
+    assert isinstance(metrics, ProgressMetrics)
+    assert metrics.total_sessions == 0
+    assert metrics["average_wpm"] == 0
+
+
+def test_progress_metrics_compare_both_halves():
+    sessions = [{"wpm": 30, "accuracy": 85}, {"wpm": 40, "accuracy": 95}]
+
+    metrics = Calculator.calculate_progress_metrics(sessions)
+
+    assert metrics.average_wpm == 35
+    assert metrics.wpm_improvement_percent == 33.33
+    assert metrics.accuracy_improvement_percent == 10
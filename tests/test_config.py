@@ -0,0 +1,99 @@
+import json
+
+from gui.config import AppConfig
+from gui.config_watcher import ALL_SECTIONS, ConfigWatcher
+
+
+def write_config(path, theme="light", **settings):
+    path.write_text(json.dumps({"theme": theme, "settings": settings}))
+
+
+def test_reload_reports_changed_sections(tmp_path):
+    path = tmp_path / "config.json"
+    write_config(path, typing={"default_duration": 60})
+    config = AppConfig(config_file=str(path))
+
+    write_config(path, typing={"default_duration": 120})
+
+    assert config.reload_config() == {"typing"}
+    assert config._settings["typing"]["default_duration"] == 120
+
+
+def test_reload_keeps_the_running_theme_unless_the_file_changes_it(tmp_path):
+    path = tmp_path / "config.json"
+    write_config(path)
+    config = AppConfig(config_file=str(path))
+    config._theme = "dark"
+
+    write_config(path, typing={"default_duration": 30})
+    assert "theme" not in config.reload_config()
+    assert config.get_theme() == "dark"
+
+    write_config(path, theme="blue", typing={"default_duration": 30})
+    assert config.reload_config() == {"theme"}
+    assert config.get_theme() == "blue"
+
+
+def test_invalid_file_keeps_the_running_settings(tmp_path, capsys):
+    path = tmp_path / "config.json"
+    write_config(path, typing={"default_duration": 45})
+    config = AppConfig(config_file=str(path))
+
+    path.write_text("{not json")
+
+    assert config.reload_config() == set()
+    assert config._settings["typing"]["default_duration"] == 45
+
+
+def test_watcher_notifies_subscribers_of_changed_sections_once(tmp_path):
+    path = tmp_path / "config.json"
+    write_config(path)
+    watcher = ConfigWatcher(AppConfig(config_file=str(path)))
+    calls = []
+    watcher.subscribe("fonts", lambda changed: calls.append(("fonts", changed)))
+    watcher.subscribe("typing", lambda changed: calls.append(("typing", changed)))
+    everything = lambda changed: calls.append(("all", changed))
+    watcher.subscribe("typing", everything)
+    watcher.subscribe(ALL_SECTIONS, everything)
+
+    assert watcher.poll() == set()
+    write_config(path, typing={"default_duration": 90})
+
+    assert watcher.poll() == {"typing"}
+    assert calls == [("typing", {"typing"}), ("all", {"typing"})]
+    assert watcher.poll() == set()
+
+
+def test_snapshot_is_used_while_the_file_is_unchanged(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    write_config(path, theme="dark", typing={"default_duration": 75})
+    AppConfig(config_file=str(path))
+    assert (tmp_path / "config.json.snapshot").exists()
+
+    def no_merge(self, saved_config):
+        raise AssertionError("the config file was parsed again")
+    monkeypatch.setattr(AppConfig, "_merge_config", no_merge)
+    config = AppConfig(theme=None, config_file=str(path))
+
+    assert config._settings["typing"]["default_duration"] == 75
+    assert config.get_theme() == "dark"
+
+
+def test_edited_file_invalidates_the_snapshot(tmp_path):
+    path = tmp_path / "config.json"
+    write_config(path, typing={"default_duration": 75})
+    AppConfig(config_file=str(path))
+
+    write_config(path, typing={"default_duration": 105})
+
+    assert AppConfig(config_file=str(path))._settings["typing"]["default_duration"] == 105
+
+
+def test_corrupt_snapshot_falls_back_to_the_file(tmp_path):
+    path = tmp_path / "config.json"
+    write_config(path, typing={"default_duration": 75})
+    AppConfig(config_file=str(path))
+
+    (tmp_path / "config.json.snapshot").write_bytes(b"\x00garbage")
+
+    assert AppConfig(config_file=str(path))._settings["typing"]["default_duration"] == 75
@@ -0,0 +1,71 @@
+from core.corpus_pipeline import CorpusPipeline, _process_shard, find_sentence_boundary
+from core.resource_monitor import live_instance_counts
+from core.text_manager import TextManager
+
+CORPUS = ("Mr. Brown opened the shop at dawn. Customers came early! Was the bread fresh? "
+          "Dr. Green said it was. The queue grew long, e.g. past the corner. ") * 200
+
+
+def write_corpus(tmp_path, content=CORPUS):
+    path = tmp_path / "corpus.txt"
+    path.write_text(content, encoding="utf-8")
+    return str(path)
+
+
+def test_shards_never_end_after_an_abbreviation(tmp_path):
+    path = write_corpus(tmp_path)
+    pipeline = CorpusPipeline(max_workers=1, shard_size=37)
+
+    shards = pipeline.plan_shards([path])
+
+    data = CORPUS.encode("utf-8")
+    assert shards[0][1] == 0 and shards[-1][2] == len(data)
+    for (_, _, end), (_, start, _) in zip(shards, shards[1:]):
+        assert end == start
+    for _, _, end in shards[:-1]:
+        last_word = data[:end].split()[-1].lower()
+        assert last_word not in (b"mr.", b"dr.", b"e.g.")
+
+
+def test_boundary_search_skips_abbreviations(tmp_path):
+    content = "It was Mr. Brown. Then it rained."
+    path = write_corpus(tmp_path, content)
+
+    boundary = find_sentence_boundary(path, content.index("Mr.") + 1, len(content))
+
+    assert content[:boundary] == "It was Mr. Brown. "
+
+
+def test_parallel_ingest_keeps_the_serial_text(tmp_path):
+    path = write_corpus(tmp_path, "".join(f"Sentence number {i} ends here. " for i in range(3000)))
+    serial = TextManager()
+    serial.load_texts_from_file(path)
+    parallel = TextManager()
+
+    added = CorpusPipeline(max_workers=2, shard_size=4096).ingest([path], parallel)
+
+    assert added == len(parallel.costum_texts)
+    # Segments may be packed differently at shard edges, the text is the same
+    assert " ".join(parallel.costum_texts) == " ".join(serial.costum_texts)
+
+
+def test_duplicate_segments_are_ingested_once(tmp_path):
+    path = write_corpus(tmp_path)
+    pipeline = CorpusPipeline(max_workers=2, shard_size=4096)
+    manager = TextManager()
+
+    added = pipeline.ingest([path], manager)
+
+    assert added == pipeline.summary["unique_segments"] == len(set(manager.costum_texts))
+    assert pipeline.summary["duplicates"] > 0
+
+
+def test_workers_do_not_build_text_managers(tmp_path):
+    path = write_corpus(tmp_path)
+    before = live_instance_counts().get("TextManager", 0)
+
+    results = _process_shard((path, 0, len(CORPUS)))
+
+    assert live_instance_counts().get("TextManager", 0) == before
+    assert [segment for segment, _ in results] == list(dict.fromkeys(TextManager()._iter_text_segments(CORPUS)))
+    assert results[0][1]["estimated_difficulty"] in ("easy", "medium", "hard")
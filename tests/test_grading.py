@@ -0,0 +1,48 @@
+import pytest
+
+from core.grading import DEFAULT_GRADING, GradingScheme
+
+
+def test_default_grades():
+    scheme = GradingScheme.default()
+
+    assert scheme.grade(85, 99) == ("Expert", "Excellent", "Professional")
+    assert scheme.grade(45, 92) == ("Intermediate", "Good", "Proficient")
+    assert scheme.grade(10, 50) == ("Novice", "Poor", "Learning")
+
+
+def test_thresholds_are_inclusive():
+    scheme = GradingScheme.default()
+
+    assert scheme.grade(80, 98)[:2] == ("Expert", "Excellent")
+    assert scheme.grade(79.9, 97.9)[:2] == ("Advanced", "Very Good")
+
+
+def test_overall_needs_both_speed_and_accuracy():
+    scheme = GradingScheme.default()
+
+    assert scheme.grade(90, 85)[2] == "Developing"
+    assert scheme.grade(20, 100)[2] == "Learning"
+
+
+def test_batch_matches_single_grades():
+    scheme = GradingScheme.default()
+    wpms = [0, 24.9, 25, 41, 60, 99]
+    accuracies = [0, 79, 80, 91, 95, 100]
+
+    assert scheme.grade_batch(wpms, accuracies) == [scheme.grade(w, a) for w, a in zip(wpms, accuracies)]
+
+
+def test_custom_scales_fall_back_to_defaults():
+    scheme = GradingScheme({"speed": [[100, "Fast"], [0, "Slow"]]})
+
+    assert scheme.grade(99, 99)[0] == "Slow"
+    assert scheme.grade(100, 99)[0] == "Fast"
+    assert scheme.grade(100, 99)[1] == GradingScheme(DEFAULT_GRADING).grade(100, 99)[1]
+
+
+def test_invalid_scales_are_rejected():
+    with pytest.raises(ValueError):
+        GradingScheme({"speed": []})
+    with pytest.raises(ValueError):
+        GradingScheme({"overall": [[60, 80, "A"], [40, 90, "B"], [0, 0, "C"]]})
@@ -0,0 +1,74 @@
+from array import array
+
+import pytest
+
+from core.keystroke_analytics import ALPHABET_SIZE, KeystrokeAnalytics
+
+
+def type_text(analytics, target, typed, interval=0.1, slow=(), slow_interval=0.5):
+    timestamp = 0.0
+    for expected, actual in zip(target, typed):
+        timestamp += slow_interval if expected in slow else interval
+        analytics.record_keystroke(expected, actual, timestamp)
+    analytics.end_stream()
+
+
+def test_key_and_bigram_statistics():
+    analytics = KeystrokeAnalytics()
+    type_text(analytics, "abab", "abxb")
+
+    assert analytics.total_keystrokes == 4 and analytics.total_errors == 1
+    assert analytics.get_key_stats("a")["errors"] == 1
+    ab = analytics.get_bigram_stats("ab")
+    assert ab["samples"] == 2 and ab["mean_interval"] == pytest.approx(0.1)
+    assert analytics.get_bigram_stats("ba")["errors"] == 1
+
+
+def test_slowest_bigrams_and_error_prone_keys():
+    analytics = KeystrokeAnalytics()
+    for _ in range(3):
+        type_text(analytics, "the quick", "the quikc", slow="q")
+
+    slowest = analytics.get_slowest_bigrams(1)
+
+    assert slowest == [(" q", 0.5, 3)]
+    assert analytics.get_error_prone_keys(2) == [("c", 3), ("k", 3)]
+
+
+def test_pauses_and_stream_ends_are_not_transitions():
+    analytics = KeystrokeAnalytics(max_interval=1.0)
+    analytics.record_keystroke("a", "a", 0.0)
+    analytics.record_keystroke("b", "b", 5.0)
+    analytics.end_stream()
+    analytics.record_keystroke("c", "c", 5.1)
+
+    assert analytics.get_bigram_stats("ab")["samples"] == 0
+    assert analytics.get_bigram_stats("bc")["samples"] == 0
+
+
+def test_merge_matches_a_single_stream():
+    first, second, combined = KeystrokeAnalytics(), KeystrokeAnalytics(), KeystrokeAnalytics()
+    type_text(first, "abab", "abab", interval=0.1)
+    type_text(second, "abab", "abab", interval=0.3)
+    type_text(combined, "abab", "abab", interval=0.1)
+    type_text(combined, "abab", "abab", interval=0.3)
+
+    first.merge(second)
+
+    assert first.get_bigram_stats("ab") == combined.get_bigram_stats("ab")
+    assert first.total_keystrokes == combined.total_keystrokes
+
+
+def test_serialized_tables_have_a_fixed_width():
+    analytics = KeystrokeAnalytics()
+    type_text(analytics, "hello world", "hellp world")
+
+    data = analytics.to_bytes()
+    restored = KeystrokeAnalytics.from_bytes(data)
+
+    cells = ALPHABET_SIZE + ALPHABET_SIZE * ALPHABET_SIZE
+    assert len(data) == 2 * 8 + cells * (8 + 8 + 8 + 8)
+    assert array('Q', data[:16]).tolist() == [11, 1]
+    assert restored.get_bigram_stats("he") == analytics.get_bigram_stats("he")
+    with pytest.raises(ValueError):
+        KeystrokeAnalytics.from_bytes(data[:-8])
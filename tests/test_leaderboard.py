@@ -0,0 +1,64 @@
+import asyncio
+import json
+
+import pytest
+
+from core.leaderboard import MAX_REQUEST_BYTES, LeaderboardServer, RankedBoard
+
+
+def test_ranks_by_score_then_accuracy():
+    board = RankedBoard()
+    board.add("a", 50, 90)
+    board.add("b", 60, 80)
+
+    assert board.add("c", 50, 95) == 2
+    assert [entry["name"] for entry in board.top(3)] == ["b", "c", "a"]
+    assert board.rank_of(55) == 2
+
+
+def test_submit_and_top():
+    server = LeaderboardServer()
+    server.handle_request({"op": "submit", "name": "ann", "difficulty": "easy", "net_wpm": 40, "accuracy": 95})
+    response = server.handle_request({"op": "submit", "name": "bob", "difficulty": "easy",
+                                      "net_wpm": 55, "accuracy": 90})
+
+    assert response == {"ok": True, "rank": 1, "total": 2}
+    top = server.handle_request({"op": "top", "difficulty": "easy", "limit": 1})
+    assert [entry["name"] for entry in top["entries"]] == ["bob"]
+
+
+def test_invalid_values_are_rejected():
+    server = LeaderboardServer()
+
+    with pytest.raises(ValueError):
+        server.handle_request({"op": "submit", "net_wpm": "nan", "accuracy": 90})
+    with pytest.raises(ValueError):
+        server.handle_request({"op": "submit", "net_wpm": 40, "accuracy": 101})
+
+
+def test_unknown_difficulties_get_no_board():
+    server = LeaderboardServer(difficulties=["easy"])
+
+    with pytest.raises(ValueError):
+        server.handle_request({"op": "submit", "difficulty": "x" * 10, "net_wpm": 40, "accuracy": 90})
+    assert list(server.boards) == ["easy"]
+
+
+def test_oversized_request_gets_an_error_response():
+    async def exchange():
+        server = LeaderboardServer(port=0, difficulties=["medium"])
+        await server.start()
+        port = server._server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"x" * (MAX_REQUEST_BYTES + 10) + b"\n")
+            await writer.drain()
+            response = json.loads(await reader.readline())
+            writer.close()
+            return response
+        finally:
+            await server.close()
+
+    response = asyncio.run(exchange())
+
+    assert response == {"ok": False, "error": "Request too long"}
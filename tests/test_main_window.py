@@ -0,0 +1,44 @@
+from types import SimpleNamespace
+
+from gui.main_window import MainWindow
+
+HANDLERS = ("handle_new_test", "handle_load_text", "handle_save_results", "handle_export_config",
+            "handle_exit_app", "handle_open_settings", "handle_change_theme", "handle_change_difficulty",
+            "handle_show_instructions", "handle_show_statistics", "handle_show_leaderboard",
+            "handle_show_about")
+
+
+class Service:
+    def __init__(self, calls, name):
+        self.calls = calls
+        self.name = name
+
+    def __getattr__(self, method):
+        return lambda *args: self.calls.append(f"{self.name}.{method}")
+
+
+def test_every_menu_handler_is_defined():
+    assert [name for name in HANDLERS if not callable(getattr(MainWindow, name, None))] == []
+
+
+def test_shutdown_stops_every_background_service():
+    calls = []
+    window = SimpleNamespace(**{name: Service(calls, name) for name in (
+        "config_watcher", "exporter", "timer", "prefetcher", "metrics_exporter", "resource_monitor",
+        "leaderboard_client")})
+
+    MainWindow.shutdown(window)
+
+    assert calls == ["config_watcher.stop", "exporter.cancel", "timer.close", "prefetcher.stop",
+                     "metrics_exporter.stop", "resource_monitor.close", "leaderboard_client.close"]
+
+
+def test_shutdown_skips_disabled_services():
+    calls = []
+    window = SimpleNamespace(config_watcher=Service(calls, "config_watcher"), exporter=None,
+                             timer=Service(calls, "timer"), prefetcher=Service(calls, "prefetcher"),
+                             metrics_exporter=None, resource_monitor=None, leaderboard_client=None)
+
+    MainWindow.shutdown(window)
+
+    assert calls == ["config_watcher.stop", "timer.close", "prefetcher.stop"]
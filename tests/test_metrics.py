@@ -0,0 +1,56 @@
+import pytest
+
+from core.metrics import Metric, MetricsRegistry
+
+
+def test_render_exposition_format():
+    registry = MetricsRegistry()
+    counter = registry.counter("app_events_total", "Events")
+    gauge = registry.gauge("app_items", "Items")
+    histogram = registry.histogram("app_seconds", "Durations", (0.1, 1.0))
+    counter.inc()
+    counter.inc(2)
+    gauge.set(5)
+    gauge.dec()
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(7)
+
+    text = registry.render()
+
+    assert "# TYPE app_events_total counter\napp_events_total 3\n" in text
+    assert "app_items 4\n" in text
+    assert 'app_seconds_bucket{le="0.1"} 1\n' in text
+    assert 'app_seconds_bucket{le="1"} 2\n' in text
+    assert 'app_seconds_bucket{le="+Inf"} 3\n' in text
+    assert "app_seconds_sum 7.55\n" in text
+    assert "app_seconds_count 3\n" in text
+
+
+def test_registration_is_idempotent_per_type():
+    registry = MetricsRegistry()
+
+    assert registry.counter("app_total", "A") is registry.counter("app_total", "A")
+    with pytest.raises(ValueError):
+        registry.gauge("app_total", "A")
+
+
+def test_counters_only_increase():
+    with pytest.raises(ValueError):
+        MetricsRegistry().counter("app_total", "A").inc(-1)
+
+
+def test_metric_is_abstract():
+    with pytest.raises(TypeError):
+        Metric("app_metric", "Incomplete")
+
+
+def test_textfile_is_written_atomically(tmp_path):
+    registry = MetricsRegistry()
+    registry.gauge("app_items", "Items").set(2)
+    path = tmp_path / "app.prom"
+
+    assert registry.write_textfile(str(path))
+
+    assert path.read_text(encoding="utf-8") == registry.render()
+    assert [entry.name for entry in tmp_path.iterdir()] == ["app.prom"]
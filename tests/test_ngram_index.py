@@ -0,0 +1,65 @@
+import pytest
+
+from core.ngram_index import NgramIndex
+from core.text_manager import TextManager
+
+PASSAGES = [
+    "The quick brown fox jumps.",
+    "Pack my box with five dozen liquor jugs.",
+    "Sphinx of black quartz, judge my vow.",
+]
+
+
+def build_index(passages=None):
+    index = NgramIndex(passages=passages)
+    for passage in PASSAGES:
+        index.add_passage(passage)
+    return index
+
+
+def test_extract_ngrams_is_case_insensitive():
+    index = NgramIndex((2,))
+
+    assert index.extract_ngrams("AbA") == {"ab", "ba"}
+
+
+def test_best_passages_cover_weighted_ngrams():
+    index = build_index()
+
+    best = index.find_best_passages({"qu": 2.0, "ju": 1.0, "ox": 1.0})
+
+    assert best[0] == (0, 4.0)
+    assert {passage_id for passage_id, _ in best} == {0, 1, 2}
+    assert index.get_document_frequency("QU") == 3
+
+
+def test_unindexed_sizes_and_unknown_ngrams_are_ignored():
+    index = build_index()
+
+    assert index.find_best_passages(["q", "quick brown", "zzz"]) == []
+
+
+def test_ties_go_to_the_earlier_passage():
+    index = build_index()
+
+    assert [passage_id for passage_id, _ in index.find_best_passages(["ju"], limit=2)] == [0, 1]
+
+
+def test_referenced_passages_are_not_copied():
+    index = build_index(PASSAGES)
+
+    assert len(index) == 3
+    assert index.get_passage(1) is PASSAGES[1]
+
+
+def test_invalid_sizes():
+    with pytest.raises(ValueError):
+        NgramIndex((0, 2))
+
+
+def test_custom_texts_are_indexed_incrementally():
+    manager = TextManager()
+    manager.build_ngram_index()
+    manager.add_costum_text("Xylophones xylophone xylophonists.")
+
+    assert manager.get_text_for_weak_ngrams(["xyl"]) == "Xylophones xylophone xylophonists."
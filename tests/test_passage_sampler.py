@@ -0,0 +1,55 @@
+from collections import Counter
+
+import pytest
+
+from core.passage_sampler import PassageSampler
+
+
+def test_draws_follow_the_weights():
+    sampler = PassageSampler([1, 0, 3], window=0, seed=7)
+
+    counts = Counter(sampler.draw() for _ in range(4000))
+
+    assert counts[1] == 0
+    assert 2.5 < counts[2] / counts[0] < 3.5
+
+
+def test_recent_draws_are_not_repeated():
+    sampler = PassageSampler([1] * 5, window=3, seed=3)
+
+    draws = [sampler.draw() for _ in range(200)]
+
+    for position in range(3, len(draws)):
+        assert draws[position] not in draws[position - 3:position]
+
+
+def test_window_shrinks_for_small_pools():
+    sampler = PassageSampler([1, 1], window=5, seed=1)
+
+    draws = [sampler.draw() for _ in range(10)]
+
+    assert draws[::2] == [draws[0]] * 5 and draws[1::2] == [draws[1]] * 5
+
+
+def test_added_passages_are_drawn():
+    sampler = PassageSampler([1.0], window=0, seed=5)
+    for _ in range(1000):
+        sampler.add(1.0)
+    sampler.add(10000.0)
+
+    assert len(sampler) == 1002
+    assert Counter(sampler.draw() for _ in range(100)).most_common(1)[0][0] == 1001
+
+
+def test_same_seed_gives_the_same_sequence():
+    first = PassageSampler([1, 2, 3, 4], seed=42)
+    second = PassageSampler([1, 2, 3, 4], seed=42)
+
+    assert [first.draw() for _ in range(50)] == [second.draw() for _ in range(50)]
+
+
+def test_empty_sampler_raises():
+    with pytest.raises(IndexError):
+        PassageSampler([0, 0]).draw()
+    with pytest.raises(ValueError):
+        PassageSampler([-1])
@@ -0,0 +1,28 @@
+from core.prefetcher import PassagePrefetcher
+from core.text_manager import TextManager
+
+
+def test_custom_texts_are_prefetched():
+    manager = TextManager()
+    manager.add_costum_text("Only custom passage.")
+    prefetcher = PassagePrefetcher(manager)
+    try:
+        assert prefetcher.take().text == "Only custom passage."
+    finally:
+        prefetcher.stop()
+
+
+def test_corpus_changes_drop_prepared_passages():
+    manager = TextManager()
+    manager.add_costum_text("Old passage.")
+    prefetcher = PassagePrefetcher(manager)
+    try:
+        prefetcher.request()
+        prefetcher.take()
+
+        manager.clear_custom_texts()
+        manager.add_costum_text("New passage.")
+
+        assert [prefetcher.take().text for _ in range(3)] == ["New passage."] * 3
+    finally:
+        prefetcher.stop()
@@ -0,0 +1,57 @@
+import json
+import tracemalloc
+
+from core.resource_monitor import ResourceMonitor, live_instance_counts, track_instance
+
+
+class Tracked:
+    pass
+
+
+def read_log(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_tracked_instances_are_counted_while_alive():
+    instance = Tracked()
+    track_instance(instance)
+    assert live_instance_counts()["Tracked"] >= 1
+
+    count = live_instance_counts()["Tracked"]
+    del instance
+    assert live_instance_counts()["Tracked"] == count - 1
+
+
+def test_only_requested_snapshots_list_allocators(tmp_path):
+    log = tmp_path / "monitor.log"
+    monitor = ResourceMonitor(str(log))
+    try:
+        monitor.mark_test_boundary()
+        monitor.snapshot()
+    finally:
+        monitor.close()
+        tracemalloc.stop()
+
+    boundary, requested = read_log(log)
+    assert "top_allocators" not in boundary
+    assert requested["top_allocators"]
+
+
+def test_steady_growth_is_flagged_with_allocators(tmp_path):
+    log = tmp_path / "monitor.log"
+    monitor = ResourceMonitor(str(log), growth_window=3)
+    leaked = []
+    try:
+        growing = []
+        for _ in range(3):
+            leaked.append(Tracked())
+            track_instance(leaked[-1])
+            growing = monitor.mark_test_boundary_in_background().result(timeout=10)
+    finally:
+        monitor.close()
+        tracemalloc.stop()
+
+    assert "live_objects" in growing
+    warning = read_log(log)[-1]
+    assert warning["label"] == "possible leak"
+    assert "top_allocators" in warning
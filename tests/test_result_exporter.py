@@ -0,0 +1,62 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+from core.result_exporter import ExportCancelled, ResultExporter, detect_format
+from core.results import GradeResult
+
+
+def sessions(count):
+    for index in range(count):
+        yield {"session": index, "wpm": 40 + index, "accuracy": 95}
+
+
+def test_format_is_detected_from_the_name():
+    assert detect_format("out.csv") == ("csv", False)
+    assert detect_format("OUT.JSONL.GZ") == ("jsonl", True)
+
+
+def test_csv_export_streams_in_chunks(tmp_path):
+    path = str(tmp_path / "results.csv")
+
+    rows = ResultExporter(chunk_bytes=64).export(sessions(100), path)
+
+    with open(path, newline="") as f:
+        written = list(csv.DictReader(f))
+    assert rows == len(written) == 100
+    assert written[99] == {"session": "99", "wpm": "139", "accuracy": "95"}
+
+
+def test_compressed_jsonl_accepts_records(tmp_path):
+    path = str(tmp_path / "results.jsonl.gz")
+
+    ResultExporter().export([GradeResult("Expert", "Excellent", "Professional")], path)
+
+    with gzip.open(path, "rt") as f:
+        assert [json.loads(line) for line in f] == [
+            {"speed_grade": "Expert", "accuracy_grade": "Excellent", "overall_performance": "Professional"}]
+
+
+def test_cancel_removes_the_partial_file(tmp_path):
+    path = tmp_path / "results.csv"
+    progress = []
+    exporter = ResultExporter(progress_interval=10,
+                              progress_callback=lambda rows: (progress.append(rows), exporter.cancel()))
+
+    with pytest.raises(ExportCancelled):
+        exporter.export(sessions(100), str(path))
+
+    assert progress == [10]
+    assert not path.exists()
+    assert not (tmp_path / "results.csv.part").exists()
+
+
+def test_background_export_reports_the_row_count(tmp_path):
+    results = []
+
+    ResultExporter().export_in_background(sessions(5), str(tmp_path / "out.jsonl"),
+                                          on_done=lambda rows, error: results.append((rows, error))).join(5)
+
+    assert results == [(5, None)]
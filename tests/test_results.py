@@ -0,0 +1,44 @@
+import pickle
+
+import pytest
+
+from core.results import AccuracyResult, GradeResult, ResultTable
+
+
+def test_records_take_positional_and_named_values():
+    record = AccuracyResult(95.0, 19, 20, 1, 5.0, 100.0)
+
+    assert record == AccuracyResult(accuracy=95.0, correct_chars=19, total_chars=20,
+                                    errors=1, error_rate=5.0, completion=100.0)
+    assert record.correct_chars == 19
+    with pytest.raises(TypeError):
+        AccuracyResult(95.0, 19)
+
+
+def test_records_are_immutable():
+    record = GradeResult("Expert", "Excellent", "Professional")
+
+    with pytest.raises(AttributeError):
+        record.speed_grade = "Novice"
+
+
+def test_records_behave_like_read_only_dicts():
+    record = GradeResult("Expert", "Excellent", "Professional")
+
+    assert record["accuracy_grade"] == "Excellent"
+    assert record.get("missing", 1) == 1
+    assert dict(record.items()) == record.to_dict() == record
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_table_stores_columns_and_rebuilds_rows():
+    table = ResultTable()
+    rows = [AccuracyResult(90.0 + i, i, 10, 10 - i, 10.0 * (10 - i), 100.0) for i in range(3)]
+    for row in rows:
+        table.append(row)
+
+    assert len(table) == 3
+    assert table.column("correct_chars").typecode == 'q'
+    assert list(table.column("accuracy")) == [90.0, 91.0, 92.0]
+    assert list(table) == rows
+    assert table[-1] == rows[-1]
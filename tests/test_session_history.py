@@ -0,0 +1,90 @@
+import random
+import time
+
+import pytest
+
+from core.session_history import DAY_SECONDS, SessionHistory, lttb
+
+START = 1_700_000_000.0
+
+
+def sessions(count, spacing):
+    return [{"timestamp": START + i * spacing, "wpm": 40 + i % 20, "accuracy": 90 + i % 10}
+            for i in range(count)]
+
+
+def test_lttb_keeps_end_points_and_peaks():
+    xs = list(range(1000))
+    ys = [0.0] * 1000
+    ys[500] = 100.0
+
+    sampled_x, sampled_y = lttb(xs, ys, 50)
+
+    assert len(sampled_x) == 50
+    assert (sampled_x[0], sampled_x[-1]) == (0, 999)
+    assert 100.0 in sampled_y
+
+
+def test_unordered_sessions_are_sorted():
+    records = sessions(2000, 600)
+    random.Random(3).shuffle(records)
+
+    history = SessionHistory(records)
+
+    assert list(history.timestamps) == sorted(history.timestamps)
+    assert history.time_range() == (START, START + 1999 * 600)
+    history.add({"timestamp": START - 1, "wpm": 10, "accuracy": 50})
+    assert history.timestamps[0] == START - 1 and history.values["wpm"][0] == 10
+
+
+def test_small_ranges_use_sessions():
+    history = SessionHistory(sessions(100, 3600))
+
+    (xs, ys), resolution = history.get_series("wpm", max_points=500)
+
+    assert resolution == "session" and len(xs) == 100
+
+
+def test_wide_ranges_use_rollups():
+    history = SessionHistory(sessions(20000, 3 * 3600))
+
+    (xs, _), resolution = history.get_series("wpm", max_points=100)
+    assert resolution == "week" and len(xs) <= 100
+
+    (xs, _), resolution = history.get_series("accuracy", START, START + 300 * DAY_SECONDS, max_points=100)
+    assert resolution == "day" and len(xs) == 100
+
+
+def test_narrow_zoom_over_dense_days_uses_sessions():
+    history = SessionHistory(sessions(5000, 60))
+
+    (xs, _), resolution = history.get_series("wpm", START, START + 3 * DAY_SECONDS, max_points=500)
+
+    assert resolution == "session" and len(xs) == 500
+
+
+def test_unknown_metric():
+    with pytest.raises(ValueError):
+        SessionHistory().get_series("errors")
+
+
+@pytest.fixture
+def tokyo_time(monkeypatch):
+    monkeypatch.setenv("TZ", "JST-9")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_days_follow_local_time(tokyo_time):
+    # 00:30 and 23:30 on the same local day, on two different UTC days
+    midnight = time.mktime((2024, 3, 10, 0, 0, 0, 0, 0, -1))
+    history = SessionHistory([{"timestamp": midnight + 1800, "wpm": 40, "accuracy": 90},
+                              {"timestamp": midnight + 23.5 * 3600, "wpm": 60, "accuracy": 100}])
+    days = history.rollups[0]
+
+    assert list(days.counts) == [2]
+    (xs, ys) = days.series("wpm", *history.time_range())
+    assert time.localtime(xs[0])[:4] == (2024, 3, 10, 12)
+    assert list(ys) == [50.0]
@@ -0,0 +1,62 @@
+import pytest
+
+from core.shared_corpus import OverlayTextList, SharedCorpus
+from core.text_manager import TextManager
+
+
+@pytest.fixture
+def published():
+    source = TextManager()
+    source.add_costum_texts(["Shared custom one.", "Shared custom two."])
+    corpus = SharedCorpus.from_text_manager(source, name=None)
+    try:
+        yield source, corpus
+    finally:
+        corpus.close()
+
+
+def test_attached_texts_match_the_publisher(published):
+    source, corpus = published
+    attached = SharedCorpus.attach(corpus.name)
+    try:
+        assert {level: list(texts) for level, texts in attached.default_texts().items()} == source.default_texts
+        assert list(attached.custom_texts()) == source.costum_texts
+        assert attached.custom_texts()[-1] == "Shared custom two."
+    finally:
+        attached.close()
+
+
+def test_shared_lookup_uses_the_hash_index(published):
+    _, corpus = published
+    texts = corpus.custom_texts()
+
+    assert "Shared custom two." in texts
+    assert "Shared custom three." not in texts
+    assert 42 not in texts
+
+
+def test_overlay_adds_local_texts_after_the_shared_ones(published):
+    _, corpus = published
+    overlay = OverlayTextList(corpus.custom_texts())
+    overlay.append("Local text.")
+
+    assert len(overlay) == 3
+    assert overlay[2] == overlay[-1] == "Local text."
+    assert overlay[1:] == ["Shared custom two.", "Local text."]
+    assert "Local text." in overlay and "Shared custom one." in overlay
+    with pytest.raises(IndexError):
+        overlay[3]
+
+
+def test_attached_manager_keeps_additions_local(published):
+    source, corpus = published
+    manager = TextManager()
+    manager.attach_shared_corpus(corpus.name)
+
+    assert not manager.add_costum_text("Shared custom one.")
+    assert manager.add_costum_text("Only in this process.")
+
+    assert isinstance(manager.costum_texts, OverlayTextList)
+    assert manager.costum_texts.local == ["Only in this process."]
+    assert manager.count_texts() == source.count_texts() + 1
+    assert manager.search_texts("process") == ["Only in this process."]
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from core.text_compare import IncrementalNormalizer, count_matches, normalize_text
+
+
+def test_typographic_punctuation_is_folded():
+    assert normalize_text("\u201cIt\u2019s\u201d \u2014 ok\u00a0now") == "\"It's\" - ok now"
+    assert normalize_text("cafe\u0301") == "caf\u00e9"
+    with pytest.raises(TypeError):
+        normalize_text(None)
+
+
+def test_matches_are_counted_over_the_common_length():
+    assert count_matches("hello", "hxllo world") == 4
+    assert count_matches("na\u00efve", "naive") == 4
+    assert count_matches("", "abc") == 0
+
+
+def test_normalized_input_is_returned_without_copying():
+    normalizer = IncrementalNormalizer()
+    typed = "already normalized caf\u00e9"
+
+    assert normalizer.update(typed) is typed
+
+
+def test_combining_marks_compose_with_the_previous_letter():
+    normalizer = IncrementalNormalizer()
+
+    assert normalizer.update("cafe") == "cafe"
+    assert normalizer.update("cafe\u0301") == "caf\u00e9"
+    assert normalizer.update("cafe\u0301s") == "caf\u00e9s"
+
+
+def test_hangul_jamo_compose_across_updates():
+    normalizer = IncrementalNormalizer()
+
+    assert normalizer.update("\u1100") == "\u1100"
+    assert normalizer.update("\u1100\u1161") == "\uac00"
+    assert normalizer.update("\u1100\u1161\u11a8") == "\uac01"
+    assert normalizer.update("\u1100\u1161") == "\uac00"
+
+
+def test_updates_match_full_normalization():
+    alphabet = ["a", "e", " ", "\u0301", "\u0323", "\u0302", "\u00c5", "\u2019",
+                "\u1100", "\u1161", "\u11a8", "\uac00", "\u0b47", "\u0b3e", "\u2126"]
+    rng = random.Random(5)
+    for _ in range(300):
+        normalizer = IncrementalNormalizer()
+        raw = ""
+        for _ in range(30):
+            if raw and rng.random() < 0.25:
+                raw = raw[:-rng.randint(1, min(3, len(raw)))]
+            else:
+                raw += rng.choice(alphabet)
+            assert normalizer.update(raw) == normalize_text(raw)
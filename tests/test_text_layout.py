@@ -0,0 +1,25 @@
+from core.text_layout import line_of_offset, wrap_lines
+
+
+def lines(text, width):
+    starts = list(wrap_lines(text, width)) + [len(text)]
+    return [text[start:end] for start, end in zip(starts, starts[1:])]
+
+
+def test_lines_break_after_whitespace():
+    assert lines("the quick brown fox", 10) == ["the quick ", "brown fox"]
+
+
+def test_long_words_are_split():
+    assert lines("abcdefghij klm", 4) == ["abcd", "efgh", "ij ", "klm"]
+
+
+def test_newlines_start_a_new_line():
+    assert lines("one\ntwo three", 20) == ["one\n", "two three"]
+
+
+def test_line_of_offset_uses_the_line_starts():
+    line_starts = wrap_lines("the quick brown fox", 10)
+
+    assert [line_of_offset(line_starts, offset) for offset in (0, 9, 10, 18)] == [0, 0, 1, 1]
+
@@ -0,0 +1,135 @@
+from core import text_manager
+from core.text_manager import TextManager, text_statistics
+
+
+def test_abbreviations_do_not_end_sentences():
+    manager = TextManager()
+    content = "Dr. Smith met Mr. Jones on Main St. today. They talked e.g. about trains."
+
+    sentences = list(manager._iter_sentences(content))
+
+    assert sentences == ["Dr. Smith met Mr. Jones on Main St. today.",
+                         "They talked e.g. about trains."]
+
+
+def test_streamed_sentences_match_a_single_block():
+    manager = TextManager()
+    content = "One fine day. Prof. Plum arrived! Was it Sept. or Oct.? Nobody knew. " * 50
+
+    expected = list(manager._iter_sentences(content))
+    for size in (1, 7, 64):
+        chunks = [content[i:i + size] for i in range(0, len(content), size)]
+        assert list(manager._iter_sentences_from_chunks(chunks)) == expected
+
+
+def _manager_with_custom_texts(count):
+    manager = TextManager()
+    manager.add_costum_texts(f"Custom passage number {i} is short." for i in range(count))
+    return manager
+
+
+def test_filtered_page_analyzes_one_batch_at_most(monkeypatch):
+    monkeypatch.setattr(text_manager, "DIFFICULTY_INDEX_BATCH", 10)
+    manager = _manager_with_custom_texts(50)
+    difficulty = text_statistics(manager.costum_texts[0])["estimated_difficulty"]
+    default_count = len(manager.default_texts.get(difficulty, []))
+
+    page = manager.get_texts_page(default_count, 5, difficulty)
+
+    assert page == manager.costum_texts[:5]
+    assert manager.get_difficulty_index_progress() == (5, 50)
+    manager.get_texts_page(default_count + 40, 5, difficulty)
+    assert manager.get_difficulty_index_progress() == (15, 50)
+    assert manager.count_texts(difficulty) == default_count + 15
+
+
+def test_background_index_completes_the_filtered_count():
+    manager = _manager_with_custom_texts(30)
+    difficulty = text_statistics(manager.costum_texts[0])["estimated_difficulty"]
+
+    assert manager.index_difficulties_in_background()
+    manager._difficulty_thread.join(timeout=30)
+
+    assert manager.get_difficulty_index_progress() == (30, 30)
+    assert not manager.index_difficulties_in_background()
+    assert manager.count_texts(difficulty) == len(manager.default_texts.get(difficulty, [])) + 30
+
+
+def test_clearing_custom_texts_resets_the_difficulty_index():
+    manager = _manager_with_custom_texts(5)
+    manager.index_difficulties_in_background()
+    manager._difficulty_thread.join(timeout=30)
+
+    manager.clear_custom_texts()
+
+    assert manager.get_difficulty_index_progress() == (0, 0)
+
+
+def test_cleared_texts_are_not_found_by_search():
+    manager = TextManager()
+    manager.add_costum_text("Quartz watches keep accurate time.")
+    assert manager.search_texts("quartz") == ["Quartz watches keep accurate time."]
+
+    manager.clear_custom_texts()
+    manager.add_costum_text("Completely unrelated passage.")
+
+    assert manager.search_texts("quartz") == []
+    assert manager.search_texts("unrelated") == ["Completely unrelated passage."]
+
+
+def test_search_applies_the_difficulty_filter():
+    manager = TextManager()
+
+    assert manager.search_texts("quick", difficulty="easy") == ["A quick brown fox jumps."]
+    medium = manager.search_texts("quick", difficulty="medium")
+    assert medium and all(text in manager.default_texts["medium"] for text in medium)
+
+
+def test_saved_search_index_keeps_custom_texts(tmp_path):
+    index_path = str(tmp_path / "search.idx")
+    manager = TextManager()
+    manager.enable_search_index(index_path)
+    manager.add_costum_text("Zephyrs blow over the meadow.")
+    assert manager.save_search_index()
+
+    restarted = TextManager()
+    restarted.add_costum_text("Zephyrs blow over the meadow.")
+    restarted.enable_search_index(index_path)
+    assert len(restarted.search_index) == restarted._default_text_count() + 1
+    assert restarted.search_texts("zephyrs") == ["Zephyrs blow over the meadow."]
+
+    # Different custom texts: only the default postings are reused
+    other = TextManager()
+    other.add_costum_text("Gentle breezes blow.")
+    other.enable_search_index(index_path)
+    assert other.search_texts("zephyrs") == []
+    assert other.search_texts("breezes") == ["Gentle breezes blow."]
+    assert other.search_texts("zebras") == ["How vexingly quick daft zebras jump!"]
+
+
+def test_corpus_listeners_are_notified_once_per_change():
+    manager = TextManager()
+    changes = []
+    manager.add_corpus_listener(lambda: changes.append(manager.count_texts()))
+
+    manager.add_costum_texts(["First text.", "Second text."])
+    manager.add_costum_text("Third text.")
+    manager.clear_custom_texts()
+
+    assert changes == [manager._default_text_count() + 2, manager._default_text_count() + 3,
+                       manager._default_text_count()]
+
+
+def test_clear_drops_the_custom_sampler():
+    manager = TextManager()
+    manager.set_text_sampling(weight=lambda text: 1000.0 if "Heavy" in text else 0.001,
+                              repeat_window=0, seed=1)
+    manager.add_costum_texts(["Heavy one.", "Light two."])
+    manager.choose_text()
+
+    # Same pool size: a stale sampler would keep favouring the first position
+    manager.clear_custom_texts()
+    manager.add_costum_texts(["Light three.", "Heavy four."])
+    picks = [manager.choose_text() for _ in range(200)]
+
+    assert picks.count("Heavy four.") > 190
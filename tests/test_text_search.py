@@ -0,0 +1,89 @@
+from core.text_search import TextSearchIndex
+
+PASSAGES = [
+    "The quick brown fox jumps over the lazy dog.",
+    "Quick thinking saves time.",
+    "Slow and steady wins the race.",
+    "Brown bread and brown rice.",
+]
+
+
+def build_index(documents=None):
+    index = TextSearchIndex(documents)
+    for passage in PASSAGES:
+        index.add_document(passage)
+    return index
+
+
+def found(index, query, **kwargs):
+    return [index.get_document(document_id) for document_id, _ in index.search(query, **kwargs)]
+
+
+def test_search_requires_every_word():
+    index = build_index()
+
+    assert found(index, "quick brown") == [PASSAGES[0]]
+    assert found(index, "steady race") == [PASSAGES[2]]
+    assert found(index, "quick race") == []
+
+
+def test_last_word_is_a_prefix():
+    index = build_index()
+
+    assert set(found(index, "qui")) == {PASSAGES[0], PASSAGES[1]}
+    assert found(index, "qui", prefix=False) == []
+
+
+def test_more_frequent_terms_rank_first():
+    index = build_index()
+
+    assert found(index, "brown")[0] == PASSAGES[3]
+
+
+def test_document_filter_is_applied_before_the_limit():
+    index = build_index()
+
+    results = found(index, "brown", limit=1, document_filter=lambda document_id: document_id == 0)
+
+    assert results == [PASSAGES[0]]
+
+
+def test_reference_index_stores_no_copies():
+    index = build_index(PASSAGES)
+
+    assert len(index) == len(PASSAGES)
+    assert index.get_document(2) is PASSAGES[2]
+    assert PASSAGES[1] in index
+
+
+def test_saved_index_is_reused_for_the_same_passages(tmp_path):
+    path = str(tmp_path / "search.idx")
+    assert build_index(PASSAGES).save(path, count=2)
+
+    loaded = TextSearchIndex.load(path, PASSAGES)
+
+    assert len(loaded) == 2
+    assert found(loaded, "brown") == [PASSAGES[0]]
+    assert TextSearchIndex.load(path, list(reversed(PASSAGES))) is None
+
+
+def test_saved_postings_are_reused_for_the_unchanged_prefix(tmp_path):
+    path = str(tmp_path / "search.idx")
+    assert build_index(PASSAGES).save(path, prefixes=[2])
+
+    assert len(TextSearchIndex.load(path, PASSAGES)) == len(PASSAGES)
+    changed = PASSAGES[:2] + ["Brown leaves fall.", "Another passage."]
+    loaded = TextSearchIndex.load(path, changed)
+
+    assert len(loaded) == 2
+    assert found(loaded, "brown") == [PASSAGES[0]]
+
+
+def test_results_are_limited_to_the_best_scores():
+    index = TextSearchIndex()
+    for repeat in range(1, 30):
+        index.add_document(" ".join(["word"] * repeat + ["filler"] * (30 - repeat)))
+
+    results = index.search("word", limit=3)
+
+    assert [document_id for document_id, _ in results] == [28, 27, 26]
@@ -0,0 +1,45 @@
+import bz2
+import codecs
+import gzip
+import os
+
+from core.text_sources import (FALLBACK_ENCODING, detect_encoding, is_text_source, iter_source_files,
+                               iter_text_chunks)
+
+
+def test_text_sources_are_recognized_through_compression_suffixes():
+    assert is_text_source("book.TXT")
+    assert is_text_source("notes.md.gz")
+    assert not is_text_source("image.png.gz")
+
+
+def test_directories_are_walked_in_name_order(tmp_path):
+    (tmp_path / "b").mkdir()
+    for name in ("b/2.txt", "a.txt.bz2", "c.txt", "skip.bin"):
+        (tmp_path / name).write_bytes(b"x")
+
+    files = [os.path.relpath(path, tmp_path) for path in iter_source_files(str(tmp_path))]
+
+    assert files == ["a.txt.bz2", "c.txt", os.path.join("b", "2.txt")]
+
+
+def test_encoding_detection():
+    assert detect_encoding(codecs.BOM_UTF8 + b"abc") == "utf-8-sig"
+    assert detect_encoding("café".encode("utf-8")[:-1]) == "utf-8"
+    assert detect_encoding("café au lait".encode("cp1252")) == FALLBACK_ENCODING
+
+
+def test_chunks_decode_characters_split_across_reads(tmp_path):
+    text = "naïve café — résumé " * 20
+    path = tmp_path / "text.txt.gz"
+    with gzip.open(path, "wb") as f:
+        f.write(text.encode("utf-8"))
+
+    assert "".join(iter_text_chunks(str(path), chunk_size=7)) == text
+
+
+def test_bzip2_source_is_decompressed(tmp_path):
+    path = tmp_path / "text.txt.bz2"
+    path.write_bytes(bz2.compress(b"plain words"))
+
+    assert list(iter_text_chunks(str(path))) == ["plain words"]
@@ -0,0 +1,32 @@
+import time
+
+from core.timer import Timer
+
+
+def test_restarts_reuse_the_update_thread():
+    updates = []
+    timer = Timer(callback=updates.append)
+    try:
+        timer.start_timer()
+        thread = timer._timer_thread
+        for _ in range(3):
+            timer.reset()
+            timer.start_timer()
+            assert timer._timer_thread is thread
+        time.sleep(0.25)
+        assert updates
+    finally:
+        timer.close()
+
+    assert not thread.is_alive()
+
+
+def test_reset_clears_elapsed_and_pause():
+    timer = Timer()
+    timer.start_timer()
+    timer.pause()
+
+    timer.reset()
+
+    assert timer.get_elapsed_time() == 0.0
+    assert not timer.is_running and not timer.is_paused
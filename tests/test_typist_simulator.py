@@ -0,0 +1,53 @@
+from core.typist_simulator import (BACKSPACE, SyntheticTypist, TypistProfile, char_for_keysym,
+                                   find_degradation, keysym_for_char, replay_core)
+
+TEXT = "The quick brown fox jumps over the lazy dog. " * 4
+
+
+def typed_text(events):
+    typed = []
+    for _, key in events:
+        if key == BACKSPACE:
+            typed.pop()
+        else:
+            typed.append(key)
+    return "".join(typed)
+
+
+def test_keysyms_round_trip():
+    for char in "a Z.,?!'\"\\":
+        assert char_for_keysym(keysym_for_char(char)) == char
+
+
+def test_noticed_typos_are_corrected():
+    profile = TypistProfile(error_rate=0.2, correction_rate=1.0, pause_rate=0.0)
+    events = list(SyntheticTypist(profile, seed=3).generate(TEXT, wpm=80))
+
+    assert any(key == BACKSPACE for _, key in events)
+    assert typed_text(events) == TEXT
+    times = [timestamp for timestamp, _ in events]
+    assert times == sorted(times)
+
+
+def test_streams_are_reproducible_and_match_the_speed():
+    profile = TypistProfile(error_rate=0.0, pause_rate=0.0, jitter=0.1)
+    first = list(SyntheticTypist(profile, seed=7).generate(TEXT * 5, wpm=60))
+
+    assert first == list(SyntheticTypist(profile, seed=7).generate(TEXT * 5, wpm=60))
+    wpm = len(TEXT * 5) / 5 / (first[-1][0] / 60)
+    assert 54 < wpm < 66
+
+
+def test_replay_scores_a_perfect_session():
+    profile = TypistProfile(error_rate=0.0, pause_rate=0.0)
+    result = replay_core(TEXT, SyntheticTypist(profile, seed=1).generate(TEXT, wpm=50))
+
+    assert result["accuracy"] == 100
+    assert result["latency"]["events"] == len(TEXT)
+
+
+def test_degradation_is_the_first_row_over_budget():
+    rows = [{"p95_ms": 2.0}, {"p95_ms": 20.0}, {"p95_ms": 30.0}]
+
+    assert find_degradation(rows, budget_ms=16) == rows[1]
+    assert find_degradation(rows, budget_ms=50) is None
@@ -0,0 +1,63 @@
+from core.text_layout import WordIndex
+from core.word_stats import WordTracker
+
+TEXT = "The cat saw the dog."
+
+
+def type_text(tracker, typed, start=0.0, interval=0.2):
+    timestamp = start
+    for position, char in enumerate(typed):
+        timestamp += interval
+        tracker.record_keystroke(position, char, timestamp)
+    return timestamp
+
+
+def test_word_index_maps_offsets_to_words():
+    index = WordIndex("hello  big world")
+
+    assert len(index) == 3
+    assert [index.word(i) for i in range(3)] == ["hello", "big", "world"]
+    assert index.word_at(0) == 0
+    assert index.word_at(5) == -1
+    assert index.word_at(8) == 1
+    assert index.word_at(100) == -1
+    assert index.word_length(2) == 5
+
+
+def test_keystrokes_are_attributed_to_words():
+    tracker = WordTracker(WordIndex(TEXT))
+    type_text(tracker, "The cut")
+    tracker.record_backspace(5, 2.0)
+
+    results = tracker.get_word_results()
+
+    assert [(result.word, result.errors, result.corrections, result.keystrokes) for result in results] == [
+        ("The", 0, 0, 3), ("cat", 1, 1, 3)]
+
+
+def test_word_speed_starts_at_the_previous_keystroke():
+    tracker = WordTracker(WordIndex(TEXT))
+    type_text(tracker, "The cat")
+
+    # "cat" timed from the space before it: 3 characters in 0.6 seconds
+    assert tracker.get_word_wpm(1) == 60.0
+    assert tracker.get_word_wpm(2) == 0.0
+
+
+def test_most_missed_words_combine_occurrences():
+    tracker = WordTracker(WordIndex(TEXT))
+    type_text(tracker, "Tje cat saw tge dox.")
+
+    assert tracker.get_most_missed_words() == [("the", 2), ("dog", 1)]
+
+
+def test_reset_reuses_the_arrays():
+    tracker = WordTracker(WordIndex(TEXT))
+    errors = tracker.errors
+    type_text(tracker, "xxx")
+
+    tracker.reset(WordIndex("one two"))
+
+    assert tracker.errors is errors
+    assert list(tracker.errors) == [0, 0]
+    assert tracker.get_word_results() == []